@@ -82,13 +82,36 @@ def load_deck(path):
 
 
 def load_all_decks(level_filter=None):
-    """Load all flashcard decks, optionally filtered by level."""
+    """Load all flashcard decks, optionally filtered by level.
+
+    Uses the compiled deck cache from tools/deck_cache.py when available,
+    so start-up is one cache read instead of one JSON parse per deck.
+    """
+    def matches(level_str):
+        return level_str == str(level_filter) or level_str == f"0{level_filter}"
+
+    try:
+        _tools_dir = str(SCRIPT_DIR.parent.parent / "tools")
+        if _tools_dir not in sys.path:
+            sys.path.insert(0, _tools_dir)
+        from deck_cache import load_compiled_decks
+        compiled = load_compiled_decks(SCRIPT_DIR)
+    except ImportError:
+        compiled = None
+
+    if compiled is not None:
+        return [
+            compiled["decks"][stem]
+            for level_str, stem in sorted(compiled["levels"].items(), key=lambda item: item[1])
+            if level_filter is None or matches(level_str)
+        ]
+
     decks = []
     for path in sorted(SCRIPT_DIR.glob("level-*-cards.json")):
         if level_filter is not None:
             # Extract level from filename: level-00-cards.json -> "00"
             level_str = path.stem.replace("level-", "").replace("-cards", "")
-            if level_str != str(level_filter) and level_str != f"0{level_filter}":
+            if not matches(level_str):
                 continue
         decks.append(load_deck(path))
     return decks
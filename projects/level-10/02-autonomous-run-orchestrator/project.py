@@ -9,11 +9,24 @@ Design rationale: Production pipelines (ETL, CI/CD, ML training) involve steps t
 depend on each other. A topological scheduler prevents running a step before its
 inputs are ready, while retry logic handles transient failures without restarting
 the entire pipeline.
+
+Independent steps can run concurrently: the orchestrator submits each step to a
+thread (or process) pool the moment its last dependency finishes and a worker
+is free, enforces per-step timeouts, and reports the critical path. With the
+default max_workers=1 the same scheduler runs steps one at a time.
 """
 from __future__ import annotations
 
 import time
 from collections import defaultdict, deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Callable, Protocol
@@ -105,6 +118,50 @@ def topological_sort(steps: list[WorkflowStep]) -> list[str]:
     return order
 
 
+def ready_sets(steps: list[WorkflowStep]) -> list[list[str]]:
+    """Group steps into levels: every step's dependencies sit in earlier levels.
+
+    Steps within one level are independent of each other and may run
+    concurrently. Level order follows topological_sort().
+    """
+    level: dict[str, int] = {}
+    by_name = {s.name: s for s in steps}
+    for name in topological_sort(steps):
+        level[name] = 1 + max((level[d] for d in by_name[name].depends_on), default=-1)
+    groups: list[list[str]] = [[] for _ in range(max(level.values(), default=-1) + 1)]
+    for name, lvl in level.items():
+        groups[lvl].append(name)
+    return groups
+
+
+def critical_path(steps: list[WorkflowStep], results: list[StepResult]) -> tuple[list[str], int]:
+    """Return the chain of dependent steps with the largest total duration.
+
+    WHY this matters -- With enough workers, a parallel run can never finish
+    faster than its critical path, so that chain is where optimisation pays.
+    """
+    durations = {r.step_name: r.duration_ms for r in results}
+    by_name = {s.name: s for s in steps}
+    # Score each chain by (total duration, step count) so that when timings
+    # tie (fast steps round to 0ms) the longest chain still wins.
+    score: dict[str, tuple[int, int]] = {}
+    via: dict[str, str | None] = {}
+    for name in topological_sort(steps):
+        best = max(by_name[name].depends_on, key=lambda d: score[d], default=None)
+        ms, count = score[best] if best else (0, 0)
+        score[name] = (ms + durations.get(name, 0), count + 1)
+        via[name] = best
+    if not score:
+        return [], 0
+    end: str | None = max(score, key=lambda n: score[n])
+    length = score[end][0]
+    path: list[str] = []
+    while end is not None:
+        path.append(end)
+        end = via[end]
+    return path[::-1], length
+
+
 # ---------------------------------------------------------------------------
 # Orchestrator engine
 # ---------------------------------------------------------------------------
@@ -114,6 +171,8 @@ class RunReport:
     """Aggregate result of a full orchestration run."""
     results: list[StepResult] = field(default_factory=list)
     total_duration_ms: int = 0
+    critical_path: list[str] = field(default_factory=list)
+    critical_path_ms: int = 0
 
     @property
     def succeeded(self) -> list[StepResult]:
@@ -133,49 +192,151 @@ class RunReport:
             "succeeded": len(self.succeeded),
             "failed": len(self.failed),
             "total_duration_ms": self.total_duration_ms,
+            "critical_path_ms": self.critical_path_ms,
         }
 
 
 class Orchestrator:
-    """Resolves dependencies and executes steps in topological order."""
-
-    def __init__(self, steps: list[WorkflowStep], fail_fast: bool = True) -> None:
+    """Resolves dependencies and executes steps in topological order.
+
+    Every step runs on a pool of max_workers workers and is submitted as
+    soon as all of its dependencies have succeeded and a worker is free, so
+    with max_workers=1 (the default) steps run one at a time in dependency
+    order. A step that runs past its timeout_ms is marked FAILED, but it is
+    not killed: the attempt keeps its worker until it returns, and its
+    result is ignored. Use use_processes=True for CPU-bound steps; their
+    actions must then be picklable (no lambdas).
+    """
+
+    def __init__(self, steps: list[WorkflowStep], fail_fast: bool = True,
+                 max_workers: int = 1, use_processes: bool = False) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
         self._steps = {s.name: s for s in steps}
         self._fail_fast = fail_fast
+        self._max_workers = max_workers
+        self._use_processes = use_processes
         self._execution_order = topological_sort(steps)
 
     @property
     def execution_order(self) -> list[str]:
         return list(self._execution_order)
 
+    @property
+    def ready_sets(self) -> list[list[str]]:
+        return ready_sets(list(self._steps.values()))
+
     def run(self) -> RunReport:
         """Execute all steps respecting dependency order and retry policy."""
-        report = RunReport()
-        failed_names: set[str] = set()
-        overall_start = time.monotonic()
+        report = self._run_pooled()
+        report.critical_path, report.critical_path_ms = critical_path(
+            list(self._steps.values()), report.results
+        )
+        return report
 
+    # WHY schedule on completion instead of level by level? -- Waiting for a
+    # whole ready set to finish lets one slow step idle every worker. Tracking
+    # how many unfinished dependencies each step has means a step starts the
+    # moment its own inputs exist, whatever else is still running.
+    def _run_pooled(self) -> RunReport:
+        results: dict[str, StepResult] = {}
+        failed_names: set[str] = set()
+        dependents: dict[str, list[str]] = defaultdict(list)
+        waiting_on: dict[str, int] = {}
         for name in self._execution_order:
             step = self._steps[name]
+            waiting_on[name] = len(step.depends_on)
+            for dep in step.depends_on:
+                dependents[dep].append(name)
+
+        ready: deque[str] = deque(n for n in self._execution_order if waiting_on[n] == 0)
+        running: dict[Future[StepResult], tuple[str, float]] = {}
+        # Timed-out attempts that are still occupying a worker.
+        abandoned: set[Future[StepResult]] = set()
+        stopped = False
+        overall_start = time.monotonic()
 
-            # Skip if any dependency failed.
-            upstream_failed = any(d in failed_names for d in step.depends_on)
-            if upstream_failed:
-                report.results.append(StepResult(name, StepStatus.SKIPPED))
-                failed_names.add(name)
-                continue
-
-            result = self._execute_with_retry(step)
-            report.results.append(result)
-
-            if result.status == StepStatus.FAILED:
+        def finish(name: str, result: StepResult) -> None:
+            nonlocal stopped
+            results[name] = result
+            if result.status != StepStatus.SUCCESS:
                 failed_names.add(name)
-                if self._fail_fast:
-                    # Mark remaining steps as skipped.
-                    remaining = self._execution_order[self._execution_order.index(name) + 1 :]
-                    for r_name in remaining:
-                        report.results.append(StepResult(r_name, StepStatus.SKIPPED))
-                    break
+                if result.status == StepStatus.FAILED and self._fail_fast:
+                    stopped = True
+            for child in dependents[name]:
+                waiting_on[child] -= 1
+                if waiting_on[child] == 0:
+                    ready.append(child)
+
+        pool: Executor = (ProcessPoolExecutor if self._use_processes else ThreadPoolExecutor)(
+            max_workers=self._max_workers
+        )
+        try:
+            while (ready and not stopped) or running:
+                # WHY cap submissions at max_workers? -- A step's timeout
+                # clock starts when it is submitted. Submitting only when a
+                # worker is free means that is also when it starts running,
+                # so queued steps cannot time out before they ever execute.
+                while ready and not stopped:
+                    step = self._steps[ready[0]]
+                    name = step.name
+                    if any(d in failed_names for d in step.depends_on):
+                        # Skipping needs no worker, so never wait for one.
+                        ready.popleft()
+                        finish(name, StepResult(name, StepStatus.SKIPPED))
+                        continue
+                    if len(running) + len(abandoned) >= self._max_workers:
+                        break
+                    ready.popleft()
+                    future = pool.submit(self._execute_with_retry, step)
+                    running[future] = (name, time.monotonic() + step.timeout_ms / 1000)
+                if not running:
+                    if not (ready and not stopped):
+                        break
+                    # Every worker is stuck on a timed-out attempt. Give the
+                    # next step its own timeout to get a worker, then fail it.
+                    step = self._steps[ready[0]]
+                    done, _ = wait(abandoned, timeout=step.timeout_ms / 1000,
+                                   return_when=FIRST_COMPLETED)
+                    if done:
+                        abandoned -= done
+                    else:
+                        ready.popleft()
+                        finish(step.name, StepResult(
+                            step.name, StepStatus.FAILED, 0, step.timeout_ms,
+                            error=f"no free worker within {step.timeout_ms}ms"))
+                    continue
+
+                next_deadline = min(deadline for _, deadline in running.values())
+                done, _ = wait([*running, *abandoned],
+                               timeout=max(0.0, next_deadline - time.monotonic()),
+                               return_when=FIRST_COMPLETED)
+                abandoned -= done
+                now = time.monotonic()
+                for future, (name, deadline) in list(running.items()):
+                    if future in done:
+                        try:
+                            result = future.result()
+                        except Exception as exc:  # e.g. unpicklable action, broken pool
+                            result = StepResult(name, StepStatus.FAILED, 1, error=str(exc))
+                    elif now >= deadline:
+                        # Python cannot interrupt the worker; the attempt keeps
+                        # running in the background but its result is ignored.
+                        if not future.cancel():
+                            abandoned.add(future)
+                        timeout_ms = self._steps[name].timeout_ms
+                        result = StepResult(name, StepStatus.FAILED, 1, timeout_ms,
+                                            error=f"timed out after {timeout_ms}ms")
+                    else:
+                        continue
+                    del running[future]
+                    finish(name, result)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
 
+        report = RunReport()
+        for name in self._execution_order:
+            report.results.append(results.get(name) or StepResult(name, StepStatus.SKIPPED))
         report.total_duration_ms = int((time.monotonic() - overall_start) * 1000)
         return report
 
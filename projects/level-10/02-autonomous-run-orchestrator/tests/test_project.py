@@ -1,18 +1,25 @@
 """Tests for Autonomous Run Orchestrator.
 
 Covers DAG resolution, execution order, retry logic, fail-fast behavior,
-dependency skipping, and cycle detection.
+dependency skipping, cycle detection, parallel execution, timeouts, and
+critical-path reporting.
 """
 from __future__ import annotations
 
+import threading
+import time
+
 import pytest
 
 from project import (
     CyclicDependencyError,
     Orchestrator,
     RunReport,
+    StepResult,
     StepStatus,
     WorkflowStep,
+    critical_path,
+    ready_sets,
     topological_sort,
 )
 
@@ -122,3 +129,139 @@ class TestRunReport:
         assert "total_steps" in summary
         assert "succeeded" in summary
         assert "failed" in summary
+
+
+# ---------------------------------------------------------------------------
+# Parallel execution
+# ---------------------------------------------------------------------------
+
+def square_of_seven() -> str:
+    return str(7 * 7)
+
+
+class TestReadySets:
+    def test_diamond_levels(self, diamond_pipeline: list[WorkflowStep]) -> None:
+        assert ready_sets(diamond_pipeline) == [["a"], ["b", "c"], ["d"]]
+
+    def test_empty_workflow(self) -> None:
+        assert ready_sets([]) == []
+
+
+class TestParallelOrchestrator:
+    def test_independent_steps_run_concurrently(self) -> None:
+        barrier = threading.Barrier(3, timeout=5)
+
+        def meet() -> str:
+            barrier.wait()  # only passes if all three run at the same time
+            return "met"
+
+        steps = [WorkflowStep(f"s{i}", action=meet) for i in range(3)]
+        steps.append(WorkflowStep("join", action=lambda: "joined", depends_on=["s0", "s1", "s2"]))
+        report = Orchestrator(steps, max_workers=3).run()
+        assert report.all_passed
+        assert [r.step_name for r in report.results] == ["s0", "s1", "s2", "join"]
+
+    def test_dependencies_finish_first(self, diamond_pipeline: list[WorkflowStep]) -> None:
+        finished: list[str] = []
+        lock = threading.Lock()
+
+        def record(name: str):
+            def action() -> str:
+                with lock:
+                    finished.append(name)
+                return name
+            return action
+
+        steps = [WorkflowStep(s.name, record(s.name), s.depends_on) for s in diamond_pipeline]
+        report = Orchestrator(steps, max_workers=4).run()
+        assert report.all_passed
+        assert finished[0] == "a" and finished[-1] == "d"
+
+    def test_failure_skips_only_downstream(self, diamond_pipeline: list[WorkflowStep]) -> None:
+        def fail() -> str:
+            raise RuntimeError("fail")
+
+        diamond_pipeline[1] = WorkflowStep("b", action=fail, depends_on=["a"])
+        report = Orchestrator(diamond_pipeline, fail_fast=False, max_workers=2).run()
+        status = {r.step_name: r.status for r in report.results}
+        assert status == {
+            "a": StepStatus.SUCCESS,
+            "b": StepStatus.FAILED,
+            "c": StepStatus.SUCCESS,
+            "d": StepStatus.SKIPPED,
+        }
+
+    def test_fail_fast_stops_scheduling(self) -> None:
+        def fail() -> str:
+            raise RuntimeError("fail")
+
+        steps = [
+            WorkflowStep("a", action=fail),
+            WorkflowStep("b", action=lambda: "b", depends_on=["a"]),
+            WorkflowStep("c", action=lambda: "c", depends_on=["b"]),
+        ]
+        report = Orchestrator(steps, max_workers=2).run()
+        assert [r.status for r in report.results] == [
+            StepStatus.FAILED, StepStatus.SKIPPED, StepStatus.SKIPPED,
+        ]
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_step_timeout(self, max_workers: int) -> None:
+        release = threading.Event()
+        steps = [
+            WorkflowStep("slow", action=lambda: str(release.wait(5)), timeout_ms=50),
+            WorkflowStep("after", action=lambda: "never", depends_on=["slow"]),
+        ]
+        start = time.monotonic()
+        report = Orchestrator(steps, fail_fast=False, max_workers=max_workers).run()
+        release.set()
+        assert time.monotonic() - start < 2
+        assert report.results[0].status == StepStatus.FAILED
+        assert "timed out" in report.results[0].error
+        assert report.results[1].status == StepStatus.SKIPPED
+
+    def test_queued_steps_do_not_time_out_before_running(self) -> None:
+        steps = [WorkflowStep(f"s{i}", action=lambda: str(time.sleep(0.1)), timeout_ms=250)
+                 for i in range(8)]
+        report = Orchestrator(steps, fail_fast=False, max_workers=2).run()
+        assert report.all_passed, [r.error for r in report.results]
+
+    def test_hung_worker_blocks_only_up_to_timeout(self) -> None:
+        release = threading.Event()
+        steps = [
+            WorkflowStep(f"hang{i}", action=lambda: str(release.wait(5)), timeout_ms=50)
+            for i in range(2)
+        ]
+        steps.append(WorkflowStep("next", action=lambda: "ran", timeout_ms=50))
+        start = time.monotonic()
+        report = Orchestrator(steps, fail_fast=False, max_workers=2).run()
+        release.set()
+        assert time.monotonic() - start < 2
+        assert ["timed out" in r.error for r in report.results[:2]] == [True, True]
+        assert "no free worker" in report.results[2].error
+
+    def test_process_pool(self) -> None:
+        steps = [WorkflowStep(f"p{i}", action=square_of_seven) for i in range(3)]
+        report = Orchestrator(steps, max_workers=2, use_processes=True).run()
+        assert report.all_passed
+        assert {r.output for r in report.results} == {"49"}
+
+    def test_rejects_zero_workers(self, linear_pipeline: list[WorkflowStep]) -> None:
+        with pytest.raises(ValueError):
+            Orchestrator(linear_pipeline, max_workers=0)
+
+
+class TestCriticalPath:
+    def test_longest_chain_by_duration(self, diamond_pipeline: list[WorkflowStep]) -> None:
+        results = [
+            StepResult("a", StepStatus.SUCCESS, duration_ms=10),
+            StepResult("b", StepStatus.SUCCESS, duration_ms=5),
+            StepResult("c", StepStatus.SUCCESS, duration_ms=40),
+            StepResult("d", StepStatus.SUCCESS, duration_ms=1),
+        ]
+        assert critical_path(diamond_pipeline, results) == (["a", "c", "d"], 51)
+
+    def test_report_includes_critical_path(self, linear_pipeline: list[WorkflowStep]) -> None:
+        report = Orchestrator(linear_pipeline, max_workers=2).run()
+        assert report.critical_path == ["a", "b", "c"]
+        assert "critical_path_ms" in report.summary()
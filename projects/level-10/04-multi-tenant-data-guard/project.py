@@ -9,12 +9,19 @@ Design rationale: In SaaS systems, tenant data leakage is a catastrophic failure
 By making tenant context mandatory at the data-access layer — not optional
 middleware — the system makes cross-tenant access structurally impossible rather
 than relying on developers remembering to filter.
+
+The raw store is partitioned by tenant, so a tenant-scoped read touches only
+that tenant's records: one noisy tenant with millions of rows does not slow
+list operations for anyone else. The audit trail is a bounded ring buffer,
+optionally mirrored to an append-only JSONL file for long-term retention.
 """
 from __future__ import annotations
 
 import json
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum, auto
+from pathlib import Path
 from typing import Any, TypeVar
 
 T = TypeVar("T")
@@ -86,14 +93,58 @@ class Record:
     data: dict[str, Any]
 
 
+# WHY partition by tenant? -- Every non-admin read is scoped to one tenant,
+# so storing records as tenant -> {id -> record} makes a tenant listing
+# O(own records) instead of O(all records). The flat id map is kept for
+# point lookups, which must find a record before its owner can be checked.
 class DataStore:
-    """Raw in-memory store — no access control. Should never be used directly."""
+    """Raw in-memory store — no access control. Should never be used directly.
+
+    indexed_fields names data keys to index per tenant, so find() on them is
+    a dictionary lookup. Indexes reflect record data at insert time;
+    re-insert a record after changing its data.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, indexed_fields: tuple[str, ...] = ()) -> None:
         self._records: dict[str, Record] = {}
+        self._partitions: dict[str, dict[str, Record]] = {}
+        # field -> tenant -> value -> {record_id: record} (dict keeps insert order)
+        self._indexes: dict[str, dict[str, dict[Any, dict[str, Record]]]] = {
+            name: {} for name in indexed_fields
+        }
+        self._index_keys: dict[str, dict[str, Any]] = {}
 
     def insert(self, record: Record) -> None:
+        if record.id in self._records:
+            self._unlink(self._records[record.id])
         self._records[record.id] = record
+        self._partitions.setdefault(record.tenant_id, {})[record.id] = record
+        if not self._indexes:
+            return
+        # Remember the indexed values so _unlink finds the right buckets even
+        # if record.data is mutated before the record is replaced or deleted.
+        keys = {name: record.data[name] for name in self._indexes if name in record.data}
+        self._index_keys[record.id] = keys
+        for name, value in keys.items():
+            if _hashable(value):
+                by_value = self._indexes[name].setdefault(record.tenant_id, {})
+                by_value.setdefault(value, {})[record.id] = record
+
+    def _unlink(self, record: Record) -> None:
+        partition = self._partitions[record.tenant_id]
+        del partition[record.id]
+        if not partition:
+            del self._partitions[record.tenant_id]
+        for name, value in self._index_keys.pop(record.id, {}).items():
+            if not _hashable(value):
+                continue
+            by_tenant = self._indexes[name]
+            by_value = by_tenant[record.tenant_id]
+            del by_value[value][record.id]
+            if not by_value[value]:
+                del by_value[value]
+                if not by_value:
+                    del by_tenant[record.tenant_id]
 
     def get(self, record_id: str) -> Record | None:
         return self._records.get(record_id)
@@ -101,14 +152,102 @@ class DataStore:
     def list_all(self) -> list[Record]:
         return list(self._records.values())
 
+    def list_tenant(self, tenant_id: str) -> list[Record]:
+        """Records owned by one tenant, in insertion order."""
+        return list(self._partitions.get(tenant_id, {}).values())
+
+    def find(self, tenant_id: str, field_name: str, value: Any) -> list[Record]:
+        """Records of one tenant whose data[field_name] equals value."""
+        by_tenant = self._indexes.get(field_name)
+        if by_tenant is not None and _hashable(value):
+            return list(by_tenant.get(tenant_id, {}).get(value, {}).values())
+        return [
+            r for r in self._partitions.get(tenant_id, {}).values()
+            if field_name in r.data and r.data[field_name] == value
+        ]
+
     def delete(self, record_id: str) -> bool:
-        return self._records.pop(record_id, None) is not None
+        record = self._records.pop(record_id, None)
+        if record is None:
+            return False
+        self._unlink(record)
+        return True
+
+    def tenant_count(self, tenant_id: str) -> int:
+        return len(self._partitions.get(tenant_id, {}))
+
+    @property
+    def tenant_ids(self) -> list[str]:
+        return list(self._partitions)
 
     @property
     def count(self) -> int:
         return len(self._records)
 
 
+def _hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Audit log
+# ---------------------------------------------------------------------------
+
+AUDIT_FIELDS = ("tenant_id", "user_id", "action", "target")
+
+
+# WHY a ring buffer? -- An unbounded list of dicts grows with every read and
+# eventually dominates memory. A deque with maxlen keeps the most recent
+# entries in O(1) per append; anything needing full history sets `path`
+# so every entry is also appended to a JSONL file before it can be evicted.
+class AuditLog:
+    """Bounded, append-only audit trail with an optional JSONL mirror."""
+
+    def __init__(self, capacity: int = 10_000, path: str | Path | None = None) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self._entries: deque[tuple[str, str, str, str]] = deque(maxlen=capacity)
+        self._total = 0
+        self._file = open(path, "a", encoding="utf-8") if path is not None else None
+
+    def append(self, tenant_id: str, user_id: str, action: str, target: str) -> None:
+        entry = (tenant_id, user_id, action, target)
+        self._entries.append(entry)
+        self._total += 1
+        if self._file is not None:
+            # Flush per entry: an audit trail that lives in a userspace
+            # buffer is lost with the process.
+            self._file.write(json.dumps(dict(zip(AUDIT_FIELDS, entry))) + "\n")
+            self._file.flush()
+
+    def entries(self) -> list[dict[str, str]]:
+        """Retained entries, oldest first."""
+        return [dict(zip(AUDIT_FIELDS, entry)) for entry in self._entries]
+
+    @property
+    def dropped(self) -> int:
+        """Entries evicted from memory (still in the file, if one is set)."""
+        return self._total - len(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> AuditLog:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
 # ---------------------------------------------------------------------------
 # Tenant-aware proxy (Proxy pattern)
 # ---------------------------------------------------------------------------
@@ -123,21 +262,26 @@ class TenantAwareStore:
     4. Super-admins can bypass tenant filtering (audit use cases)
     """
 
-    def __init__(self, store: DataStore) -> None:
+    def __init__(self, store: DataStore, audit: AuditLog | None = None) -> None:
         self._store = store
-        self._audit_log: list[dict[str, str]] = []
+        self._audit_log = audit if audit is not None else AuditLog()
+
+    def close(self) -> None:
+        """Close the audit log's file mirror, if any."""
+        self._audit_log.close()
+
+    def __enter__(self) -> TenantAwareStore:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
 
     def _audit(self, ctx: TenantContext, action: str, target: str) -> None:
-        self._audit_log.append({
-            "tenant_id": ctx.tenant_id,
-            "user_id": ctx.user_id,
-            "action": action,
-            "target": target,
-        })
+        self._audit_log.append(ctx.tenant_id, ctx.user_id, action, target)
 
     @property
     def audit_log(self) -> list[dict[str, str]]:
-        return list(self._audit_log)
+        return self._audit_log.entries()
 
     def _require_permission(self, ctx: TenantContext, perm: Permission) -> None:
         if not ctx.has_permission(perm):
@@ -169,13 +313,24 @@ class TenantAwareStore:
 
     def list_records(self, ctx: TenantContext) -> list[Record]:
         self._require_permission(ctx, Permission.READ)
-        all_records = self._store.list_all()
         if ctx.is_super_admin:
+            all_records = self._store.list_all()
             self._audit(ctx, "LIST_ALL", f"{len(all_records)} records")
             return all_records
-        filtered = [r for r in all_records if r.tenant_id == ctx.tenant_id]
-        self._audit(ctx, "LIST", f"{len(filtered)} records")
-        return filtered
+        records = self._store.list_tenant(ctx.tenant_id)
+        self._audit(ctx, "LIST", f"{len(records)} records")
+        return records
+
+    def find_records(self, ctx: TenantContext, field_name: str, value: Any) -> list[Record]:
+        """Caller's records whose data[field_name] equals value.
+
+        Super-admins are still scoped to their context's tenant here; a
+        cross-tenant search is a list_records() call.
+        """
+        self._require_permission(ctx, Permission.READ)
+        records = self._store.find(ctx.tenant_id, field_name, value)
+        self._audit(ctx, "FIND", f"{field_name}={value!r}: {len(records)} records")
+        return records
 
     def delete(self, ctx: TenantContext, record_id: str) -> bool:
         self._require_permission(ctx, Permission.DELETE)
@@ -192,9 +347,13 @@ class TenantAwareStore:
 # Convenience factory
 # ---------------------------------------------------------------------------
 
-def create_guarded_store() -> TenantAwareStore:
+def create_guarded_store(
+    indexed_fields: tuple[str, ...] = (),
+    audit_capacity: int = 10_000,
+    audit_path: str | Path | None = None,
+) -> TenantAwareStore:
     """Create a fresh tenant-aware store for use."""
-    return TenantAwareStore(DataStore())
+    return TenantAwareStore(DataStore(indexed_fields), AuditLog(audit_capacity, audit_path))
 
 
 # ---------------------------------------------------------------------------
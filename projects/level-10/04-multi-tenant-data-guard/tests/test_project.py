@@ -1,15 +1,22 @@
 """Tests for Multi-Tenant Data Guard.
 
 Covers tenant isolation, role-based access, cross-tenant blocking,
-super-admin bypass, audit logging, and permission edge cases.
+super-admin bypass, audit logging, permission edge cases, per-tenant
+partitions, secondary indexes, and the bounded audit log.
 """
 from __future__ import annotations
 
+import json
+from pathlib import Path
+
 import pytest
 
 from project import (
+    AuditLog,
+    DataStore,
     Permission,
     PermissionDeniedError,
+    Record,
     Role,
     TenantAwareStore,
     TenantContext,
@@ -149,3 +156,103 @@ class TestAuditLog:
         entry = store.audit_log[0]
         assert entry["tenant_id"] == "acme"
         assert entry["user_id"] == "alice"
+
+
+# ---------------------------------------------------------------------------
+# Partitioned store
+# ---------------------------------------------------------------------------
+
+class TestPartitionedStore:
+    def test_listing_reads_only_own_partition(
+        self, acme_editor: TenantContext, globex_editor: TenantContext
+    ) -> None:
+        raw = DataStore()
+        store = TenantAwareStore(raw)
+        for i in range(50):
+            store.insert(globex_editor, f"g{i}", {})
+        store.insert(acme_editor, "a1", {})
+        raw.list_all = None  # type: ignore[assignment]  # must not be needed
+        assert [r.id for r in store.list_records(acme_editor)] == ["a1"]
+        assert raw.tenant_count("globex") == 50
+
+    def test_reinsert_and_delete_keep_partitions_consistent(self) -> None:
+        raw = DataStore(indexed_fields=("status",))
+        raw.insert(Record("r1", "acme", {"status": "open"}))
+        raw.insert(Record("r1", "globex", {"status": "paid"}))
+        assert raw.list_tenant("acme") == []
+        assert raw.find("acme", "status", "open") == []
+        assert [r.id for r in raw.find("globex", "status", "paid")] == ["r1"]
+        assert raw.delete("r1")
+        assert raw.tenant_ids == [] and raw.count == 0
+
+    def test_index_survives_in_place_mutation(self) -> None:
+        raw = DataStore(indexed_fields=("status",))
+        record = Record("r1", "acme", {"status": "open"})
+        raw.insert(record)
+        record.data["status"] = "paid"
+        raw.insert(record)
+        assert raw.find("acme", "status", "open") == []
+        assert raw.find("acme", "status", "paid") == [record]
+
+
+class TestFindRecords:
+    @pytest.mark.parametrize("indexed", [(), ("status",)])
+    def test_indexed_and_scanned_lookups_agree(
+        self, indexed: tuple[str, ...], acme_editor: TenantContext,
+        globex_editor: TenantContext,
+    ) -> None:
+        store = create_guarded_store(indexed_fields=indexed)
+        store.insert(acme_editor, "a1", {"status": "paid"})
+        store.insert(acme_editor, "a2", {"status": "open"})
+        store.insert(acme_editor, "a3", {"status": "paid", "tags": ["x"]})
+        store.insert(globex_editor, "g1", {"status": "paid"})
+        assert [r.id for r in store.find_records(acme_editor, "status", "paid")] == ["a1", "a3"]
+        assert [r.id for r in store.find_records(acme_editor, "tags", ["x"])] == ["a3"]
+        assert store.audit_log[-1]["action"] == "FIND"
+
+    @pytest.mark.parametrize("indexed", [(), ("status",)])
+    def test_missing_field_never_matches_none(self, indexed: tuple[str, ...]) -> None:
+        raw = DataStore(indexed_fields=indexed)
+        raw.insert(Record("r1", "acme", {"status": None}))
+        raw.insert(Record("r2", "acme", {}))
+        assert [r.id for r in raw.find("acme", "status", None)] == ["r1"]
+        assert raw.delete("r2") and raw.delete("r1")
+
+    def test_unknown_tenant_finds_nothing(self, store: TenantAwareStore) -> None:
+        nobody = TenantContext("acme", "x", Role.VIEWER)
+        assert store.find_records(nobody, "status", "paid") == []
+
+
+# ---------------------------------------------------------------------------
+# Bounded audit log
+# ---------------------------------------------------------------------------
+
+class TestBoundedAuditLog:
+    def test_ring_buffer_keeps_most_recent(self, acme_editor: TenantContext) -> None:
+        store = create_guarded_store(audit_capacity=3)
+        for i in range(5):
+            store.insert(acme_editor, f"r{i}", {})
+        assert [e["target"] for e in store.audit_log] == ["r2", "r3", "r4"]
+
+    def test_file_mirror_keeps_full_history(self, tmp_path: Path, acme_editor: TenantContext) -> None:
+        path = tmp_path / "audit.jsonl"
+        with AuditLog(capacity=2, path=path) as log:
+            store = TenantAwareStore(DataStore(), log)
+            for i in range(4):
+                store.insert(acme_editor, f"r{i}", {})
+            assert len(log) == 2 and log.dropped == 2
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [e["target"] for e in lines] == ["r0", "r1", "r2", "r3"]
+        assert lines[0] == {"tenant_id": "acme", "user_id": "alice", "action": "INSERT", "target": "r0"}
+
+    def test_store_closes_file_mirror(self, tmp_path: Path, acme_editor: TenantContext) -> None:
+        path = tmp_path / "audit.jsonl"
+        with create_guarded_store(audit_path=path) as store:
+            store.insert(acme_editor, "r1", {})
+            # Flushed per entry, so readable before close (and after a crash).
+            assert json.loads(path.read_text())["target"] == "r1"
+        assert store._audit_log._file is None
+
+    def test_rejects_zero_capacity(self) -> None:
+        with pytest.raises(ValueError):
+            AuditLog(capacity=0)
@@ -1,9 +1,10 @@
 """Tests for Duplicate Record Investigator."""
 
 from pathlib import Path
+import random
 import pytest
 
-from project import bigrams, jaccard_similarity, find_duplicates, run
+from project import bigrams, jaccard_similarity, find_duplicates, prefix_filter_pairs, run
 
 
 def test_bigrams_basic() -> None:
@@ -66,3 +67,48 @@ def test_run_integration(tmp_path: Path) -> None:
     report = run(csv_file, output, ["name", "email"])
     assert output.exists()
     assert report["duplicate_pairs_found"] == 1
+
+
+def _noisy_rows(seed: int, count: int) -> list[dict]:
+    rng = random.Random(seed)
+    bases = ["Jonathan Smith", "Alice Jones", "Maria Garcia", "Li Wei", "Al", ""]
+    rows = []
+    for _ in range(count):
+        name = list(rng.choice(bases))
+        for _ in range(rng.randint(0, 2)):
+            name.insert(rng.randrange(len(name) + 1), rng.choice("abcxyz"))
+        rows.append({"name": "".join(name), "email": rng.choice(["a@x.com", "b@x.com", "A@x.com "])})
+    return rows
+
+
+@pytest.mark.parametrize("threshold", [0.0, 0.5, 0.8, 1.0])
+@pytest.mark.parametrize("keys", [["name"], ["name", "email"]])
+def test_index_matches_brute_force(threshold: float, keys: list[str]) -> None:
+    rows = _noisy_rows(seed=11, count=60)
+    expected = find_duplicates(rows, keys, threshold, method="brute")
+    assert find_duplicates(rows, keys, threshold) == expected
+
+
+def test_prefix_filter_keeps_every_similar_pair() -> None:
+    words = ["hello", "hallo", "hellos", "world", "word", "help"]
+    sets = [bigrams(w) for w in words]
+    candidates = prefix_filter_pairs(sets, 0.5)
+    for i in range(len(words)):
+        for j in range(i + 1, len(words)):
+            if jaccard_similarity(words[i], words[j]) >= 0.5:
+                assert (i, j) in candidates
+
+
+def test_minhash_finds_fuzzy_duplicates() -> None:
+    rows = [
+        {"name": "Jonathan Smith"},
+        {"name": "Completely Different"},
+        {"name": "Johnathan Smith"},
+    ]
+    dupes = find_duplicates(rows, ["name"], threshold=0.7, method="minhash")
+    assert [(d["row_a"], d["row_b"]) for d in dupes] == [(1, 3)]
+
+
+def test_unknown_method_rejected() -> None:
+    with pytest.raises(ValueError):
+        find_duplicates([], ["name"], method="quantum")
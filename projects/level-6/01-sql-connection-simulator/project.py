@@ -8,6 +8,7 @@ Key concepts:
 - Context managers (with statement) for safe resource cleanup
 - Connection pool pattern (reuse instead of recreate)
 - Retry with exponential backoff on transient failures
+- Thread-safe bounded pool: fair blocking acquire, idle eviction, metrics
 """
 
 from __future__ import annotations
@@ -17,18 +18,27 @@ import json
 import logging
 import random
 import sqlite3
+import tempfile
+import threading
 import time
-from dataclasses import dataclass, field
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
 from pathlib import Path
+from typing import Iterator
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 
 MAX_POOL_SIZE = 5
+MAX_OVERFLOW = 10
 MAX_RETRIES = 3
 BASE_BACKOFF_SEC = 0.01  # kept small for fast demo runs
 
+# Upper bounds (ms) of the acquire wait-time histogram buckets.
+WAIT_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000)
+
 
 @dataclass
 class ConnectionConfig:
@@ -37,7 +47,17 @@ class ConnectionConfig:
     db_path: str = ":memory:"
     timeout: float = 5.0
     max_retries: int = MAX_RETRIES
-    pool_size: int = MAX_POOL_SIZE
+    pool_size: int = MAX_POOL_SIZE  # connections kept idle for reuse
+    max_overflow: int = MAX_OVERFLOW  # extra connections allowed under load
+    acquire_timeout: float = 30.0  # seconds to wait for a free connection
+    idle_timeout: float = 300.0  # close connections idle longer than this
+    max_lifetime: float = 3600.0  # recycle connections older than this
+    pre_ping_after: float = 30.0  # ping before reuse only after this much idle time
+    reaper_interval: float = 30.0  # background eviction period; 0 disables it
+
+    @property
+    def max_connections(self) -> int:
+        return self.pool_size + self.max_overflow
 
 
 # ---------------------------------------------------------------------------
@@ -45,73 +65,276 @@ class ConnectionConfig:
 # ---------------------------------------------------------------------------
 
 
+@dataclass(slots=True)
+class _PooledConnection:
+    conn: sqlite3.Connection
+    created_at: float
+    last_used: float
+
+
+@dataclass(slots=True)
+class _Waiter:
+    """A thread queued in acquire(); release() hands it a connection or a slot."""
+    event: threading.Event = field(default_factory=threading.Event)
+    granted: bool = False
+    item: _PooledConnection | None = None  # None with granted=True: open a new one
+
+
 class ConnectionPool:
-    """Simple SQLite connection pool.
+    """Thread-safe, bounded SQLite connection pool.
 
     WHY pool connections? -- Creating a new database connection for every
     query involves TCP handshakes, authentication, and memory allocation.
     A pool keeps idle connections ready to reuse, cutting per-query
-    overhead from milliseconds to microseconds. Real pools (e.g.
-    SQLAlchemy's QueuePool) add thread-safety and eviction, but this
-    version teaches the core reuse pattern.
+    overhead from milliseconds to microseconds.
+
+    At most `pool_size + max_overflow` connections exist at once; when all
+    are checked out, acquire() blocks (up to `acquire_timeout`) and waiting
+    threads are served first-come, first-served. Up to `pool_size`
+    connections are kept idle; the rest are closed on release. Idle and
+    over-age connections are evicted by a background reaper thread, started
+    the first time a connection is returned to the idle set.
     """
 
     def __init__(self, config: ConnectionConfig) -> None:
         self.config = config
-        self._pool: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        # Idle connections; reuse from the right (most recently used) so the
+        # ones on the left age out and can be evicted.
+        self._idle: deque[_PooledConnection] = deque()
+        self._in_use: dict[int, _PooledConnection] = {}
+        self._waiters: deque[_Waiter] = deque()
+        self._open = 0  # idle + checked out + being created
         self._created = 0  # total connections ever opened
         self._reused = 0
+        self._evicted = 0
+        self._pings = 0
+        self._timeouts = 0
+        self._waits = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        self._stop = threading.Event()
+        # Started on the first idle connection; a pool that never keeps one
+        # idle has nothing to evict and never pays for the thread.
+        self._reaper: threading.Thread | None = None
 
     # -- public API --------------------------------------------------------
 
-    def acquire(self) -> sqlite3.Connection:
-        """Return an existing connection or create a new one."""
-        if self._pool:
-            self._reused += 1
+    def acquire(self, timeout: float | None = None) -> sqlite3.Connection:
+        """Check out a connection, blocking while the pool is at capacity.
+
+        Raises TimeoutError if none frees up within `timeout` seconds
+        (default: config.acquire_timeout).
+        """
+        timeout = self.config.acquire_timeout if timeout is None else timeout
+        start = time.monotonic()
+        with self._lock:
+            if self._idle and not self._waiters:
+                item = self._idle.pop()
+            elif self._open < self.config.max_connections and not self._waiters:
+                item = None
+                self._open += 1
+            else:
+                waiter = _Waiter()
+                self._waiters.append(waiter)
+                item = self._wait(waiter, timeout)
+            self._record_wait(time.monotonic() - start)
+
+        if item is not None:
+            item = self._check_reusable(item)
+        if item is None:
+            item = self._open_new()
+        else:
+            with self._lock:
+                self._reused += 1
             logging.info("pool_reuse  total=%d reused=%d", self._created, self._reused)
-            return self._pool.pop()
-
-        conn = self._connect_with_retry()
-        self._created += 1
-        logging.info("pool_create total=%d reused=%d", self._created, self._reused)
-        return conn
+        item.last_used = time.monotonic()
+        with self._lock:
+            self._in_use[id(item.conn)] = item
+        return item.conn
 
     def release(self, conn: sqlite3.Connection) -> None:
-        """Return a connection to the pool (or close if pool is full)."""
-        if len(self._pool) < self.config.pool_size:
-            self._pool.append(conn)
-        else:
-            conn.close()
+        """Return a connection to the pool (or close if pool is full).
+
+        Raises ValueError for a connection this pool did not hand out (or one
+        already released); adopting it would push the pool past its bound.
+        """
+        now = time.monotonic()
+        with self._lock:
+            item = self._in_use.pop(id(conn), None)
+        if item is None:
+            raise ValueError("connection was not checked out from this pool")
+        item.last_used = now
+
+        try:
+            conn.rollback()  # never hand the next caller an open transaction
+            healthy = now - item.created_at < self.config.max_lifetime
+        except sqlite3.Error:
+            healthy = False
+
+        with self._lock:
+            if self._waiters:
+                waiter = self._waiters.popleft()
+                waiter.granted = True
+                if healthy:
+                    waiter.item = item
+                waiter.event.set()
+                if healthy:
+                    return
+                # The waiter keeps this slot and opens a fresh connection.
+                self._open += 1
+            elif healthy and len(self._idle) < self.config.pool_size:
+                self._idle.append(item)
+                self._start_reaper()
+                return
+            self._open -= 1
+        conn.close()
+
+    @contextmanager
+    def connection(self, timeout: float | None = None) -> Iterator[sqlite3.Connection]:
+        """Check out a connection for the duration of a with-block."""
+        conn = self.acquire(timeout)
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def evict_idle(self) -> int:
+        """Close idle connections past idle_timeout or max_lifetime."""
+        now = time.monotonic()
+        expired: list[_PooledConnection] = []
+        with self._lock:
+            keep: deque[_PooledConnection] = deque()
+            for item in self._idle:
+                if (now - item.last_used >= self.config.idle_timeout
+                        or now - item.created_at >= self.config.max_lifetime):
+                    expired.append(item)
+                else:
+                    keep.append(item)
+            self._idle = keep
+            self._open -= len(expired)
+            self._evicted += len(expired)
+        for item in expired:
+            item.conn.close()
+        if expired:
+            logging.info("pool_evict  count=%d", len(expired))
+        return len(expired)
 
     def close_all(self) -> None:
-        """Drain the pool and close every connection."""
-        while self._pool:
-            self._pool.pop().close()
+        """Stop the reaper, drain the pool and close every idle connection."""
+        self._stop.set()
+        if self._reaper is not None and self._reaper is not threading.current_thread():
+            self._reaper.join()
+        with self._lock:
+            idle, self._idle = list(self._idle), deque()
+            self._open -= len(idle)
+        for item in idle:
+            item.conn.close()
 
     def stats(self) -> dict:
         """Return pool health metrics."""
-        return {
-            "created": self._created,
-            "reused": self._reused,
-            "idle": len(self._pool),
-            "pool_size": self.config.pool_size,
-        }
+        with self._lock:
+            labels = [f"<={b}" for b in WAIT_BUCKETS_MS] + [f">{WAIT_BUCKETS_MS[-1]}"]
+            return {
+                "created": self._created,
+                "reused": self._reused,
+                "idle": len(self._idle),
+                "pool_size": self.config.pool_size,
+                "in_use": len(self._in_use),
+                "max_connections": self.config.max_connections,
+                "waiting": len(self._waiters),
+                "evicted": self._evicted,
+                "pings": self._pings,
+                "timeouts": self._timeouts,
+                "wait_histogram_ms": dict(zip(labels, self._waits)),
+            }
 
     # -- internals ---------------------------------------------------------
 
+    # WHY hand connections to waiters directly? -- If release() just put the
+    # connection back and notified, a newly arriving thread could grab it
+    # before the woken waiter runs. Handing it to the oldest waiter makes
+    # the queue strictly FIFO, so no thread starves under load.
+    def _wait(self, waiter: _Waiter, timeout: float) -> _PooledConnection | None:
+        """Block (lock held on entry and exit) until release() grants a slot."""
+        self._lock.release()
+        try:
+            waiter.event.wait(timeout)
+        finally:
+            self._lock.acquire()
+        if not waiter.granted:
+            self._waiters.remove(waiter)
+            self._timeouts += 1
+            raise TimeoutError(
+                f"No connection available within {timeout:.3f}s "
+                f"(max_connections={self.config.max_connections})"
+            )
+        return waiter.item
+
+    def _record_wait(self, seconds: float) -> None:
+        ms = seconds * 1000
+        for idx, bound in enumerate(WAIT_BUCKETS_MS):
+            if ms <= bound:
+                self._waits[idx] += 1
+                return
+        self._waits[-1] += 1
+
+    def _check_reusable(self, item: _PooledConnection) -> _PooledConnection | None:
+        """Return the connection if still usable, else close it (keeping its slot)."""
+        now = time.monotonic()
+        if now - item.created_at >= self.config.max_lifetime:
+            item.conn.close()
+            return None
+        # WHY ping only after idle periods? -- A connection used moments ago
+        # is almost certainly fine; a round-trip on every checkout would cost
+        # more than it saves. Long-idle connections are the ones that go bad.
+        if now - item.last_used >= self.config.pre_ping_after:
+            with self._lock:
+                self._pings += 1
+            if health_check(item.conn)["status"] != "healthy":
+                item.conn.close()
+                return None
+        return item
+
+    def _open_new(self) -> _PooledConnection:
+        """Open a connection into a slot already reserved in self._open."""
+        try:
+            conn = self._connect_with_retry()
+        except BaseException:
+            with self._lock:
+                self._open -= 1
+                # Pass the freed slot on so a queued thread can try instead.
+                if self._waiters:
+                    waiter = self._waiters.popleft()
+                    waiter.granted = True
+                    waiter.event.set()
+                    self._open += 1
+            raise
+        now = time.monotonic()
+        with self._lock:
+            self._created += 1
+        logging.info("pool_create total=%d reused=%d", self._created, self._reused)
+        return _PooledConnection(conn, now, now)
+
+    def _start_reaper(self) -> None:
+        """Start the eviction thread once (lock held by the caller)."""
+        if self._reaper is None and self.config.reaper_interval > 0 and not self._stop.is_set():
+            self._reaper = threading.Thread(target=self._reap, name="pool-reaper", daemon=True)
+            self._reaper.start()
+
+    def _reap(self) -> None:
+        while not self._stop.wait(self.config.reaper_interval):
+            self.evict_idle()
+
     def _connect_with_retry(self) -> sqlite3.Connection:
         """Open a connection, retrying on transient errors."""
         last_err: Exception | None = None
         for attempt in range(1, self.config.max_retries + 1):
             try:
-                conn = sqlite3.connect(
-                    self.config.db_path, timeout=self.config.timeout
+                # check_same_thread=False: pooled connections move between
+                # threads, but only one thread holds a connection at a time.
+                return sqlite3.connect(
+                    self.config.db_path, timeout=self.config.timeout,
+                    check_same_thread=False,
                 )
-                # WHY a health-check ping? -- A connection can be "open"
-                # but the database might be locked or corrupted. SELECT 1
-                # verifies the connection actually works end-to-end.
-                conn.execute("SELECT 1")
-                return conn
             except sqlite3.OperationalError as exc:
                 last_err = exc
                 wait = BASE_BACKOFF_SEC * (2 ** (attempt - 1))
@@ -167,6 +390,67 @@ def run_demo_queries(pool: ConnectionPool, labels: list[str]) -> list[dict]:
         pool.release(conn)
 
 
+def benchmark_readers(
+    readers: int = 32,
+    queries_per_reader: int = 200,
+    config: ConnectionConfig | None = None,
+) -> dict:
+    """Hammer the pool with concurrent readers against a WAL-mode database.
+
+    WHY WAL? -- In the default rollback-journal mode readers and writers
+    block each other; write-ahead logging lets any number of readers run
+    alongside one writer, which is the setup a shared pool serves best.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "bench.db")
+        setup = sqlite3.connect(db_path)
+        setup.execute("PRAGMA journal_mode=WAL")
+        setup.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, label TEXT NOT NULL)")
+        setup.executemany(
+            "INSERT INTO items (id, label) VALUES (?, ?)",
+            ((i, f"item-{i}") for i in range(1, 1001)),
+        )
+        setup.commit()
+        setup.close()
+
+        cfg = config or ConnectionConfig(pool_size=8, max_overflow=0)
+        pool = ConnectionPool(replace(cfg, db_path=db_path))
+        errors: list[BaseException] = []
+        start_gate = threading.Barrier(readers)
+
+        def reader(seed: int) -> None:
+            rng = random.Random(seed)
+            try:
+                start_gate.wait()
+                for _ in range(queries_per_reader):
+                    with pool.connection() as conn:
+                        conn.execute(
+                            "SELECT label FROM items WHERE id = ?", (rng.randint(1, 1000),)
+                        ).fetchone()
+            except BaseException as exc:  # surfaced in the result, not lost in a thread
+                errors.append(exc)
+
+        threads = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+        start = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - start
+        stats = pool.stats()
+        pool.close_all()
+
+    total = readers * queries_per_reader
+    return {
+        "readers": readers,
+        "queries": total,
+        "errors": len(errors),
+        "seconds": round(elapsed, 3),
+        "queries_per_sec": round(total / elapsed) if elapsed else None,
+        "pool_stats": stats,
+    }
+
+
 # ---------------------------------------------------------------------------
 # Orchestrator
 # ---------------------------------------------------------------------------
@@ -223,6 +507,14 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--pool-size", type=int, default=MAX_POOL_SIZE, help="Max idle connections"
     )
+    parser.add_argument(
+        "--max-overflow", type=int, default=MAX_OVERFLOW,
+        help="Extra connections allowed beyond --pool-size under load",
+    )
+    parser.add_argument(
+        "--benchmark", type=int, metavar="READERS", default=None,
+        help="Benchmark the pool with N concurrent readers on a WAL database",
+    )
     return parser.parse_args()
 
 
@@ -232,7 +524,13 @@ def main() -> None:
         format="%(asctime)s | %(levelname)s | %(message)s",
     )
     args = parse_args()
-    config = ConnectionConfig(db_path=args.db, pool_size=args.pool_size)
+    config = ConnectionConfig(
+        db_path=args.db, pool_size=args.pool_size, max_overflow=args.max_overflow
+    )
+    if args.benchmark:
+        logging.getLogger().setLevel(logging.WARNING)  # per-checkout logs would dominate
+        print(json.dumps(benchmark_readers(args.benchmark, config=config), indent=2))
+        return
     summary = run(Path(args.input), Path(args.output), config)
     print(json.dumps(summary, indent=2))
 
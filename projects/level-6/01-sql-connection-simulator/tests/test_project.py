@@ -5,17 +5,21 @@ Covers:
 - Health check on live and closed connections
 - Demo workload end-to-end with in-memory SQLite
 - Retry behaviour when connection is unavailable
+- Bounded, thread-safe checkout: blocking, FIFO fairness, eviction, metrics
 """
 
 from __future__ import annotations
 
 import sqlite3
+import threading
+import time
 
 import pytest
 
 from project import (
     ConnectionConfig,
     ConnectionPool,
+    benchmark_readers,
     health_check,
     run,
     run_demo_queries,
@@ -82,6 +86,148 @@ class TestConnectionPool:
         assert pool.stats()["idle"] == 0
 
 
+class TestBoundedPool:
+    def test_acquire_blocks_then_times_out(self) -> None:
+        p = ConnectionPool(ConnectionConfig(pool_size=1, max_overflow=0))
+        conn = p.acquire()
+        with pytest.raises(TimeoutError):
+            p.acquire(timeout=0.05)
+        assert p.stats()["timeouts"] == 1
+        p.release(conn)
+        p.close_all()
+
+    def test_release_wakes_waiter(self) -> None:
+        p = ConnectionPool(ConnectionConfig(pool_size=1, max_overflow=0))
+        conn = p.acquire()
+        got: list[sqlite3.Connection] = []
+        t = threading.Thread(target=lambda: got.append(p.acquire(timeout=5)))
+        t.start()
+        time.sleep(0.05)
+        p.release(conn)
+        t.join()
+        assert got == [conn]
+        p.release(conn)
+        p.close_all()
+
+    def test_waiters_served_in_fifo_order(self) -> None:
+        p = ConnectionPool(ConnectionConfig(pool_size=1, max_overflow=0))
+        conn = p.acquire()
+        order: list[int] = []
+
+        def worker(n: int) -> None:
+            c = p.acquire(timeout=5)
+            order.append(n)
+            p.release(c)
+
+        threads = []
+        for n in range(4):
+            t = threading.Thread(target=worker, args=(n,))
+            t.start()
+            threads.append(t)
+            while p.stats()["waiting"] < n + 1:  # queue them in a known order
+                time.sleep(0.001)
+        p.release(conn)
+        for t in threads:
+            t.join()
+        assert order == [0, 1, 2, 3]
+        p.close_all()
+
+    def test_concurrent_use_never_exceeds_capacity(self) -> None:
+        p = ConnectionPool(ConnectionConfig(pool_size=2, max_overflow=1))
+        peak = 0
+        lock = threading.Lock()
+
+        def worker() -> None:
+            nonlocal peak
+            for _ in range(50):
+                with p.connection(timeout=5) as conn:
+                    conn.execute("SELECT 1")
+                    with lock:
+                        peak = max(peak, p.stats()["in_use"])
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        stats = p.stats()
+        assert peak <= 3
+        assert stats["created"] <= 3
+        assert sum(stats["wait_histogram_ms"].values()) == 400
+        p.close_all()
+
+    def test_release_rejects_foreign_connection(self, pool: ConnectionPool) -> None:
+        foreign = sqlite3.connect(":memory:")
+        with pytest.raises(ValueError):
+            pool.release(foreign)
+        foreign.close()
+        conn = pool.acquire()
+        pool.release(conn)
+        with pytest.raises(ValueError):
+            pool.release(conn)  # double release
+        assert pool.stats()["idle"] == 1
+
+    def test_context_manager_returns_connection(self, pool: ConnectionPool) -> None:
+        with pool.connection() as conn:
+            conn.execute("SELECT 1")
+            assert pool.stats()["in_use"] == 1
+        assert pool.stats()["idle"] == 1
+
+
+class TestEviction:
+    def test_idle_connections_evicted(self) -> None:
+        p = ConnectionPool(ConnectionConfig(idle_timeout=0.01, reaper_interval=0))
+        p.release(p.acquire())
+        time.sleep(0.02)
+        assert p.evict_idle() == 1
+        assert p.stats()["idle"] == 0
+        assert p.stats()["evicted"] == 1
+
+    def test_background_reaper(self) -> None:
+        p = ConnectionPool(ConnectionConfig(idle_timeout=0.01, reaper_interval=0.01))
+        p.release(p.acquire())
+        deadline = time.monotonic() + 2
+        while p.stats()["idle"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert p.stats()["idle"] == 0
+        p.close_all()
+
+    def test_reaper_starts_on_first_idle_connection(self) -> None:
+        p = ConnectionPool(ConnectionConfig(reaper_interval=60))
+        assert p._reaper is None
+        p.release(p.acquire())
+        assert p._reaper is not None and p._reaper.is_alive()
+        p.close_all()
+        assert not p._reaper.is_alive()
+
+    def test_stale_connection_recycled(self) -> None:
+        p = ConnectionPool(ConnectionConfig(max_lifetime=0.01, reaper_interval=0))
+        first = p.acquire()
+        p.release(first)
+        second = p.acquire()
+        time.sleep(0.02)
+        p.release(second)
+        assert p.stats()["idle"] == 0  # too old to keep
+        p.close_all()
+
+    def test_pre_ping_only_after_idle(self) -> None:
+        p = ConnectionPool(ConnectionConfig(pre_ping_after=0.02, reaper_interval=0))
+        p.release(p.acquire())
+        p.release(p.acquire())
+        assert p.stats()["pings"] == 0
+        time.sleep(0.03)
+        p.release(p.acquire())
+        assert p.stats()["pings"] == 1
+        p.close_all()
+
+
+def test_benchmark_wal_readers() -> None:
+    result = benchmark_readers(readers=4, queries_per_reader=10)
+    assert result["errors"] == 0
+    assert result["queries"] == 40
+    assert result["pool_stats"]["created"] <= 8
+
+
 # ---------------------------------------------------------------------------
 # Health check
 # ---------------------------------------------------------------------------
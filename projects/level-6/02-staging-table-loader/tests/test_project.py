@@ -17,6 +17,7 @@ from project import (
     create_staging_table,
     load_csv,
     load_rows,
+    load_rows_bulk,
     run,
     validate_row,
 )
@@ -116,6 +117,86 @@ def test_load_rows_rejects_invalid(conn: sqlite3.Connection) -> None:
     assert len(result.errors) == 1
 
 
+# ---------------------------------------------------------------------------
+# Bulk loading
+# ---------------------------------------------------------------------------
+
+
+def _mixed_rows(n: int) -> list[dict]:
+    levels = ["INFO", "warn", "BOGUS", "ERROR", ""]
+    return [
+        {"timestamp": "2025-01-01", "level": levels[i % len(levels)],
+         "source": "svc" if i % 7 else " ", "message": f"m{i}"}
+        for i in range(n)
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1000])
+def test_bulk_matches_row_by_row(chunk_size: int) -> None:
+    rows = _mixed_rows(50)
+    a = sqlite3.connect(":memory:")
+    b = sqlite3.connect(":memory:")
+    create_staging_table(a)
+    create_staging_table(b)
+
+    expected = load_rows(a, rows)
+    result = load_rows_bulk(b, iter(rows), chunk_size=chunk_size)
+
+    assert result == expected
+    query = "SELECT timestamp, level, source, message FROM staging_events ORDER BY id"
+    assert b.execute(query).fetchall() == a.execute(query).fetchall()
+
+
+def test_bulk_isolates_constraint_violations(conn: sqlite3.Connection) -> None:
+    conn.execute("CREATE UNIQUE INDEX uq_message ON staging_events (message)")
+    rows = [
+        {"timestamp": "t", "level": "INFO", "source": "s", "message": f"m{i % 8}"}
+        for i in range(20)
+    ]
+    result = load_rows_bulk(conn, rows, chunk_size=16)
+    assert result.accepted == 8
+    assert result.rejected == 12
+    assert all("db_error=UNIQUE constraint failed" in e for e in result.errors)
+    assert result.errors[0].startswith("row=9 ")
+    assert count_staged(conn) == 8
+    assert not conn.in_transaction
+
+
+def test_bulk_rolls_back_on_unexpected_error(conn: sqlite3.Connection) -> None:
+    def rows():
+        yield {"timestamp": "t", "level": "INFO", "source": "s", "message": "ok"}
+        raise OSError("disk went away")
+
+    with pytest.raises(OSError):
+        load_rows_bulk(conn, rows(), chunk_size=1)
+    assert count_staged(conn) == 0
+
+
+def test_bulk_leaves_callers_transaction_alone(conn: sqlite3.Connection) -> None:
+    row = {"timestamp": "t", "level": "INFO", "source": "s", "message": "ok"}
+    load_rows(conn, [row])  # commits
+    conn.execute("DELETE FROM staging_events")  # caller's uncommitted work
+    assert conn.in_transaction
+
+    def failing():
+        yield row
+        raise OSError("disk went away")
+
+    with pytest.raises(OSError):
+        load_rows_bulk(conn, failing(), chunk_size=1)
+    assert conn.in_transaction and count_staged(conn) == 0  # delete kept
+
+    load_rows_bulk(conn, [row, row], chunk_size=1)
+    assert conn.in_transaction and count_staged(conn) == 2  # not committed
+    conn.rollback()
+    assert count_staged(conn) == 1
+
+
+def test_bulk_rejects_bad_chunk_size(conn: sqlite3.Connection) -> None:
+    with pytest.raises(ValueError):
+        load_rows_bulk(conn, [], chunk_size=0)
+
+
 # ---------------------------------------------------------------------------
 # End-to-end
 # ---------------------------------------------------------------------------
@@ -133,3 +214,14 @@ def test_run_end_to_end(tmp_path: Path) -> None:
     assert summary["accepted"] == 2
     assert summary["rejected"] == 1
     assert out.exists()
+
+
+@pytest.mark.integration
+def test_run_bulk_matches_default(tmp_path: Path) -> None:
+    csv_path = _write_csv(
+        tmp_path,
+        "2025-01-01,INFO,app,boot\n2025-01-02,CRITICAL,db,down\n,INFO,x,bad\n",
+    )
+    default = run(csv_path, tmp_path / "a.json")
+    bulk = run(csv_path, tmp_path / "b.json", bulk=True, chunk_size=2)
+    assert bulk == default
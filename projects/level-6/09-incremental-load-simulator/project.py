@@ -8,16 +8,20 @@ Key concepts:
 - Comparison: full load vs incremental load
 - Watermark persistence in a metadata table
 - Filtering source data by "modified_at > last_watermark"
+- Streaming loads: fixed-size chunks, per-chunk watermark commits
 """
 
 from __future__ import annotations
 
 import argparse
+import csv
 import json
 import logging
 import sqlite3
 from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
+from typing import Iterable, Iterator
 
 # ---------------------------------------------------------------------------
 # Schema
@@ -125,6 +129,112 @@ def incremental_load(
     return stats
 
 
+STREAM_CHUNK_SIZE = 10_000
+
+# WHY a conditional upsert? -- The batch loader sorts everything first, so
+# the newest version of an id is always written last. A stream is only
+# sorted within a chunk; the WHERE clause keeps the newest version even if
+# an older one for the same id arrives in a later chunk.
+UPSERT_SQL = (
+    "INSERT INTO events (id, name, modified_at) VALUES (?, ?, ?) "
+    "ON CONFLICT(id) DO UPDATE SET name = excluded.name, "
+    "modified_at = excluded.modified_at "
+    "WHERE excluded.modified_at >= events.modified_at"
+)
+
+
+def incremental_load_stream(
+    conn: sqlite3.Connection,
+    source_records: Iterable[dict],
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> LoadStats:
+    """Streaming incremental_load(): memory is bounded by chunk_size.
+
+    Records are read `chunk_size` at a time. Each chunk is filtered against
+    the starting watermark before it is sorted, upserted with executemany,
+    and committed together with the advanced watermark. If the process dies,
+    the next run resumes after the last committed watermark.
+
+    The committed watermark stops short of the newest timestamp seen so far:
+    rows sharing that timestamp may continue in the next chunk, and the
+    strict `> watermark` filter would skip them on resume. It only moves past
+    a timestamp once a later one has been seen, or the stream has ended.
+    Rows reloaded after a crash are harmless because the upsert is idempotent.
+
+    Resuming safely relies on the source being ordered by modified_at (as
+    delta extracts normally are). An out-of-order record is still loaded in
+    this run, but a crash after a later chunk would skip it, so a warning is
+    logged.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+    stats = LoadStats()
+    watermark = get_watermark(conn, "events")
+    max_ts = watermark
+    committed = watermark  # newest timestamp whose rows are all loaded
+    warned = False
+    records = iter(source_records)
+
+    while chunk := list(islice(records, chunk_size)):
+        stats.total_source += len(chunk)
+        fresh = [r for r in chunk if not watermark or r["modified_at"] > watermark]
+        stats.skipped += len(chunk) - len(fresh)
+        if not fresh:
+            continue
+
+        fresh.sort(key=lambda r: r["modified_at"])
+        if not warned and max_ts != watermark and fresh[0]["modified_at"] < max_ts:
+            logging.warning(
+                "source not ordered by modified_at; a crash now could skip records before %s",
+                max_ts,
+            )
+            warned = True
+
+        conn.executemany(
+            UPSERT_SQL, [(r["id"], r["name"], r["modified_at"]) for r in fresh]
+        )
+        stats.loaded += len(fresh)
+        newest = fresh[-1]["modified_at"]
+        if max_ts is None or newest > max_ts:
+            # Everything older than the newest timestamp is complete: the
+            # previous tail group, and this chunk's rows before its own tail.
+            older = [r["modified_at"] for r in fresh if r["modified_at"] < newest]
+            candidates = [ts for ts in (max_ts, max(older, default=None), committed) if ts]
+            committed = max(candidates, default=None)
+            max_ts = newest
+        # set_watermark() commits, so the chunk's rows and its watermark
+        # become durable together.
+        if committed and committed != watermark:
+            set_watermark(conn, "events", committed)
+        else:
+            conn.commit()
+
+    if max_ts and max_ts != committed:
+        set_watermark(conn, "events", max_ts)  # end of stream: tail is complete
+    if max_ts and max_ts != watermark:
+        stats.new_watermark = max_ts
+    return stats
+
+
+def iter_source(path: Path) -> Iterator[dict]:
+    """Yield source records from .jsonl or .csv one at a time.
+
+    Plain .json arrays have to be parsed whole, so they are loaded and
+    then iterated; use .jsonl or .csv for files that do not fit in memory.
+    """
+    if path.suffix == ".csv":
+        with path.open(encoding="utf-8", newline="") as fh:
+            for row in csv.DictReader(fh):
+                yield {"id": int(row["id"]), "name": row["name"], "modified_at": row["modified_at"]}
+    elif path.suffix == ".jsonl":
+        with path.open(encoding="utf-8") as fh:
+            for line in fh:
+                if line.strip():
+                    yield json.loads(line)
+    else:
+        yield from json.loads(path.read_text(encoding="utf-8"))
+
+
 def count_events(conn: sqlite3.Connection) -> int:
     return conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
 
@@ -134,17 +244,24 @@ def count_events(conn: sqlite3.Connection) -> int:
 # ---------------------------------------------------------------------------
 
 
-def run(input_path: Path, output_path: Path, db_path: str = ":memory:") -> dict:
+def run(
+    input_path: Path,
+    output_path: Path,
+    db_path: str = ":memory:",
+    chunk_size: int | None = None,
+) -> dict:
+    """Load the input file; pass chunk_size to stream it in chunks."""
     if not input_path.exists():
         raise FileNotFoundError(f"Input not found: {input_path}")
 
-    source_records = json.loads(input_path.read_text(encoding="utf-8"))
-
     conn = sqlite3.connect(db_path)
     try:
         init_db(conn)
         old_watermark = get_watermark(conn, "events")
-        stats = incremental_load(conn, source_records)
+        if chunk_size:
+            stats = incremental_load_stream(conn, iter_source(input_path), chunk_size)
+        else:
+            stats = incremental_load(conn, list(iter_source(input_path)))
         total = count_events(conn)
     finally:
         conn.close()
@@ -176,13 +293,17 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--input", default="data/sample_input.json")
     parser.add_argument("--output", default="data/output_summary.json")
     parser.add_argument("--db", default=":memory:")
+    parser.add_argument(
+        "--chunk-size", type=int, default=None,
+        help="Stream the input (.json, .jsonl or .csv) in chunks of this many records",
+    )
     return parser.parse_args()
 
 
 def main() -> None:
     logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(levelname)s | %(message)s")
     args = parse_args()
-    summary = run(Path(args.input), Path(args.output), args.db)
+    summary = run(Path(args.input), Path(args.output), args.db, args.chunk_size)
     print(json.dumps(summary, indent=2))
 
 
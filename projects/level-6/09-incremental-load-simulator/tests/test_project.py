@@ -1,12 +1,14 @@
 """Tests for Incremental Load Simulator.
 
 Validates watermark tracking, incremental vs full load behavior,
-and correct skipping of already-loaded records.
+and correct skipping of already-loaded records, plus the streaming
+chunked loader and its crash-resume behaviour.
 """
 
 from __future__ import annotations
 
 import json
+import random
 import sqlite3
 
 import pytest
@@ -15,6 +17,7 @@ from project import (
     count_events,
     get_watermark,
     incremental_load,
+    incremental_load_stream,
     init_db,
     run,
     set_watermark,
@@ -78,6 +81,98 @@ class TestIncrementalLoad:
         assert stats.loaded == batch_size
 
 
+def _rows(conn: sqlite3.Connection) -> list[tuple]:
+    return conn.execute("SELECT id, name, modified_at FROM events ORDER BY id").fetchall()
+
+
+class TestStreamingLoad:
+    @pytest.mark.parametrize("chunk_size", [1, 4, 1000])
+    def test_matches_batch_load(self, chunk_size: int) -> None:
+        rng = random.Random(chunk_size)
+        records = [
+            {"id": rng.randint(1, 15), "name": f"n{i}", "modified_at": f"2025-01-{rng.randint(1, 28):02d}"}
+            for i in range(60)
+        ]
+        batch, stream = sqlite3.connect(":memory:"), sqlite3.connect(":memory:")
+        init_db(batch)
+        init_db(stream)
+        for part in (records[:30], records[30:]):
+            expected = incremental_load(batch, part)
+            stats = incremental_load_stream(stream, iter(part), chunk_size=chunk_size)
+            assert (stats.loaded, stats.skipped, stats.total_source) == (
+                expected.loaded, expected.skipped, expected.total_source)
+            assert stats.new_watermark == expected.new_watermark
+        assert _rows(stream) == _rows(batch)
+
+    def test_resume_after_crash(self, conn: sqlite3.Connection) -> None:
+        records = [
+            {"id": i, "name": f"e{i}", "modified_at": f"2025-02-{i:02d}"} for i in range(1, 11)
+        ]
+
+        def crashing():
+            yield from records[:7]
+            raise RuntimeError("process killed")
+
+        with pytest.raises(RuntimeError):
+            incremental_load_stream(conn, crashing(), chunk_size=3)
+        # Two full chunks (6 rows) were committed; the partial third was not.
+        # The watermark holds back 02-06, which the next chunk could repeat.
+        assert count_events(conn) == 6
+        assert get_watermark(conn, "events") == "2025-02-05"
+
+        stats = incremental_load_stream(conn, iter(records), chunk_size=3)
+        assert stats.skipped == 5
+        assert stats.loaded == 5
+        assert count_events(conn) == 10
+        assert get_watermark(conn, "events") == "2025-02-10"
+
+    def test_resume_with_ties_across_chunk_boundary(self, conn: sqlite3.Connection) -> None:
+        records = [{"id": i, "name": f"e{i}", "modified_at": "2025-02-01"} for i in range(1, 5)]
+        records.append({"id": 5, "name": "e5", "modified_at": "2025-02-02"})
+
+        def crashing():
+            yield from records[:2]
+            raise RuntimeError("process killed")
+
+        with pytest.raises(RuntimeError):
+            incremental_load_stream(conn, crashing(), chunk_size=2)
+        assert count_events(conn) == 2
+        assert get_watermark(conn, "events") is None
+
+        stats = incremental_load_stream(conn, iter(records), chunk_size=2)
+        assert stats.skipped == 0
+        assert count_events(conn) == 5
+        assert get_watermark(conn, "events") == "2025-02-02"
+
+    def test_warns_on_unordered_source(
+        self, conn: sqlite3.Connection, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        records = [
+            {"id": 1, "name": "late", "modified_at": "2025-03-05"},
+            {"id": 2, "name": "early", "modified_at": "2025-03-01"},
+        ]
+        stats = incremental_load_stream(conn, records, chunk_size=1)
+        assert stats.loaded == 2
+        assert "not ordered" in caplog.text
+
+    def test_rejects_bad_chunk_size(self, conn: sqlite3.Connection) -> None:
+        with pytest.raises(ValueError):
+            incremental_load_stream(conn, [], chunk_size=0)
+
+
+@pytest.mark.integration
+def test_run_streams_csv(tmp_path) -> None:
+    inp = tmp_path / "events.csv"
+    inp.write_text(
+        "id,name,modified_at\n"
+        + "".join(f"{r['id']},{r['name']},{r['modified_at']}\n" for r in BATCH_1),
+        encoding="utf-8",
+    )
+    summary = run(inp, tmp_path / "out.json", chunk_size=1)
+    assert summary["loaded"] == 2
+    assert summary["new_watermark"] == "2025-01-01T11:00:00"
+
+
 @pytest.mark.integration
 def test_run_end_to_end(tmp_path) -> None:
     inp = tmp_path / "events.json"
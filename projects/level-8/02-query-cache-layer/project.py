@@ -12,16 +12,21 @@ Concepts practised:
     - dataclasses for cache entries and statistics
     - decorator pattern for transparent caching
     - cache invalidation strategies
+    - lock striping (sharding) for thread-safe concurrent access
+    - expiry heaps for amortised TTL cleanup without full scans
+    - request coalescing (single-flight) and stale-while-revalidate
 """
 
 from __future__ import annotations
 
 import argparse
+import heapq
 import json
+import threading
 import time
 from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, Callable
+from typing import Any, Callable, Hashable
 
 
 # --- Domain types -------------------------------------------------------
@@ -30,7 +35,9 @@ from typing import Any, Callable
 # TTL expiration or eviction callbacks. Understanding OrderedDict-based LRU
 # internals prepares you for tuning production caches (Redis, Memcached)
 # where eviction policy, TTL, and hit-rate monitoring all matter.
-@dataclass
+# WHY slots=True? -- a cache can hold millions of entries. Slots drop the
+# per-instance __dict__, cutting memory per entry and speeding attribute access.
+@dataclass(slots=True)
 class CacheEntry:
     """A single cached value with metadata."""
     key: str
@@ -47,6 +54,11 @@ class CacheEntry:
         # preventing false expirations.
         return (time.monotonic() - self.created_at) > self.ttl_seconds
 
+    @property
+    def expires_at(self) -> float:
+        """Monotonic timestamp after which this entry is expired."""
+        return self.created_at + self.ttl_seconds
+
 
 @dataclass
 class CacheStats:
@@ -109,6 +121,10 @@ class LRUCache:
     def size(self) -> int:
         return len(self._store)
 
+    @property
+    def default_ttl(self) -> float:
+        return self._default_ttl
+
     def get(self, key: str) -> Any | None:
         """Retrieve a value by key, returning None on miss or expiration."""
         if key not in self._store:
@@ -160,8 +176,11 @@ class LRUCache:
         return False
 
     def clear(self) -> None:
-        """Remove all entries from the cache."""
-        self._store.clear()
+        """Remove all entries from the cache, notifying on_evict for each."""
+        entries, self._store = self._store, OrderedDict()
+        if self._on_evict:
+            for key, entry in entries.items():
+                self._on_evict(key, entry.value)
 
     def keys(self) -> list[str]:
         """Return all non-expired keys in LRU order (oldest first)."""
@@ -187,26 +206,326 @@ class LRUCache:
             self._on_evict(key, entry.value)
 
 
+# --- Sharded, thread-safe LRU cache -------------------------------------
+
+class _CacheShard:
+    """One lock-protected slice of a ShardedLRUCache.
+
+    Holds its own OrderedDict (LRU order), expiry heap, stats, and lock.
+    Callers must hold ``lock`` while calling any method.
+    """
+
+    __slots__ = ("lock", "store", "heap", "stats", "capacity")
+
+    def __init__(self, capacity: int) -> None:
+        self.lock = threading.Lock()
+        self.store: OrderedDict[str, CacheEntry] = OrderedDict()
+        # (expires_at, key) pairs. Entries made stale by updates or removals
+        # stay in the heap and are skipped when they reach the top.
+        self.heap: list[tuple[float, str]] = []
+        self.stats = CacheStats()
+        self.capacity = capacity
+
+    def purge_expired(self, now: float, evicted: list[tuple[str, Any]]) -> None:
+        """Pop every expired entry off the heap top — amortised O(log n) each."""
+        heap = self.heap
+        while heap and heap[0][0] < now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self.store.get(key)
+            # Skip heap records that no longer match the live entry.
+            if entry is not None and entry.expires_at == expires_at:
+                del self.store[key]
+                self.stats.expirations += 1
+                evicted.append((key, entry.value))
+        # WHY compact? -- repeated updates leave stale heap records behind.
+        # Rebuilding when the heap is twice the live size keeps memory bounded.
+        if len(heap) > 2 * len(self.store) + 64:
+            self.heap = [(e.expires_at, k) for k, e in self.store.items()]
+            heapq.heapify(self.heap)
+
+
+class ShardedLRUCache:
+    """Thread-safe LRU cache with TTL, split into independently locked shards.
+
+    Drop-in replacement for LRUCache (same get/put/invalidate/clear/keys API,
+    works with @cached). Keys are hashed to one of ``shards`` partitions, each
+    with its own lock, so threads touching different keys rarely contend.
+
+    Trade-offs versus LRUCache:
+        - LRU order is tracked per shard, so eviction picks the oldest entry
+          in the *key's shard*, not the globally oldest entry.
+        - Capacity is divided evenly across shards (rounded up).
+        - Expired entries are removed from an expiry heap on every operation
+          that touches a shard, so keys() never scans the whole cache.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 128,
+        default_ttl: float = 60.0,
+        on_evict: Callable[[str, Any], None] | None = None,
+        shards: int = 16,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("Cache capacity must be at least 1")
+        if shards < 1:
+            raise ValueError("Shard count must be at least 1")
+        shards = min(shards, capacity)
+        per_shard = -(-capacity // shards)  # ceiling division
+        self._capacity = capacity
+        self._default_ttl = default_ttl
+        self._on_evict = on_evict
+        self._shards = [_CacheShard(per_shard) for _ in range(shards)]
+
+    def _shard_for(self, key: str) -> _CacheShard:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def _notify(self, evicted: list[tuple[str, Any]]) -> None:
+        # WHY call back outside the lock? -- a callback that touches the
+        # cache again would otherwise deadlock on the shard's lock.
+        if self._on_evict:
+            for key, value in evicted:
+                self._on_evict(key, value)
+
+    @property
+    def stats(self) -> CacheStats:
+        """Aggregate a snapshot of statistics across all shards."""
+        total = CacheStats()
+        for shard in self._shards:
+            with shard.lock:
+                total.hits += shard.stats.hits
+                total.misses += shard.stats.misses
+                total.evictions += shard.stats.evictions
+                total.expirations += shard.stats.expirations
+        return total
+
+    @property
+    def size(self) -> int:
+        return sum(len(shard.store) for shard in self._shards)
+
+    @property
+    def default_ttl(self) -> float:
+        return self._default_ttl
+
+    def get(self, key: str) -> Any | None:
+        """Retrieve a value by key, returning None on miss or expiration."""
+        shard = self._shard_for(key)
+        evicted: list[tuple[str, Any]] = []
+        with shard.lock:
+            shard.purge_expired(time.monotonic(), evicted)
+            entry = shard.store.get(key)
+            if entry is None:
+                shard.stats.misses += 1
+                value = None
+            else:
+                shard.store.move_to_end(key)
+                entry.access_count += 1
+                shard.stats.hits += 1
+                value = entry.value
+        self._notify(evicted)
+        return value
+
+    def put(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Insert or update a cache entry."""
+        effective_ttl = ttl if ttl is not None else self._default_ttl
+        shard = self._shard_for(key)
+        evicted: list[tuple[str, Any]] = []
+        with shard.lock:
+            now = time.monotonic()
+            shard.purge_expired(now, evicted)
+            entry = shard.store.get(key)
+            if entry is not None:
+                # Reuse the existing entry instead of allocating a new one.
+                entry.value = value
+                entry.created_at = now
+                entry.ttl_seconds = effective_ttl
+                shard.store.move_to_end(key)
+            else:
+                if len(shard.store) >= shard.capacity:
+                    old_key, old_entry = shard.store.popitem(last=False)
+                    shard.stats.evictions += 1
+                    evicted.append((old_key, old_entry.value))
+                entry = CacheEntry(key=key, value=value, created_at=now, ttl_seconds=effective_ttl)
+                shard.store[key] = entry
+            heapq.heappush(shard.heap, (entry.expires_at, key))
+        self._notify(evicted)
+
+    def invalidate(self, key: str) -> bool:
+        """Remove a specific key. Returns True if key existed."""
+        shard = self._shard_for(key)
+        with shard.lock:
+            entry = shard.store.pop(key, None)
+        if entry is None:
+            return False
+        self._notify([(key, entry.value)])
+        return True
+
+    def clear(self) -> None:
+        """Remove all entries from the cache, notifying on_evict for each."""
+        evicted: list[tuple[str, Any]] = []
+        for shard in self._shards:
+            with shard.lock:
+                evicted.extend((key, entry.value) for key, entry in shard.store.items())
+                shard.store.clear()
+                shard.heap.clear()
+        self._notify(evicted)
+
+    def keys(self) -> list[str]:
+        """Return all non-expired keys, shard by shard, oldest first within each."""
+        result: list[str] = []
+        evicted: list[tuple[str, Any]] = []
+        now = time.monotonic()
+        for shard in self._shards:
+            with shard.lock:
+                shard.purge_expired(now, evicted)
+                result.extend(shard.store.keys())
+        self._notify(evicted)
+        return result
+
+
 # --- Decorator for transparent caching ----------------------------------
 
-def cached(cache: LRUCache, ttl: float | None = None) -> Callable:
+def make_cache_key(func: Callable, args: tuple, kwargs: dict[str, Any]) -> Hashable:
+    """Build a cache key from a function and its call arguments.
+
+    WHY tuples instead of repr() strings? -- hashing a tuple of the original
+    arguments is far cheaper than formatting every argument with repr() and
+    joining the pieces, and it cannot collide the way two different objects
+    with the same repr() can. Positional and keyword arguments always sit in
+    separate slots, and argument types are part of the key (like
+    functools.lru_cache(typed=True)), because 1 == True == 1.0 would
+    otherwise share one entry. Unhashable arguments (lists, dicts) fall back
+    to the repr-based string key.
+    """
+    name = func.__qualname__
+    kw_items = tuple(sorted(kwargs.items()))
+    types = tuple(type(a) for a in args) + tuple(type(v) for _, v in kw_items)
+    key: tuple = (name, args, kw_items, types)
+    try:
+        hash(key)
+    except TypeError:
+        key_parts = [name] + [repr(a) for a in args]
+        key_parts += [f"{k}={repr(v)}" for k, v in sorted(kwargs.items())]
+        return "|".join(key_parts)
+    return key
+
+
+class _Flight:
+    """A computation in progress that other callers can wait on."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+def cached(
+    cache: LRUCache | ShardedLRUCache,
+    ttl: float | None = None,
+    single_flight: bool = False,
+    stale_ttl: float | None = None,
+) -> Callable:
     """Decorator that transparently caches function results.
 
-    The cache key is built from the function name and its arguments.
+    The cache key is built from the function name and its arguments
+    (see make_cache_key).
+
+    Args:
+        cache: Cache that stores results.
+        ttl: Seconds a result stays fresh (defaults to the cache's TTL).
+        single_flight: If True, concurrent misses on the same key wait for
+            one in-flight call instead of each running the function — this
+            prevents a "stampede" when a hot key expires.
+        stale_ttl: If set, enables stale-while-revalidate: for this many
+            seconds after a result goes stale it is still returned
+            immediately while a background thread refreshes it. Stored
+            cache values become ``(result, fresh_until)`` pairs.
     """
     def decorator(func: Callable) -> Callable:
-        def wrapper(*args: Any, **kwargs: Any) -> Any:
-            key_parts = [func.__name__] + [repr(a) for a in args]
-            key_parts += [f"{k}={repr(v)}" for k, v in sorted(kwargs.items())]
-            cache_key = "|".join(key_parts)
-
-            result = cache.get(cache_key)
-            if result is not None:
-                return result
+        in_flight: dict[Hashable, _Flight] = {}
+        in_flight_lock = threading.Lock()
+        fresh_ttl = ttl if ttl is not None else cache.default_ttl
 
+        def compute(cache_key: Hashable, args: tuple, kwargs: dict[str, Any]) -> Any:
             result = func(*args, **kwargs)
-            cache.put(cache_key, result, ttl=ttl)
+            if stale_ttl is None:
+                cache.put(cache_key, result, ttl=ttl)
+            elif result is not None:
+                # Keep the entry past its fresh window so it can be served stale.
+                cache.put(cache_key, (result, time.monotonic() + fresh_ttl), ttl=fresh_ttl + stale_ttl)
             return result
+
+        def lead(cache_key: Hashable, flight: _Flight, args: tuple, kwargs: dict[str, Any]) -> Any:
+            """Run compute() for a flight already registered in in_flight."""
+            try:
+                flight.result = compute(cache_key, args, kwargs)
+            except BaseException as exc:
+                flight.error = exc
+                raise
+            finally:
+                with in_flight_lock:
+                    del in_flight[cache_key]
+                flight.done.set()
+            return flight.result
+
+        def coalesced(cache_key: Hashable, args: tuple, kwargs: dict[str, Any]) -> Any:
+            """Run compute() once per key; concurrent callers share its outcome."""
+            with in_flight_lock:
+                flight = in_flight.get(cache_key)
+                leader = flight is None
+                if leader:
+                    flight = in_flight[cache_key] = _Flight()
+            if not leader:
+                flight.done.wait()
+                if flight.error is not None:
+                    raise flight.error
+                return flight.result
+            return lead(cache_key, flight, args, kwargs)
+
+        def refresh_in_background(cache_key: Hashable, args: tuple, kwargs: dict[str, Any]) -> None:
+            # WHY register the flight here, not in the thread? -- Checking and
+            # claiming the key under one lock means two stale hits racing in
+            # can never both start a refresh.
+            with in_flight_lock:
+                if cache_key in in_flight:
+                    return  # a refresh for this key is already running
+                flight = in_flight[cache_key] = _Flight()
+
+            def run() -> None:
+                try:
+                    lead(cache_key, flight, args, kwargs)
+                except Exception:
+                    pass  # keep serving the stale value; the next miss retries
+
+            try:
+                threading.Thread(target=run, daemon=True).start()
+            except BaseException as exc:
+                # Release the claim so waiters and later refreshes are not stuck.
+                flight.error = exc
+                with in_flight_lock:
+                    del in_flight[cache_key]
+                flight.done.set()
+                raise
+
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            cache_key = make_cache_key(func, args, kwargs)
+            load = coalesced if single_flight or stale_ttl is not None else compute
+
+            entry = cache.get(cache_key)
+            if stale_ttl is None:
+                if entry is not None:
+                    return entry
+                return load(cache_key, args, kwargs)
+
+            if entry is not None:
+                result, fresh_until = entry
+                if time.monotonic() > fresh_until:
+                    refresh_in_background(cache_key, args, kwargs)
+                return result
+            return load(cache_key, args, kwargs)
+
         wrapper.__wrapped__ = func  # type: ignore[attr-defined]
         return wrapper
     return decorator
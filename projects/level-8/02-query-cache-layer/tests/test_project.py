@@ -1,16 +1,19 @@
 """Tests for Query Cache Layer.
 
-Covers: LRU eviction, TTL expiration, statistics, decorator, and edge cases.
+Covers: LRU eviction, TTL expiration, statistics, decorator, sharded
+thread-safe cache, single-flight and stale-while-revalidate caching,
+and edge cases.
 """
 
 from __future__ import annotations
 
+import threading
 import time
 from typing import Any
 
 import pytest
 
-from project import CacheStats, LRUCache, cached
+from project import CacheStats, LRUCache, ShardedLRUCache, cached, make_cache_key
 
 
 # --- Fixtures -----------------------------------------------------------
@@ -137,3 +140,213 @@ class TestEvictionCallback:
         cache.put("c", 3)  # evicts "a"
         assert len(evicted) == 1
         assert evicted[0] == ("a", 1)
+
+
+    @pytest.mark.parametrize("cache_cls", [LRUCache, ShardedLRUCache])
+    def test_clear_notifies_each_entry(self, cache_cls: type) -> None:
+        evicted: list[tuple[str, Any]] = []
+        cache = cache_cls(capacity=4, default_ttl=60.0, on_evict=lambda k, v: evicted.append((k, v)))
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.clear()
+        assert cache.size == 0
+        assert sorted(evicted) == [("a", 1), ("b", 2)]
+
+# --- Sharded thread-safe cache ------------------------------------------
+
+class TestShardedLRUCache:
+    def test_put_get_and_stats(self) -> None:
+        cache = ShardedLRUCache(capacity=32, default_ttl=60.0, shards=4)
+        cache.put("a", 1)
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    def test_single_shard_evicts_lru(self) -> None:
+        evicted: list[tuple[str, Any]] = []
+        cache = ShardedLRUCache(
+            capacity=2, default_ttl=60.0, shards=1,
+            on_evict=lambda k, v: evicted.append((k, v)),
+        )
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.put("c", 3)
+        assert evicted == [("b", 2)]
+        assert cache.keys() == ["a", "c"]
+
+    def test_update_keeps_single_entry(self) -> None:
+        cache = ShardedLRUCache(capacity=4, default_ttl=60.0, shards=1)
+        for i in range(100):
+            cache.put("k", i)
+        assert cache.size == 1
+        assert cache.get("k") == 99
+
+    def test_decorator_works_unchanged(self) -> None:
+        cache = ShardedLRUCache(capacity=10, default_ttl=60.0)
+        calls = 0
+
+        @cached(cache)
+        def double(x: int) -> int:
+            nonlocal calls
+            calls += 1
+            return x * 2
+
+        assert double(4) == 8
+        assert double(4) == 8
+        assert calls == 1
+
+    def test_concurrent_access_stays_consistent(self) -> None:
+        cache = ShardedLRUCache(capacity=64, default_ttl=60.0, shards=8)
+        ops_per_thread = 500
+
+        def worker(tid: int) -> None:
+            for i in range(ops_per_thread):
+                key = f"k{(tid * 7 + i) % 100}"
+                cache.put(key, i)
+                cache.get(key)
+
+        threads = [threading.Thread(target=worker, args=(t,)) for t in range(16)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        stats = cache.stats
+        assert stats.total_requests == 16 * ops_per_thread
+        assert cache.size <= 64
+        assert len(cache.keys()) == cache.size
+
+    @pytest.mark.slow
+    def test_expired_entries_purged_without_scan(self) -> None:
+        cache = ShardedLRUCache(capacity=10, default_ttl=0.05, shards=1)
+        cache.put("old", 1)
+        cache.put("fresh", 2, ttl=60.0)
+        time.sleep(0.06)
+        cache.get("fresh")  # any shard operation pops expired heap entries
+        assert cache.size == 1
+        assert cache.stats.expirations == 1
+
+
+# --- Cache keys, single-flight, and stale-while-revalidate --------------
+
+def _sample(a: Any, b: Any = None) -> None:
+    return None
+
+
+class TestMakeCacheKey:
+    def test_equal_arguments_give_equal_keys(self) -> None:
+        assert make_cache_key(_sample, (1,), {"b": 2}) == make_cache_key(_sample, (1,), {"b": 2})
+
+    def test_distinguishes_values_with_same_repr_type(self) -> None:
+        assert make_cache_key(_sample, (1,), {}) != make_cache_key(_sample, ("1",), {})
+
+    def test_equal_values_of_different_types_get_different_keys(self) -> None:
+        keys = {make_cache_key(_sample, (v,), {}) for v in (1, True, 1.0)}
+        assert len(keys) == 3
+        assert make_cache_key(_sample, (), {"a": 1}) != make_cache_key(_sample, (), {"a": True})
+
+    def test_positional_tuple_cannot_mimic_keyword_form(self) -> None:
+        mimic = make_cache_key(_sample, ((1,), (("b", 2),)), {})
+        assert mimic != make_cache_key(_sample, (1,), {"b": 2})
+
+    def test_unhashable_arguments_fall_back_to_string(self) -> None:
+        key = make_cache_key(_sample, ([1, 2],), {})
+        assert isinstance(key, str)
+        assert "[1, 2]" in key
+
+
+@pytest.mark.slow
+class TestSingleFlight:
+    def test_concurrent_misses_run_once(self) -> None:
+        cache = ShardedLRUCache(capacity=10, default_ttl=60.0)
+        calls = 0
+        calls_lock = threading.Lock()
+
+        @cached(cache, single_flight=True)
+        def slow_query(q: str) -> str:
+            nonlocal calls
+            with calls_lock:
+                calls += 1
+            time.sleep(0.05)
+            return f"rows for {q}"
+
+        results: list[str] = []
+        threads = [
+            threading.Thread(target=lambda: results.append(slow_query("users")))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert calls == 1
+        assert results == ["rows for users"] * 8
+
+    def test_errors_propagate_to_waiters(self) -> None:
+        cache = LRUCache(capacity=10, default_ttl=60.0)
+
+        @cached(cache, single_flight=True)
+        def broken() -> None:
+            time.sleep(0.02)
+            raise RuntimeError("backend down")
+
+        errors: list[BaseException] = []
+
+        def call() -> None:
+            try:
+                broken()
+            except RuntimeError as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=call) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(errors) == 4
+
+
+@pytest.mark.slow
+class TestStaleWhileRevalidate:
+    def test_serves_stale_then_refreshes(self) -> None:
+        cache = LRUCache(capacity=10, default_ttl=60.0)
+        version = 0
+
+        @cached(cache, ttl=0.05, stale_ttl=60.0)
+        def report() -> int:
+            nonlocal version
+            version += 1
+            return version
+
+        assert report() == 1
+        time.sleep(0.06)
+        assert report() == 1  # stale value returned immediately
+
+        deadline = time.monotonic() + 2.0
+        while report() != 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert report() == 2
+        assert version == 2
+
+    def test_racing_stale_hits_start_one_refresh(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        started: list[threading.Thread] = []
+        monkeypatch.setattr(threading.Thread, "start", lambda self: started.append(self))
+        cache = LRUCache(capacity=10, default_ttl=60.0)
+        calls = 0
+
+        @cached(cache, ttl=0.01, stale_ttl=60.0)
+        def report() -> int:
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert report() == 1
+        time.sleep(0.02)
+        assert report() == 1 and report() == 1  # both hits see the stale value
+        assert len(started) == 1  # the second hit found the refresh already claimed
+        started[0].run()
+        assert calls == 2
+        assert report() == 2
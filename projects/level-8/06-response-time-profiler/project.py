@@ -12,6 +12,7 @@ Concepts practised:
     - percentile calculation (p50, p90, p95, p99)
     - dataclasses for profile results
     - statistical distribution analysis
+    - streaming quantile sketches (DDSketch-style) and Welford's algorithm
 """
 
 from __future__ import annotations
@@ -94,6 +95,116 @@ def std_dev(values: list[float], mean: float) -> float:
     return math.sqrt(variance)
 
 
+# --- Streaming sketch ---------------------------------------------------
+
+# WHY a sketch instead of keeping every duration? -- a busy endpoint records
+# millions of timings. Storing them all costs unbounded memory, and each
+# report has to sort the whole list. A DDSketch-style histogram stores counts
+# in logarithmic buckets instead: any quantile is reported within a fixed
+# *relative* error (1% by default), memory depends only on the range of
+# values (not how many were recorded), and two sketches merge by adding
+# bucket counts — so per-process sketches can be combined centrally.
+class LatencySketch:
+    """Mergeable, bounded-memory summary of a stream of durations.
+
+    Quantiles come from log-spaced buckets with ``relative_accuracy`` error.
+    Mean and variance use Welford's online algorithm, which stays
+    numerically stable without storing the values. Min, max, count, and
+    total are exact.
+    """
+
+    __slots__ = ("relative_accuracy", "_gamma", "_log_gamma", "_buckets",
+                 "_zero_count", "count", "total", "min", "max", "_mean", "_m2")
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: dict[int, int] = {}
+        self._zero_count = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def add(self, value: float) -> None:
+        """Record one duration in O(1)."""
+        if value <= 0:
+            self._zero_count += 1
+        else:
+            index = math.ceil(math.log(value) / self._log_gamma)
+            self._buckets[index] = self._buckets.get(index, 0) + 1
+
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        # Welford's update: running mean and sum of squared deviations.
+        delta = value - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (value - self._mean)
+
+    @property
+    def mean(self) -> float:
+        return self._mean if self.count else 0.0
+
+    @property
+    def std_dev(self) -> float:
+        """Population standard deviation, matching std_dev()."""
+        if self.count < 2:
+            return 0.0
+        return math.sqrt(self._m2 / self.count)
+
+    @property
+    def bucket_count(self) -> int:
+        """Number of non-empty buckets — the sketch's memory footprint."""
+        return len(self._buckets) + (1 if self._zero_count else 0)
+
+    def quantile(self, pct: float) -> float:
+        """Estimate the ``pct``-th percentile (0-100).
+
+        Cost depends on the number of buckets, not on how many values were
+        recorded.
+        """
+        if self.count == 0:
+            return 0.0
+        rank = (pct / 100.0) * (self.count - 1)
+        seen = self._zero_count
+        if rank < seen:
+            return max(self.min, 0.0)
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if rank < seen:
+                # Midpoint of the bucket (gamma^(i-1), gamma^i] in relative terms.
+                estimate = 2 * self._gamma ** index / (self._gamma + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    def merge(self, other: LatencySketch) -> None:
+        """Fold another sketch's data into this one."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Can only merge sketches with the same relative_accuracy")
+        if other.count == 0:
+            return
+        for index, n in other._buckets.items():
+            self._buckets[index] = self._buckets.get(index, 0) + n
+        self._zero_count += other._zero_count
+
+        # Chan et al.'s parallel combination of Welford statistics.
+        count = self.count + other.count
+        delta = other._mean - self._mean
+        self._mean += delta * other.count / count
+        self._m2 += other._m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+
 # --- Profiler -----------------------------------------------------------
 
 class ResponseTimeProfiler:
@@ -111,17 +222,39 @@ class ResponseTimeProfiler:
             ...
 
         report = profiler.report("my_function")
+
+    Pass ``use_sketch=True`` to summarise each series in a LatencySketch
+    instead of keeping every duration: memory stays bounded, reports no
+    longer sort, and percentiles are accurate to ``relative_accuracy``.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, use_sketch: bool = False, relative_accuracy: float = 0.01) -> None:
         self._records: dict[str, list[float]] = {}
+        self._sketches: dict[str, LatencySketch] = {}
+        self._use_sketch = use_sketch
+        self._relative_accuracy = relative_accuracy
 
     def record(self, name: str, duration_ms: float) -> None:
         """Record a timing measurement."""
+        if self._use_sketch:
+            sketch = self._sketches.get(name)
+            if sketch is None:
+                sketch = self._sketches[name] = LatencySketch(self._relative_accuracy)
+            sketch.add(duration_ms)
+            return
         if name not in self._records:
             self._records[name] = []
         self._records[name].append(duration_ms)
 
+    def merge(self, other: ResponseTimeProfiler) -> None:
+        """Combine another sketch-mode profiler's data (e.g. from another process)."""
+        if not (self._use_sketch and other._use_sketch):
+            raise ValueError("merge() requires both profilers to use sketches")
+        for name, sketch in other._sketches.items():
+            if name not in self._sketches:
+                self._sketches[name] = LatencySketch(self._relative_accuracy)
+            self._sketches[name].merge(sketch)
+
     @contextmanager
     def measure(self, name: str) -> Generator[None, None, None]:
         """Context manager that times the enclosed block."""
@@ -147,6 +280,8 @@ class ResponseTimeProfiler:
 
     def report(self, name: str) -> ProfileReport:
         """Generate a statistical report for a profiled function."""
+        if self._use_sketch:
+            return self._sketch_report(name)
         durations = self._records.get(name, [])
         if not durations:
             return ProfileReport(
@@ -175,16 +310,48 @@ class ResponseTimeProfiler:
             std_dev_ms=std_dev(sorted_d, mean),
         )
 
+    def _sketch_report(self, name: str) -> ProfileReport:
+        """Build a report from a series' sketch without touching raw data."""
+        sketch = self._sketches.get(name)
+        if sketch is None or sketch.count == 0:
+            return ProfileReport(
+                function_name=name, call_count=0,
+                total_ms=0, mean_ms=0, median_ms=0,
+                p90_ms=0, p95_ms=0, p99_ms=0,
+                min_ms=0, max_ms=0, std_dev_ms=0,
+            )
+        return ProfileReport(
+            function_name=name,
+            call_count=sketch.count,
+            total_ms=sketch.total,
+            mean_ms=sketch.mean,
+            median_ms=sketch.quantile(50),
+            p90_ms=sketch.quantile(90),
+            p95_ms=sketch.quantile(95),
+            p99_ms=sketch.quantile(99),
+            min_ms=sketch.min,
+            max_ms=sketch.max,
+            std_dev_ms=sketch.std_dev,
+        )
+
     def all_reports(self) -> list[ProfileReport]:
         """Generate reports for all tracked functions."""
-        return [self.report(name) for name in sorted(self._records)]
+        return [self.report(name) for name in self.names()]
 
     def names(self) -> list[str]:
         """Return names of all profiled functions."""
+        if self._use_sketch:
+            return sorted(self._sketches.keys())
         return sorted(self._records.keys())
 
     def find_bottleneck(self) -> ProfileReport | None:
         """Identify the function with the highest p95 latency."""
+        if self._use_sketch:
+            if not self._sketches:
+                return None
+            # Compare p95 straight from the sketches; build one full report.
+            slowest = max(self._sketches, key=lambda n: self._sketches[n].quantile(95))
+            return self.report(slowest)
         reports = self.all_reports()
         if not reports:
             return None
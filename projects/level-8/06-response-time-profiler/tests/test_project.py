@@ -1,6 +1,7 @@
 """Tests for Response Time Profiler.
 
-Covers: percentile math, profiler recording, decorator, context manager, reports.
+Covers: percentile math, profiler recording, decorator, context manager, reports,
+and the streaming sketch mode.
 """
 
 from __future__ import annotations
@@ -9,7 +10,7 @@ import time
 
 import pytest
 
-from project import ProfileReport, ResponseTimeProfiler, percentile, std_dev
+from project import LatencySketch, ProfileReport, ResponseTimeProfiler, percentile, std_dev
 
 
 # --- Fixtures -----------------------------------------------------------
@@ -107,3 +108,73 @@ class TestBottleneck:
 
     def test_no_data_returns_none(self, profiler: ResponseTimeProfiler) -> None:
         assert profiler.find_bottleneck() is None
+
+
+# --- Streaming sketch mode ----------------------------------------------
+
+class TestLatencySketch:
+    def test_quantiles_within_relative_accuracy(self) -> None:
+        values = [float(v) for v in range(1, 1001)]
+        sketch = LatencySketch(relative_accuracy=0.01)
+        for v in values:
+            sketch.add(v)
+        for pct in (50, 90, 95, 99):
+            exact = percentile(values, pct)
+            assert sketch.quantile(pct) == pytest.approx(exact, rel=0.02)
+
+    def test_welford_matches_exact_stats(self) -> None:
+        values = [2.0, 4.0, 4.0, 4.0, 5.0, 5.0, 7.0, 9.0]
+        sketch = LatencySketch()
+        for v in values:
+            sketch.add(v)
+        mean = sum(values) / len(values)
+        assert sketch.mean == pytest.approx(mean)
+        assert sketch.std_dev == pytest.approx(std_dev(values, mean))
+        assert (sketch.min, sketch.max, sketch.count) == (2.0, 9.0, 8)
+
+    def test_memory_is_bounded(self) -> None:
+        sketch = LatencySketch()
+        for i in range(50_000):
+            sketch.add(1.0 + (i % 100))
+        assert sketch.count == 50_000
+        assert sketch.bucket_count < 300
+
+    def test_merge_equals_single_sketch(self) -> None:
+        combined, left, right = LatencySketch(), LatencySketch(), LatencySketch()
+        for v in range(1, 501):
+            combined.add(float(v))
+            (left if v % 2 else right).add(float(v))
+        left.merge(right)
+        assert left.count == combined.count
+        assert left.mean == pytest.approx(combined.mean)
+        assert left.std_dev == pytest.approx(combined.std_dev)
+        assert left.quantile(99) == combined.quantile(99)
+
+
+class TestSketchProfiler:
+    def test_report_matches_exact_mode(self) -> None:
+        exact = ResponseTimeProfiler()
+        sketched = ResponseTimeProfiler(use_sketch=True)
+        for v in range(1, 201):
+            exact.record("op", float(v))
+            sketched.record("op", float(v))
+        a, b = exact.report("op"), sketched.report("op")
+        assert b.call_count == a.call_count
+        assert b.total_ms == pytest.approx(a.total_ms)
+        assert b.std_dev_ms == pytest.approx(a.std_dev_ms)
+        assert b.p95_ms == pytest.approx(a.p95_ms, rel=0.02)
+
+    def test_bottleneck_and_merge(self) -> None:
+        first = ResponseTimeProfiler(use_sketch=True)
+        second = ResponseTimeProfiler(use_sketch=True)
+        first.record("fast", 1.0)
+        second.record("slow", 100.0)
+        first.merge(second)
+        assert first.names() == ["fast", "slow"]
+        bottleneck = first.find_bottleneck()
+        assert bottleneck is not None
+        assert bottleneck.function_name == "slow"
+
+    def test_merge_requires_sketch_mode(self) -> None:
+        with pytest.raises(ValueError, match="sketches"):
+            ResponseTimeProfiler().merge(ResponseTimeProfiler(use_sketch=True))
@@ -12,17 +12,20 @@ Concepts practised:
     - service level tiers with feature flags
     - state machine transitions
     - dataclasses for configuration and status
+    - O(1) running counters and time-bucketed rolling windows
+    - thread safety with a lock-free fast path
 """
 
 from __future__ import annotations
 
 import argparse
 import json
+import threading
 import time
 from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import Any, Callable
 
 
 # --- Domain types -------------------------------------------------------
@@ -53,6 +56,8 @@ class DegradationConfig:
     error_rate_minimal: float = 0.30   # 30% errors -> minimal
     error_rate_offline: float = 0.50   # 50% errors -> offline
     window_size: int = 100             # sliding window size
+    window_seconds: float | None = None  # if set, use a time-bucketed window instead
+    bucket_seconds: float = 1.0        # bucket width for the time-bucketed window
     recovery_wait_seconds: float = 30  # time before attempting recovery
     half_open_max_requests: int = 5    # test requests in half-open state
 
@@ -103,15 +108,27 @@ class SlidingWindowTracker:
 
     def __init__(self, window_size: int = 100) -> None:
         self._window: deque[bool] = deque(maxlen=window_size)
+        self._window_failures = 0
         self._total_requests = 0
         self._total_errors = 0
 
+    def _append(self, ok: bool) -> None:
+        # WHY count on the way in and out? -- re-counting failures on every
+        # read is O(window). Adjusting a counter when an outcome enters the
+        # window and when the deque pushes the oldest one out keeps
+        # error_rate O(1).
+        if len(self._window) == self._window.maxlen and not self._window[0]:
+            self._window_failures -= 1
+        self._window.append(ok)
+        if not ok:
+            self._window_failures += 1
+
     def record_success(self) -> None:
-        self._window.append(True)
+        self._append(True)
         self._total_requests += 1
 
     def record_failure(self) -> None:
-        self._window.append(False)
+        self._append(False)
         self._total_requests += 1
         self._total_errors += 1
 
@@ -120,8 +137,7 @@ class SlidingWindowTracker:
         """Current error rate within the sliding window."""
         if not self._window:
             return 0.0
-        failures = sum(1 for ok in self._window if not ok)
-        return failures / len(self._window)
+        return self._window_failures / len(self._window)
 
     @property
     def total_requests(self) -> int:
@@ -136,6 +152,87 @@ class SlidingWindowTracker:
         return len(self._window)
 
 
+class TimeBucketedWindowTracker:
+    """Tracks success/failure over the last ``window_seconds`` of wall time.
+
+    Outcomes are counted into fixed-width time buckets held in a ring. When
+    time moves past a bucket it is zeroed and its counts subtracted from
+    running totals, so recording and reading are O(1) regardless of
+    traffic. Unlike SlidingWindowTracker, a quiet period lets old errors
+    age out even when no new requests arrive.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = 60.0,
+        bucket_seconds: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if bucket_seconds <= 0 or window_seconds < bucket_seconds:
+            raise ValueError("window_seconds must be >= bucket_seconds > 0")
+        self._bucket_seconds = bucket_seconds
+        self._num_buckets = int(window_seconds // bucket_seconds)
+        self._requests = [0] * self._num_buckets
+        self._failures = [0] * self._num_buckets
+        self._window_requests = 0
+        self._window_failures = 0
+        self._clock = clock
+        self._current = int(clock() // bucket_seconds)  # absolute bucket number
+        self._total_requests = 0
+        self._total_errors = 0
+
+    def _advance(self) -> None:
+        """Expire buckets that have rolled out of the window."""
+        now_bucket = int(self._clock() // self._bucket_seconds)
+        # At most num_buckets slots need clearing, however long we were idle.
+        steps = min(now_bucket - self._current, self._num_buckets)
+        for offset in range(1, steps + 1):
+            slot = (self._current + offset) % self._num_buckets
+            self._window_requests -= self._requests[slot]
+            self._window_failures -= self._failures[slot]
+            self._requests[slot] = 0
+            self._failures[slot] = 0
+        self._current = max(self._current, now_bucket)
+
+    def _record(self, ok: bool) -> None:
+        self._advance()
+        slot = self._current % self._num_buckets
+        self._requests[slot] += 1
+        self._window_requests += 1
+        self._total_requests += 1
+        if not ok:
+            self._failures[slot] += 1
+            self._window_failures += 1
+            self._total_errors += 1
+
+    def record_success(self) -> None:
+        self._record(True)
+
+    def record_failure(self) -> None:
+        self._record(False)
+
+    @property
+    def error_rate(self) -> float:
+        """Error rate over the last ``window_seconds``."""
+        self._advance()
+        if not self._window_requests:
+            return 0.0
+        return self._window_failures / self._window_requests
+
+    @property
+    def total_requests(self) -> int:
+        return self._total_requests
+
+    @property
+    def total_errors(self) -> int:
+        return self._total_errors
+
+    @property
+    def window_fill(self) -> int:
+        self._advance()
+        return self._window_requests
+
+
 # --- Degradation engine -------------------------------------------------
 
 class GracefulDegradationEngine:
@@ -147,15 +244,28 @@ class GracefulDegradationEngine:
     3. CLOSED + MINIMAL: Very high errors, only core features remain.
     4. OPEN + OFFLINE: Error rate critical, all requests rejected.
     5. HALF_OPEN: Testing recovery with limited requests.
+
+    The engine is safe to share between threads. State changes happen under
+    a lock, but should_allow_request() reads the circuit state without it
+    while CLOSED, so the common path costs no locking at all.
     """
 
     def __init__(self, config: DegradationConfig | None = None) -> None:
         self._config = config or DegradationConfig()
-        self._tracker = SlidingWindowTracker(self._config.window_size)
+        if self._config.window_seconds is not None:
+            self._tracker: SlidingWindowTracker | TimeBucketedWindowTracker = TimeBucketedWindowTracker(
+                self._config.window_seconds, self._config.bucket_seconds,
+            )
+        else:
+            self._tracker = SlidingWindowTracker(self._config.window_size)
         self._circuit_state = CircuitState.CLOSED
         self._service_tier = ServiceTier.FULL
         self._last_state_change = time.monotonic()
         self._half_open_count = 0
+        self._half_open_admitted = 0
+        self._last_probe_admitted = 0.0
+        # RLock because record_* call _transition_to while holding it.
+        self._lock = threading.RLock()
 
     @property
     def circuit_state(self) -> CircuitState:
@@ -171,35 +281,54 @@ class GracefulDegradationEngine:
 
     def record_success(self) -> None:
         """Record a successful request."""
-        self._tracker.record_success()
-        if self._circuit_state == CircuitState.HALF_OPEN:
-            self._half_open_count += 1
-            if self._half_open_count >= self._config.half_open_max_requests:
-                self._transition_to(CircuitState.CLOSED, ServiceTier.FULL)
-        else:
-            self._evaluate_tier()
+        with self._lock:
+            self._tracker.record_success()
+            if self._circuit_state == CircuitState.HALF_OPEN:
+                self._half_open_count += 1
+                if self._half_open_count >= self._config.half_open_max_requests:
+                    self._transition_to(CircuitState.CLOSED, ServiceTier.FULL)
+            else:
+                self._evaluate_tier()
 
     def record_failure(self) -> None:
         """Record a failed request."""
-        self._tracker.record_failure()
-        if self._circuit_state == CircuitState.HALF_OPEN:
-            self._transition_to(CircuitState.OPEN, ServiceTier.OFFLINE)
-        else:
-            self._evaluate_tier()
+        with self._lock:
+            self._tracker.record_failure()
+            if self._circuit_state == CircuitState.HALF_OPEN:
+                self._transition_to(CircuitState.OPEN, ServiceTier.OFFLINE)
+            else:
+                self._evaluate_tier()
 
     def should_allow_request(self) -> bool:
         """Decide whether to allow the next request through."""
+        # Fast path: reading one attribute is atomic, so CLOSED needs no lock.
         if self._circuit_state == CircuitState.CLOSED:
             return True
-        if self._circuit_state == CircuitState.OPEN:
-            elapsed = time.monotonic() - self._last_state_change
-            if elapsed >= self._config.recovery_wait_seconds:
+        with self._lock:
+            if self._circuit_state == CircuitState.CLOSED:
+                return True
+            if self._circuit_state == CircuitState.OPEN:
+                elapsed = time.monotonic() - self._last_state_change
+                if elapsed < self._config.recovery_wait_seconds:
+                    return False
                 self._transition_to(CircuitState.HALF_OPEN, ServiceTier.MINIMAL)
                 self._half_open_count = 0
+                self._half_open_admitted = 0
+            # Half-open: admit at most half_open_max_requests probes in total,
+            # even when many threads ask at once.
+            now = time.monotonic()
+            if (self._half_open_admitted >= self._config.half_open_max_requests
+                    and now - self._last_probe_admitted >= self._config.recovery_wait_seconds):
+                # WHY? -- a probe whose caller never reported back (raised,
+                # timed out, dropped it) would otherwise hold its slot forever
+                # and wedge the circuit half-open. Probes that succeeded keep
+                # their slots; the rest are presumed lost.
+                self._half_open_admitted = self._half_open_count
+            if self._half_open_admitted < self._config.half_open_max_requests:
+                self._half_open_admitted += 1
+                self._last_probe_admitted = now
                 return True
             return False
-        # Half-open: allow limited requests
-        return self._half_open_count < self._config.half_open_max_requests
 
     def _evaluate_tier(self) -> None:
         """Evaluate error rate and adjust service tier."""
@@ -226,18 +355,20 @@ class GracefulDegradationEngine:
         self._last_state_change = time.monotonic()
 
     def status(self) -> ServiceStatus:
-        return ServiceStatus(
-            circuit_state=self._circuit_state,
-            service_tier=self._service_tier,
-            error_rate=self._tracker.error_rate,
-            total_requests=self._tracker.total_requests,
-            total_errors=self._tracker.total_errors,
-            features_enabled=self.features,
-        )
+        with self._lock:
+            return ServiceStatus(
+                circuit_state=self._circuit_state,
+                service_tier=self._service_tier,
+                error_rate=self._tracker.error_rate,
+                total_requests=self._tracker.total_requests,
+                total_errors=self._tracker.total_errors,
+                features_enabled=self.features,
+            )
 
     def force_recovery(self) -> None:
         """Manually force recovery to full service."""
-        self._transition_to(CircuitState.CLOSED, ServiceTier.FULL)
+        with self._lock:
+            self._transition_to(CircuitState.CLOSED, ServiceTier.FULL)
 
 
 # --- Demo ---------------------------------------------------------------
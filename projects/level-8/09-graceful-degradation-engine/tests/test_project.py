@@ -1,10 +1,15 @@
 """Tests for Graceful Degradation Engine.
 
-Covers: sliding window, tier transitions, circuit breaker states, and features.
+Covers: sliding window, time-bucketed window, tier transitions, circuit
+breaker states, concurrent access, and features.
 """
 
 from __future__ import annotations
 
+import random
+import threading
+import time
+
 import pytest
 
 from project import (
@@ -13,6 +18,7 @@ from project import (
     GracefulDegradationEngine,
     ServiceTier,
     SlidingWindowTracker,
+    TimeBucketedWindowTracker,
     TIER_FEATURES,
 )
 
@@ -128,3 +134,120 @@ class TestStatus:
         assert "service_tier" in status
         assert "error_rate" in status
         assert "features_enabled" in status
+
+
+# --- Running counters and time buckets ----------------------------------
+
+class TestRunningFailureCount:
+    def test_counter_matches_recount(self) -> None:
+        rng = random.Random(7)
+        tracker = SlidingWindowTracker(window_size=13)
+        outcomes: list[bool] = []
+        for _ in range(500):
+            ok = rng.random() > 0.3
+            outcomes.append(ok)
+            tracker.record_success() if ok else tracker.record_failure()
+            window = outcomes[-13:]
+            expected = sum(1 for o in window if not o) / len(window)
+            assert tracker.error_rate == pytest.approx(expected)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTimeBucketedWindow:
+    def test_errors_age_out_after_window(self) -> None:
+        clock = FakeClock()
+        tracker = TimeBucketedWindowTracker(window_seconds=10, bucket_seconds=1, clock=clock)
+        tracker.record_failure()
+        tracker.record_success()
+        assert tracker.error_rate == pytest.approx(0.5)
+
+        clock.now = 5.0
+        tracker.record_success()
+        assert tracker.error_rate == pytest.approx(1 / 3)
+
+        clock.now = 10.5  # first bucket has rolled out
+        assert tracker.error_rate == 0.0
+        assert tracker.window_fill == 1
+        assert tracker.total_errors == 1
+
+    def test_long_idle_clears_everything(self) -> None:
+        clock = FakeClock()
+        tracker = TimeBucketedWindowTracker(window_seconds=5, bucket_seconds=1, clock=clock)
+        for _ in range(10):
+            tracker.record_failure()
+        clock.now = 1_000_000.0
+        assert tracker.window_fill == 0
+        assert tracker.error_rate == 0.0
+
+    def test_engine_uses_time_window_when_configured(self) -> None:
+        engine = GracefulDegradationEngine(DegradationConfig(window_seconds=30))
+        engine.record_failure()
+        assert engine.status().error_rate == 1.0
+        assert engine.service_tier == ServiceTier.OFFLINE
+
+
+# --- Concurrency --------------------------------------------------------
+
+class TestConcurrentAccess:
+    def test_half_open_admits_limited_probes(self) -> None:
+        engine = GracefulDegradationEngine(
+            DegradationConfig(window_size=10, recovery_wait_seconds=0.2, half_open_max_requests=3)
+        )
+        for _ in range(10):
+            engine.record_failure()
+        assert engine.circuit_state == CircuitState.OPEN
+        time.sleep(0.25)
+
+        allowed: list[bool] = []
+        lock = threading.Lock()
+
+        def ask() -> None:
+            result = engine.should_allow_request()
+            with lock:
+                allowed.append(result)
+
+        threads = [threading.Thread(target=ask) for _ in range(20)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert engine.circuit_state == CircuitState.HALF_OPEN
+        assert allowed.count(True) == 3
+
+    def test_lost_probes_release_their_slots(self) -> None:
+        engine = GracefulDegradationEngine(
+            DegradationConfig(window_size=10, recovery_wait_seconds=0.05, half_open_max_requests=2)
+        )
+        for _ in range(10):
+            engine.record_failure()
+        time.sleep(0.06)
+        assert engine.should_allow_request() and engine.should_allow_request()
+        engine.record_success()  # second probe never reports back
+        assert not engine.should_allow_request()
+        time.sleep(0.06)
+        assert engine.should_allow_request()  # only the lost slot is reopened
+        assert not engine.should_allow_request()
+        engine.record_success()
+        assert engine.circuit_state == CircuitState.CLOSED
+
+    def test_concurrent_records_keep_totals(self) -> None:
+        engine = GracefulDegradationEngine(DegradationConfig(window_size=50))
+
+        def work() -> None:
+            for _ in range(200):
+                engine.record_success()
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert engine.status().total_requests == 1600
@@ -13,14 +13,16 @@ Concepts practised:
     - threshold detection with hysteresis
     - alert severity escalation
     - reporting with burn-rate analysis
+    - ring buffers with running sums for O(1) window aggregation
 """
 
 from __future__ import annotations
 
 import argparse
 import json
+import math
 import time
-from collections import deque
+from array import array
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
@@ -109,6 +111,85 @@ class SLAStatus:
         }
 
 
+# --- Measurement window -------------------------------------------------
+
+# WHY a ring buffer of parallel arrays? -- a deque of MetricDataPoint objects
+# costs a Python object (~100 bytes) per sample, and averaging it means
+# walking every sample on every check. Two array('d') buffers store raw
+# 8-byte floats, and a running sum that is adjusted on every append and
+# eviction makes the window mean O(1) no matter how many samples it holds.
+class MetricWindow:
+    """Time-ordered (timestamp, value) samples in a growable ring buffer."""
+
+    __slots__ = ("_timestamps", "_values", "_head", "_count", "_sum")
+
+    def __init__(self, capacity: int = 64) -> None:
+        self._timestamps = array("d", bytes(8 * capacity))
+        self._values = array("d", bytes(8 * capacity))
+        self._head = 0   # index of the oldest sample
+        self._count = 0
+        self._sum = 0.0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def total(self) -> float:
+        return self._sum
+
+    @property
+    def mean(self) -> float:
+        return self._sum / self._count if self._count else 0.0
+
+    def oldest_timestamp(self) -> float:
+        """Timestamp of the oldest sample (window must not be empty)."""
+        return self._timestamps[self._head]
+
+    def append(self, timestamp: float, value: float) -> None:
+        """Add a sample at the tail in amortised O(1)."""
+        capacity = len(self._values)
+        if self._count == capacity:
+            self._grow()
+            capacity = len(self._values)
+        tail = (self._head + self._count) % capacity
+        self._timestamps[tail] = timestamp
+        self._values[tail] = value
+        self._count += 1
+        self._sum += value
+
+    def evict_before(self, cutoff: float) -> None:
+        """Drop samples from the head while they are older than ``cutoff``."""
+        capacity = len(self._values)
+        while self._count and self._timestamps[self._head] < cutoff:
+            self._sum -= self._values[self._head]
+            self._head = (self._head + 1) % capacity
+            self._count -= 1
+        if self._count == 0:
+            self._sum = 0.0  # discard any accumulated float rounding error
+
+    def points(self) -> list[MetricDataPoint]:
+        """Return the samples, oldest first, as MetricDataPoint objects."""
+        capacity = len(self._values)
+        return [
+            MetricDataPoint(
+                timestamp=self._timestamps[(self._head + i) % capacity],
+                value=self._values[(self._head + i) % capacity],
+            )
+            for i in range(self._count)
+        ]
+
+    def _grow(self) -> None:
+        """Double capacity, unrolling the ring so the head is at index 0."""
+        capacity = len(self._values)
+        order = [(self._head + i) % capacity for i in range(self._count)]
+        padding = array("d", bytes(8 * capacity))
+        self._timestamps = array("d", (self._timestamps[i] for i in order)) + padding
+        self._values = array("d", (self._values[i] for i in order)) + padding
+        self._head = 0
+        # Re-sum exactly while we are copying anyway, to cap rounding drift.
+        self._sum = math.fsum(self._values)
+
+
 # --- SLA Tracker --------------------------------------------------------
 
 class SLATracker:
@@ -116,12 +197,13 @@ class SLATracker:
 
     Maintains a sliding window of data points and computes the
     current SLA value. Detects breaches when the value drops
-    below the target.
+    below the target. The window keeps a running sum, so
+    current_value() is O(1) however many points it holds.
     """
 
     def __init__(self, sla: SLADefinition) -> None:
         self._sla = sla
-        self._data: deque[MetricDataPoint] = deque()
+        self._data = MetricWindow()
         self._breaches: list[SLABreach] = []
         self._in_breach = False
 
@@ -136,16 +218,15 @@ class SLATracker:
     def record(self, value: float, timestamp: float | None = None) -> None:
         """Record a new metric data point."""
         ts = timestamp or time.time()
-        self._data.append(MetricDataPoint(timestamp=ts, value=value))
+        self._data.append(ts, value)
         self._prune_window(ts)
 
     def current_value(self) -> float:
         """Compute the current SLA value from the measurement window."""
         if not self._data:
             return self._sla.target_value  # assume healthy when no data
-        values = [dp.value for dp in self._data]
         # For availability/error_rate: use mean
-        return sum(values) / len(values)
+        return self._data.mean
 
     def check(self, timestamp: float | None = None) -> SLABreach | None:
         """Check current value against SLA and return breach if detected."""
@@ -229,8 +310,7 @@ class SLATracker:
     def _prune_window(self, now: float) -> None:
         """Remove data points outside the measurement window."""
         cutoff = now - (self._sla.window_minutes * 60)
-        while self._data and self._data[0].timestamp < cutoff:
-            self._data.popleft()
+        self._data.evict_before(cutoff)
 
 
 # --- Multi-SLA monitor --------------------------------------------------
@@ -1,6 +1,7 @@
 """Tests for SLA Breach Detector.
 
-Covers: SLA tracking, breach detection, multi-SLA monitoring, and status reporting.
+Covers: SLA tracking, breach detection, multi-SLA monitoring, status reporting,
+and the ring-buffer measurement window.
 """
 
 from __future__ import annotations
@@ -11,6 +12,7 @@ import pytest
 
 from project import (
     AlertSeverity,
+    MetricWindow,
     SLABreach,
     SLABreachDetector,
     SLADefinition,
@@ -125,3 +127,37 @@ class TestSLABreachDetector:
             detector.record("bad", 90.0, ts + i)
         breaches = detector.check_all()
         assert len(breaches) > 0
+
+
+# --- Measurement window -------------------------------------------------
+
+class TestMetricWindow:
+    def test_running_mean_tracks_appends_and_evictions(self) -> None:
+        window = MetricWindow(capacity=2)  # small so the ring has to grow
+        for i in range(10):
+            window.append(float(i), float(i))
+        assert len(window) == 10
+        assert window.mean == pytest.approx(4.5)
+
+        window.evict_before(5.0)
+        assert len(window) == 5
+        assert window.mean == pytest.approx(7.0)
+        assert [p.value for p in window.points()] == [5.0, 6.0, 7.0, 8.0, 9.0]
+
+    def test_ring_wraps_without_growing(self) -> None:
+        window = MetricWindow(capacity=4)
+        for i in range(100):
+            window.append(float(i), 1.0)
+            window.evict_before(float(i) - 2)
+        assert len(window) == 3
+        assert window.total == pytest.approx(3.0)
+
+    def test_tracker_window_prunes_old_points(self) -> None:
+        sla = SLADefinition(
+            name="uptime", metric_type=SLAMetricType.AVAILABILITY,
+            target_value=99.0, warning_threshold=99.5, window_minutes=1,
+        )
+        tracker = SLATracker(sla)
+        tracker.record(0.0, timestamp=1000.0)      # falls out of the window
+        tracker.record(100.0, timestamp=1100.0)
+        assert tracker.current_value() == pytest.approx(100.0)
@@ -13,15 +13,22 @@ Concepts practised:
     - topological analysis for layering violations
     - dataclasses for boundaries and violations
     - chain of responsibility for rule evaluation
+    - reverse adjacency indexes and iterative Tarjan SCC
+    - AST import extraction with a process pool and content-hash cache
 """
 
 from __future__ import annotations
 
 import argparse
+import ast
+import hashlib
 import json
+import os
 from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
+from pathlib import Path
 from typing import Any
 
 
@@ -89,15 +96,33 @@ class Violation:
 # --- Dependency graph ---------------------------------------------------
 
 class DependencyGraph:
-    """Directed graph of module dependencies."""
+    """Directed graph of module dependencies.
+
+    Forward and reverse adjacency are both maintained on add_edge(), so
+    "what does X import" and "who imports X" are dictionary lookups. Cycle
+    reports and transitive closures are cached until the next edge is added.
+    """
 
     def __init__(self) -> None:
         self._edges: list[DependencyEdge] = []
-        self._adjacency: dict[str, set[str]] = defaultdict(set)
+        # WHY dicts with None values instead of sets? -- They act as
+        # insertion-ordered sets, so traversals (and therefore cycle
+        # reports) come out in the same order on every run.
+        self._nodes: dict[str, None] = {}
+        self._adjacency: dict[str, dict[str, None]] = defaultdict(dict)
+        self._reverse: dict[str, dict[str, None]] = defaultdict(dict)
+        self._scc_cache: list[list[str]] | None = None
+        self._dependents_cache: dict[str, frozenset[str]] = {}
+        self._dependencies_cache: dict[str, frozenset[str]] = {}
 
     def add_edge(self, source: str, target: str, import_path: str = "") -> None:
         self._edges.append(DependencyEdge(source, target, import_path))
-        self._adjacency[source].add(target)
+        self._nodes.setdefault(source)
+        self._nodes.setdefault(target)
+        if target not in self._adjacency[source]:
+            self._adjacency[source][target] = None
+            self._reverse[target][source] = None
+            self._invalidate()
 
     @property
     def edges(self) -> list[DependencyEdge]:
@@ -105,41 +130,86 @@ class DependencyGraph:
 
     @property
     def nodes(self) -> set[str]:
-        nodes: set[str] = set()
-        for edge in self._edges:
-            nodes.add(edge.source)
-            nodes.add(edge.target)
-        return nodes
+        return set(self._nodes)
 
     def dependencies_of(self, module: str) -> set[str]:
-        return set(self._adjacency.get(module, set()))
+        return set(self._adjacency.get(module, ()))
 
     def dependents_of(self, module: str) -> set[str]:
         """Find all modules that depend on the given module."""
-        return {e.source for e in self._edges if e.target == module}
+        return set(self._reverse.get(module, ()))
+
+    def transitive_dependents(self, module: str) -> frozenset[str]:
+        """Every module that reaches `module` through one or more imports."""
+        return self._closure(module, self._reverse, self._dependents_cache)
+
+    def transitive_dependencies(self, module: str) -> frozenset[str]:
+        """Every module reachable from `module` through one or more imports."""
+        return self._closure(module, self._adjacency, self._dependencies_cache)
+
+    def strongly_connected_components(self) -> list[list[str]]:
+        """Tarjan's SCCs in reverse topological order (dependencies first).
+
+        WHY iterative? -- A recursive DFS needs one Python frame per module
+        on the longest import chain and fails with RecursionError on deep
+        graphs. An explicit stack of (node, neighbour iterator) pairs does
+        the same walk in a single pass without touching the recursion limit.
+        """
+        if self._scc_cache is not None:
+            return [list(c) for c in self._scc_cache]
+
+        index: dict[str, int] = {}
+        low: dict[str, int] = {}
+        stack: list[str] = []
+        on_stack: set[str] = set()
+        components: list[list[str]] = []
+
+        for root in self._nodes:
+            if root in index:
+                continue
+            index[root] = low[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(self._adjacency.get(root, ())))]
+            while work:
+                node, neighbours = work[-1]
+                for nxt in neighbours:
+                    if nxt not in index:
+                        index[nxt] = low[nxt] = len(index)
+                        stack.append(nxt)
+                        on_stack.add(nxt)
+                        work.append((nxt, iter(self._adjacency.get(nxt, ()))))
+                        break
+                    if nxt in on_stack:
+                        low[node] = min(low[node], index[nxt])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[node])
+                    if low[node] == index[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        components.append(sorted(component))
+
+        self._scc_cache = components
+        return [list(c) for c in components]
+
+    def cycles(self) -> list[list[str]]:
+        """Every group of modules that depend on each other, self-loops included."""
+        return [
+            component for component in self.strongly_connected_components()
+            if len(component) > 1 or component[0] in self._adjacency.get(component[0], ())
+        ]
 
     def has_cycle(self) -> bool:
-        """Detect cycles using DFS-based cycle detection."""
-        visited: set[str] = set()
-        in_stack: set[str] = set()
-
-        def dfs(node: str) -> bool:
-            visited.add(node)
-            in_stack.add(node)
-            for neighbor in self._adjacency.get(node, set()):
-                if neighbor in in_stack:
-                    return True
-                if neighbor not in visited:
-                    if dfs(neighbor):
-                        return True
-            in_stack.discard(node)
-            return False
-
-        for node in self.nodes:
-            if node not in visited:
-                if dfs(node):
-                    return True
-        return False
+        """Detect cycles via strongly connected components."""
+        return bool(self.cycles())
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -148,6 +218,29 @@ class DependencyGraph:
             "has_cycle": self.has_cycle(),
         }
 
+    def _invalidate(self) -> None:
+        self._scc_cache = None
+        self._dependents_cache.clear()
+        self._dependencies_cache.clear()
+
+    @staticmethod
+    def _closure(module: str, adjacency: dict[str, dict[str, None]],
+                 cache: dict[str, frozenset[str]]) -> frozenset[str]:
+        cached = cache.get(module)
+        if cached is not None:
+            return cached
+        seen: set[str] = set()
+        queue = deque(adjacency.get(module, ()))
+        while queue:
+            node = queue.popleft()
+            if node in seen:
+                continue
+            seen.add(node)
+            queue.extend(n for n in adjacency.get(node, ()) if n not in seen)
+        result = frozenset(seen)
+        cache[module] = result
+        return result
+
 
 # --- Boundary enforcer (Chain of Responsibility) -----------------------
 
@@ -235,6 +328,217 @@ class BoundaryEnforcer:
         return violations
 
 
+# --- Import extraction --------------------------------------------------
+
+def module_name_for(relative: Path) -> tuple[str, bool]:
+    """Map "pkg/sub/mod.py" to ("pkg.sub.mod", False) and "pkg/__init__.py" to ("pkg", True)."""
+    parts = list(relative.with_suffix("").parts)
+    is_package = parts[-1] == "__init__"
+    if is_package:
+        parts.pop()
+    return ".".join(parts), is_package
+
+
+def parse_imports(source: str | bytes, module: str, is_package: bool = False) -> list[tuple[str, int]]:
+    """Return (imported_module, line_number) for every import in the source.
+
+    Relative imports are resolved against `module`. For "from pkg import x"
+    both "pkg" and "pkg.x" are reported, because x may be a submodule;
+    callers keep whichever names exist in the scanned tree.
+    """
+    tree = ast.parse(source)
+    package = module.split(".") if is_package else module.split(".")[:-1]
+    found: list[tuple[str, int]] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            found.extend((alias.name, node.lineno) for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                keep = len(package) - (node.level - 1)
+                if keep < 0:
+                    continue  # relative import beyond the top-level package
+                base = package[:keep]
+            else:
+                base = []
+            if node.module:
+                base = base + node.module.split(".")
+            if base:
+                found.append((".".join(base), node.lineno))
+            found.extend(
+                (".".join(base + [alias.name]), node.lineno)
+                for alias in node.names if alias.name != "*"
+            )
+    return found
+
+
+def _scan_file(job: tuple[str, str, bool, str | None]) -> tuple[str, str, list[tuple[str, int]] | None, str]:
+    """Worker entry point: hash a file and parse it unless the hash is known.
+
+    Returns (path, sha256, imports, error). imports is None when the hash
+    matched `known_hash`, meaning the cached result is still valid.
+    """
+    path, module, is_package, known_hash = job
+    try:
+        data = Path(path).read_bytes()
+    except OSError as exc:
+        return path, "", [], str(exc)
+    digest = hashlib.sha256(data).hexdigest()
+    if digest == known_hash:
+        return path, digest, None, ""
+    try:
+        return path, digest, parse_imports(data, module, is_package), ""
+    except (SyntaxError, ValueError) as exc:
+        return path, digest, [], f"{type(exc).__name__}: {exc}"
+
+
+@dataclass
+class ScanStats:
+    """What the last ImportExtractor.scan() had to do."""
+    files: int = 0
+    parsed: int = 0
+    cached: int = 0
+    removed: int = 0
+    errors: dict[str, str] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "files": self.files,
+            "parsed": self.parsed,
+            "cached": self.cached,
+            "removed": self.removed,
+            "errors": self.errors,
+        }
+
+
+# WHY cache by content hash and stat? -- A pre-commit hook usually runs
+# after a handful of files changed. Files whose size and mtime match the
+# cache are reused without being opened; files whose stat changed are
+# re-hashed, and only those whose content actually differs are re-parsed.
+class ImportExtractor:
+    """Extracts module imports from a Python source tree with `ast`.
+
+    Parsing runs in a process pool (`workers` > 1) and results are cached
+    per file in a JSON file, so repeated scans only parse changed files.
+    """
+
+    CACHE_VERSION = 1
+
+    def __init__(self, root: str | Path, cache_path: str | Path | None = None,
+                 workers: int | None = None) -> None:
+        self.root = Path(root)
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.stats = ScanStats()
+        self._files: dict[str, dict[str, Any]] = self._load_cache()
+
+    def scan(self) -> dict[str, list[tuple[str, int]]]:
+        """Scan the tree and return {module: [(imported_module, line), ...]}."""
+        if not self.root.is_dir():
+            raise FileNotFoundError(f"Source tree not found: {self.root}")
+        # Scanning a package directory itself ("src/billing") names modules
+        # "billing.x"; scanning a source root ("src") names them "x".
+        prefix = Path(self.root.resolve().name) if (self.root / "__init__.py").exists() else Path()
+        stats = ScanStats()
+        current: dict[str, dict[str, Any]] = {}
+        jobs: list[tuple[str, str, bool, str | None]] = []
+
+        for path in sorted(self.root.rglob("*.py")):
+            if any(part.startswith(".") or part == "__pycache__"
+                   for part in path.relative_to(self.root).parts[:-1]):
+                continue
+            key = path.relative_to(self.root).as_posix()
+            st = path.stat()
+            stamp = [st.st_size, st.st_mtime_ns]
+            entry = self._files.get(key)
+            if entry and entry["stamp"] == stamp:
+                current[key] = entry
+                continue
+            module, is_package = module_name_for(prefix / key)
+            current[key] = {"module": module, "stamp": stamp, "sha256": None, "imports": []}
+            jobs.append((str(path), module, is_package, entry["sha256"] if entry else None))
+
+        by_path = {str(self.root / key): key for key in current}
+        for path, digest, imports, error in self._run(jobs):
+            key = by_path[path]
+            entry = current[key]
+            if imports is None:
+                entry["imports"] = self._files[key]["imports"]
+                stats.cached += 1
+            else:
+                entry["imports"] = [list(item) for item in imports]
+                stats.parsed += 1
+            entry["sha256"] = digest
+            if error:
+                stats.errors[key] = error
+
+        stats.files = len(current)
+        stats.cached += len(current) - len(jobs)
+        stats.removed = len(set(self._files) - set(current))
+        self._files = current
+        self.stats = stats
+        self._save_cache()
+        return {
+            entry["module"]: [(target, line) for target, line in entry["imports"]]
+            for entry in current.values()
+        }
+
+    def build_graph(self, graph: DependencyGraph | None = None, depth: int | None = None,
+                    include_external: bool = False) -> DependencyGraph:
+        """Scan and add one edge per internal import to a DependencyGraph.
+
+        `depth` collapses module names to their first N components, e.g.
+        depth=1 maps "billing.api.views" to the "billing" domain. Imports of
+        modules outside the tree are dropped unless include_external is set.
+        """
+        graph = graph if graph is not None else DependencyGraph()
+        imports = self.scan()
+        known = set(imports)
+        paths = {entry["module"]: key for key, entry in self._files.items()}
+
+        def collapse(name: str) -> str:
+            return ".".join(name.split(".")[:depth]) if depth else name
+
+        for module, found in imports.items():
+            source = collapse(module)
+            for target, line in found:
+                if target not in known and not include_external:
+                    continue
+                target = collapse(target)
+                if target != source:
+                    graph.add_edge(source, target, f"{paths[module]}:{line}")
+        return graph
+
+    def _run(self, jobs: list[tuple[str, str, bool, str | None]]) -> list[tuple[str, str, list[tuple[str, int]] | None, str]]:
+        if self.workers > 1 and len(jobs) > self.workers:
+            chunksize = max(1, len(jobs) // (self.workers * 4))
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                return list(pool.map(_scan_file, jobs, chunksize=chunksize))
+        return [_scan_file(job) for job in jobs]
+
+    def _load_cache(self) -> dict[str, dict[str, Any]]:
+        if self.cache_path is None or not self.cache_path.exists():
+            return {}
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if data.get("version") != self.CACHE_VERSION or data.get("root") != str(self.root.resolve()):
+            return {}
+        return data.get("files", {})
+
+    def _save_cache(self) -> None:
+        if self.cache_path is None:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.cache_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({
+            "version": self.CACHE_VERSION,
+            "root": str(self.root.resolve()),
+            "files": self._files,
+        }), encoding="utf-8")
+        os.replace(tmp, self.cache_path)
+
+
 # --- Demo ---------------------------------------------------------------
 
 def run_demo() -> dict[str, Any]:
@@ -279,14 +583,34 @@ def run_demo() -> dict[str, Any]:
     }
 
 
+def run_scan(root: str, cache_path: str | None, workers: int | None,
+             depth: int | None) -> dict[str, Any]:
+    """Build the import graph of a real source tree and report its cycles."""
+    extractor = ImportExtractor(root, cache_path=cache_path, workers=workers)
+    graph = extractor.build_graph(depth=depth)
+    return {
+        "graph": graph.to_dict(),
+        "cycles": graph.cycles(),
+        "scan": extractor.stats.to_dict(),
+    }
+
+
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Domain boundary enforcer")
     parser.add_argument("--demo", action="store_true", default=True)
+    parser.add_argument("--scan", metavar="DIR", help="extract the import graph of a source tree")
+    parser.add_argument("--cache", default=None, help="per-file import cache (JSON) for incremental scans")
+    parser.add_argument("--jobs", type=int, default=None, help="parser processes (default: CPU count)")
+    parser.add_argument("--depth", type=int, default=None,
+                        help="collapse modules to their first N name components")
     return parser.parse_args(argv)
 
 
 def main(argv: list[str] | None = None) -> None:
-    parse_args(argv)
+    args = parse_args(argv)
+    if args.scan:
+        print(json.dumps(run_scan(args.scan, args.cache, args.jobs, args.depth), indent=2))
+        return
     print(json.dumps(run_demo(), indent=2))
 
 
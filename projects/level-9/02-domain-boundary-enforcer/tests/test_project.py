@@ -1,10 +1,13 @@
 """Tests for Domain Boundary Enforcer.
 
-Covers: dependency graph, cycle detection, rule enforcement, layer checking.
+Covers: dependency graph, cycle detection, SCCs, transitive closure, rule
+enforcement, layer checking, and AST import extraction.
 """
 
 from __future__ import annotations
 
+from pathlib import Path
+
 import pytest
 
 from project import (
@@ -12,8 +15,10 @@ from project import (
     DependencyGraph,
     DependencyRule,
     DomainModule,
+    ImportExtractor,
     RuleType,
     ViolationSeverity,
+    parse_imports,
 )
 
 
@@ -51,6 +56,60 @@ class TestDependencyGraph:
         assert g.has_cycle() is True
 
 
+class TestGraphAlgorithms:
+    def test_deep_chain_does_not_hit_recursion_limit(self) -> None:
+        g = DependencyGraph()
+        for i in range(20_000):
+            g.add_edge(f"m{i}", f"m{i + 1}")
+        assert g.has_cycle() is False
+        g.add_edge("m20000", "m0")
+        assert g.has_cycle() is True
+        assert len(g.cycles()[0]) == 20_001
+
+    def test_cycles_reports_every_component(self) -> None:
+        g = DependencyGraph()
+        g.add_edge("a", "b")
+        g.add_edge("b", "a")
+        g.add_edge("b", "c")
+        g.add_edge("c", "d")
+        g.add_edge("d", "e")
+        g.add_edge("e", "c")
+        g.add_edge("f", "f")
+        g.add_edge("e", "g")
+        assert sorted(g.cycles()) == [["a", "b"], ["c", "d", "e"], ["f"]]
+
+    def test_sccs_come_dependencies_first(self) -> None:
+        g = DependencyGraph()
+        g.add_edge("app", "domain")
+        g.add_edge("domain", "infra")
+        assert g.strongly_connected_components() == [["infra"], ["domain"], ["app"]]
+
+    def test_transitive_dependents(self) -> None:
+        g = DependencyGraph()
+        g.add_edge("ui", "app")
+        g.add_edge("app", "core")
+        g.add_edge("jobs", "core")
+        assert g.transitive_dependents("core") == {"ui", "app", "jobs"}
+        assert g.transitive_dependencies("ui") == {"app", "core"}
+
+    def test_closure_cache_invalidated_by_new_edge(self) -> None:
+        g = DependencyGraph()
+        g.add_edge("app", "core")
+        assert g.transitive_dependents("core") == {"app"}
+        g.add_edge("ui", "app")
+        assert g.transitive_dependents("core") == {"app", "ui"}
+        assert g.has_cycle() is False
+        g.add_edge("core", "ui")
+        assert g.has_cycle() is True
+
+    def test_nodes_include_targets(self) -> None:
+        g = DependencyGraph()
+        g.add_edge("a", "b")
+        g.add_edge("a", "b")
+        assert g.nodes == {"a", "b"}
+        assert len(g.edges) == 2
+
+
 # --- Rule enforcement ---------------------------------------------------
 
 class TestBoundaryEnforcer:
@@ -114,3 +173,87 @@ class TestLayerViolations:
         violations = enforcer.enforce(g)
         layer_violations = [v for v in violations if "Layer" in v.message]
         assert len(layer_violations) == 0
+
+
+# --- Import extraction --------------------------------------------------
+
+def write_tree(root: Path, files: dict[str, str]) -> None:
+    for rel, source in files.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(source, encoding="utf-8")
+
+
+TREE = {
+    "billing/__init__.py": "",
+    "billing/api.py": "from . import models\nfrom shipping.rates import quote\nimport json\n",
+    "billing/models.py": "from ..core import base\n",
+    "shipping/__init__.py": "",
+    "shipping/rates.py": "import billing.models\n",
+    "core/__init__.py": "",
+    "core/base.py": "",
+}
+
+
+class TestParseImports:
+    def test_absolute_and_relative(self) -> None:
+        source = "import os.path\nfrom . import models\nfrom ..core.base import Base\n"
+        found = {name for name, _ in parse_imports(source, "billing.api")}
+        assert {"os.path", "billing", "billing.models", "core.base", "core.base.Base"} <= found
+
+    def test_package_init_resolves_against_itself(self) -> None:
+        found = {name for name, _ in parse_imports("from .sub import x", "pkg", is_package=True)}
+        assert "pkg.sub" in found
+
+
+class TestImportExtractor:
+    def test_builds_domain_graph(self, tmp_path: Path) -> None:
+        write_tree(tmp_path, TREE)
+        graph = ImportExtractor(tmp_path, workers=1).build_graph(depth=1)
+        assert graph.dependencies_of("billing") == {"shipping", "core"}
+        assert graph.dependencies_of("shipping") == {"billing"}
+        assert graph.cycles() == [["billing", "shipping"]]
+
+    def test_feeds_boundary_enforcer(self, tmp_path: Path) -> None:
+        write_tree(tmp_path, TREE)
+        graph = ImportExtractor(tmp_path, workers=1).build_graph(depth=1)
+        enforcer = BoundaryEnforcer()
+        enforcer.add_rule(DependencyRule("shipping", "billing", RuleType.DENY))
+        violations = enforcer.enforce(graph)
+        assert [(v.source, v.target) for v in violations] == [("shipping", "billing")]
+        assert graph.edges[-1].import_path == "shipping/rates.py:1"
+
+    def test_incremental_rescan(self, tmp_path: Path) -> None:
+        src = tmp_path / "src"
+        write_tree(src, TREE)
+        cache = tmp_path / "imports.json"
+        ImportExtractor(src, cache_path=cache, workers=1).scan()
+
+        extractor = ImportExtractor(src, cache_path=cache, workers=1)
+        extractor.scan()
+        assert (extractor.stats.parsed, extractor.stats.cached) == (0, 7)
+
+        (src / "core/base.py").write_text("import billing\n", encoding="utf-8")
+        (src / "shipping/rates.py").unlink()
+        extractor = ImportExtractor(src, cache_path=cache, workers=1)
+        imports = extractor.scan()
+        assert extractor.stats.parsed == 1
+        assert extractor.stats.removed == 1
+        assert ("billing", 1) in imports["core.base"]
+
+    def test_process_pool_matches_serial(self, tmp_path: Path) -> None:
+        write_tree(tmp_path, TREE)
+        serial = ImportExtractor(tmp_path, workers=1).scan()
+        parallel = ImportExtractor(tmp_path, workers=2).scan()
+        assert parallel == serial
+
+    def test_syntax_errors_are_reported(self, tmp_path: Path) -> None:
+        write_tree(tmp_path, {"bad.py": "def (:\n", "good.py": "import bad\n"})
+        extractor = ImportExtractor(tmp_path, workers=1)
+        graph = extractor.build_graph()
+        assert "bad.py" in extractor.stats.errors
+        assert graph.dependencies_of("good") == {"bad"}
+
+    def test_missing_root(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            ImportExtractor(tmp_path / "missing").scan()
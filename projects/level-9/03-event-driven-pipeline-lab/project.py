@@ -12,15 +12,23 @@ Concepts practised:
     - observer pattern for event subscribers
     - dataclasses for typed events
     - temporal queries (state at a point in time)
+    - secondary indexes, binary search, and snapshots for fast replay
+    - append-only segment files for durable storage
+    - asynchronous batched dispatch with per-subscriber checkpoints
 """
 
 from __future__ import annotations
 
 import argparse
+import copy
 import json
+import threading
+import weakref
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable
+from pathlib import Path
+from typing import Any, Callable, TextIO
 
 
 # --- Domain types -------------------------------------------------------
@@ -67,6 +75,58 @@ class Projection:
 # --- Event store --------------------------------------------------------
 
 EventHandler = Callable[[Event], None]
+Reducer = Callable[[dict[str, Any], Event], dict[str, Any]]
+
+
+# WHY per-aggregate streams? -- A temporal query only cares about one
+# aggregate, but the global log interleaves every aggregate's events.
+# Keeping each aggregate's events in its own list (in append order) makes
+# replay cost proportional to that aggregate's history, not the store's.
+# max_timestamps[i] is the largest timestamp among events[0..i]; because it
+# never decreases it can be binary-searched to find the replayable prefix.
+@dataclass(slots=True)
+class _AggregateStream:
+    events: list[Event] = field(default_factory=list)
+    max_timestamps: list[float] = field(default_factory=list)
+
+    def add(self, event: Event) -> None:
+        running = self.max_timestamps[-1] if self.max_timestamps else event.timestamp
+        self.events.append(event)
+        self.max_timestamps.append(max(running, event.timestamp))
+
+
+@dataclass(slots=True)
+class _Snapshot:
+    """Reducer state after applying the first `position` events of a stream."""
+    position: int
+    state: dict[str, Any]
+
+
+class DispatchMode(Enum):
+    SYNC = "sync"    # handlers run inside append(); exceptions propagate
+    ASYNC = "async"  # handlers run on per-subscriber worker threads
+
+
+# WHY a checkpoint per subscriber? -- The store's log already holds every
+# event in order, so it doubles as the dispatch queue: each subscriber just
+# remembers the last event_id it handled. A slow projection falls behind
+# without holding up producers or other projections, and a subscriber that
+# crashed can be re-subscribed from its checkpoint to catch up.
+@dataclass
+class Subscription:
+    """A registered handler and its delivery progress."""
+    name: str
+    handler: EventHandler
+    checkpoint: int = 0
+    error: BaseException | None = None
+    _thread: threading.Thread | None = field(default=None, repr=False)
+
+
+def _events_after(events: list[Event], after_id: int) -> list[Event]:
+    """Events with event_id > after_id; lists are in event_id order."""
+    if after_id <= 0:
+        return list(events)
+    return events[bisect_right(events, after_id, key=lambda e: e.event_id):]
 
 
 class EventStore:
@@ -75,12 +135,60 @@ class EventStore:
     Events are immutable once stored. Subscribers receive events
     in real-time as they are appended. Projections can replay
     the full event history to rebuild state.
+
+    Events are indexed by aggregate and category as they arrive, and
+    get_state_at() records a snapshot of the reducer's state every
+    `snapshot_interval` events so later queries resume from the nearest
+    one. Pass `path` to persist events as JSON lines in append-only
+    segment files; a new store opened on the same directory reloads them.
+
+    With dispatch=DispatchMode.ASYNC, append() only records the event and
+    wakes the subscriber workers, which read it from the log in batches of
+    up to `batch_size`. append() blocks only when the slowest healthy
+    subscriber is more than `max_lag` events behind.
     """
 
-    def __init__(self) -> None:
+    SEGMENT_PATTERN = "segment-*.jsonl"
+
+    def __init__(self, path: str | Path | None = None,
+                 snapshot_interval: int = 100,
+                 segment_max_events: int = 10_000,
+                 dispatch: DispatchMode = DispatchMode.SYNC,
+                 batch_size: int = 100,
+                 max_lag: int = 10_000) -> None:
+        if snapshot_interval < 1:
+            raise ValueError("snapshot_interval must be >= 1")
+        if segment_max_events < 1:
+            raise ValueError("segment_max_events must be >= 1")
+        if batch_size < 1 or max_lag < 1:
+            raise ValueError("batch_size and max_lag must be >= 1")
         self._events: list[Event] = []
         self._next_id = 1
-        self._subscribers: list[EventHandler] = []
+        self._subscribers: list[Subscription] = []
+        self.dispatch = dispatch
+        self.batch_size = batch_size
+        self.max_lag = max_lag
+        # One condition guards the log and subscriber progress; workers wait
+        # on it for new events and producers wait on it for backpressure.
+        self._cond = threading.Condition()
+        self._closing = False
+        self._by_aggregate: dict[str, _AggregateStream] = {}
+        self._by_category: dict[EventCategory, list[Event]] = {}
+        # Snapshots depend on the reducer that produced them, so they are
+        # keyed by reducer, then aggregate_id. Weak keys: a throwaway reducer
+        # (a fresh lambda per call) takes its snapshots with it when it is
+        # collected instead of leaking them.
+        self._snapshots: weakref.WeakKeyDictionary[
+            Reducer, dict[str, list[_Snapshot]]] = weakref.WeakKeyDictionary()
+        self.snapshot_interval = snapshot_interval
+        self.segment_max_events = segment_max_events
+
+        self._dir = Path(path) if path is not None else None
+        self._segment: TextIO | None = None
+        self._segment_number = 0
+        self._segment_events = 0
+        if self._dir is not None:
+            self._load_segments()
 
     @property
     def count(self) -> int:
@@ -90,51 +198,275 @@ class EventStore:
                aggregate_id: str, data: dict[str, Any],
                timestamp: float = 0.0) -> Event:
         """Append an event to the store and notify subscribers."""
-        event = Event(
-            event_id=self._next_id,
-            category=category,
-            event_type=event_type,
-            aggregate_id=aggregate_id,
-            data=data,
-            timestamp=timestamp or float(self._next_id),
-        )
-        self._events.append(event)
-        self._next_id += 1
-
-        for subscriber in self._subscribers:
-            subscriber(event)
+        with self._cond:
+            if self.dispatch is DispatchMode.ASYNC:
+                self._cond.wait_for(lambda: not self._lagging())
+            # Assign the id only once we hold the lock and are admitted, so
+            # concurrent producers get unique, contiguous ids.
+            event = Event(
+                event_id=self._next_id,
+                category=category,
+                event_type=event_type,
+                aggregate_id=aggregate_id,
+                data=data,
+                timestamp=timestamp or float(self._next_id),
+            )
+            # Write before indexing: if serialization fails, memory and disk agree.
+            if self._dir is not None:
+                self._write(event)
+            self._index(event)
+            if self.dispatch is DispatchMode.ASYNC:
+                self._cond.notify_all()
+                return event
+
+        for sub in list(self._subscribers):
+            sub.handler(event)
+            sub.checkpoint = event.event_id
 
         return event
 
-    def subscribe(self, handler: EventHandler) -> None:
-        """Register a subscriber for new events."""
-        self._subscribers.append(handler)
+    def subscribe(self, handler: EventHandler, name: str | None = None,
+                  from_id: int | None = None) -> Subscription:
+        """Register a subscriber for new events.
+
+        By default only events appended from now on are delivered. Pass
+        `from_id` (e.g. a saved checkpoint) to first replay every stored
+        event with a larger event_id.
+        """
+        with self._cond:
+            sub = Subscription(
+                name=name or getattr(handler, "__qualname__", repr(handler)),
+                handler=handler,
+                checkpoint=self._next_id - 1 if from_id is None else from_id,
+            )
+            self._subscribers.append(sub)
+            backlog = _events_after(self._events, sub.checkpoint)
+
+        if self.dispatch is DispatchMode.ASYNC:
+            sub._thread = threading.Thread(
+                target=self._run_subscriber, args=(sub,),
+                name=f"subscriber-{sub.name}", daemon=True,
+            )
+            sub._thread.start()
+        else:
+            for event in backlog:
+                handler(event)
+                sub.checkpoint = event.event_id
+        return sub
+
+    def checkpoints(self) -> dict[str, int]:
+        """Last event_id handled by each subscriber, keyed by name."""
+        return {sub.name: sub.checkpoint for sub in self._subscribers}
+
+    def wait_for_subscribers(self, timeout: float | None = None) -> bool:
+        """Block until every healthy subscriber has handled the latest event.
+
+        Returns False if `timeout` expires first.
+        """
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: all(sub.error is not None or sub.checkpoint >= self._next_id - 1
+                            for sub in self._subscribers),
+                timeout,
+            )
 
     def get_events(self, aggregate_id: str | None = None,
                    category: EventCategory | None = None,
                    after_id: int = 0) -> list[Event]:
         """Query events with optional filters."""
-        result = self._events
         if aggregate_id:
-            result = [e for e in result if e.aggregate_id == aggregate_id]
+            stream = self._by_aggregate.get(aggregate_id)
+            result = _events_after(stream.events if stream else [], after_id)
+            if category:
+                result = [e for e in result if e.category == category]
+            return result
         if category:
-            result = [e for e in result if e.category == category]
-        if after_id > 0:
-            result = [e for e in result if e.event_id > after_id]
-        return result
+            return _events_after(self._by_category.get(category, []), after_id)
+        return _events_after(self._events, after_id)
 
     def get_state_at(self, aggregate_id: str, timestamp: float,
-                     reducer: Callable[[dict[str, Any], Event], dict[str, Any]]) -> dict[str, Any]:
-        """Replay events up to a timestamp to reconstruct state."""
-        state: dict[str, Any] = {}
-        for event in self._events:
-            if event.aggregate_id == aggregate_id and event.timestamp <= timestamp:
+                     reducer: Reducer) -> dict[str, Any]:
+        """Replay events up to a timestamp to reconstruct state.
+
+        Only the aggregate's own stream is replayed, starting from the
+        latest snapshot whose events all happened at or before `timestamp`.
+        Snapshots are reused only when the same reducer object is passed
+        again (e.g. a module-level function); a bound method is a new object
+        on every attribute access, so store it once to benefit.
+        """
+        stream = self._by_aggregate.get(aggregate_id)
+        if stream is None:
+            return {}
+
+        # Every event before `complete` has timestamp <= the query time.
+        complete = bisect_right(stream.max_timestamps, timestamp)
+        try:
+            by_aggregate = self._snapshots.get(reducer)
+        except TypeError:  # not weak-referenceable: replay without snapshots
+            by_aggregate, reducer_cacheable = None, False
+        else:
+            reducer_cacheable = True
+        snapshots = by_aggregate.get(aggregate_id, []) if by_aggregate else []
+        idx = bisect_right(snapshots, complete, key=lambda snap: snap.position) - 1
+        if idx >= 0:
+            position = snapshots[idx].position
+            state = copy.deepcopy(snapshots[idx].state)
+        else:
+            position = 0
+            state = {}
+
+        last_snapshot = snapshots[-1].position if snapshots else 0
+        for i in range(position, complete):
+            state = reducer(state, stream.events[i])
+            applied = i + 1
+            if (reducer_cacheable and applied % self.snapshot_interval == 0
+                    and applied > last_snapshot):
+                if not snapshots:
+                    snapshots = self._snapshots.setdefault(reducer, {}).setdefault(aggregate_id, [])
+                snapshots.append(_Snapshot(applied, copy.deepcopy(state)))
+                last_snapshot = applied
+
+        # Out-of-order timestamps: later events may still fall before the
+        # query time. Only scanned when the prefix stops short of the end.
+        for event in stream.events[complete:]:
+            if event.timestamp <= timestamp:
                 state = reducer(state, event)
         return state
 
     def all_events(self) -> list[Event]:
         return list(self._events)
 
+    def close(self) -> None:
+        """Drain and stop subscriber workers, then close the segment file."""
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        for sub in self._subscribers:
+            if sub._thread is not None:
+                sub._thread.join()
+        if self._segment is not None:
+            self._segment.close()
+            self._segment = None
+
+    def __enter__(self) -> EventStore:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    # --- internals ---
+
+    def _lagging(self) -> bool:
+        last = self._next_id - 1
+        return any(sub.error is None and last - sub.checkpoint >= self.max_lag
+                   for sub in self._subscribers)
+
+    def _run_subscriber(self, sub: Subscription) -> None:
+        """Worker loop: deliver events after the checkpoint in batches."""
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: self._closing or sub.checkpoint < self._next_id - 1)
+                start = bisect_right(self._events, sub.checkpoint, key=lambda e: e.event_id)
+                batch = self._events[start:start + self.batch_size]
+                if not batch:
+                    return  # closing and fully drained
+            # Handlers run outside the lock so producers are never blocked
+            # by a slow projection, only by the max_lag bound.
+            for event in batch:
+                try:
+                    sub.handler(event)
+                except Exception as exc:
+                    with self._cond:
+                        sub.error = exc
+                        self._cond.notify_all()
+                    return
+                sub.checkpoint = event.event_id
+            with self._cond:
+                self._cond.notify_all()
+
+    def _index(self, event: Event) -> None:
+        self._events.append(event)
+        self._next_id = event.event_id + 1
+        self._by_aggregate.setdefault(event.aggregate_id, _AggregateStream()).add(event)
+        self._by_category.setdefault(event.category, []).append(event)
+
+    # WHY segment files instead of one log? -- A single file grows without
+    # bound. Rolling to a new segment every `segment_max_events` events keeps
+    # files a manageable size for archiving or compaction, while each one is
+    # still strictly append-only.
+    def _load_segments(self) -> None:
+        assert self._dir is not None
+        self._dir.mkdir(parents=True, exist_ok=True)
+        segments = sorted(self._dir.glob(self.SEGMENT_PATTERN))
+        if segments:
+            self._drop_torn_tail(segments[-1])
+        for segment in segments:
+            with segment.open(encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        self._index(_event_from_dict(json.loads(line)))
+        if segments:
+            self._segment_number = int(segments[-1].stem.split("-")[1])
+            # Only the tail's count matters; earlier segments are full.
+            with segments[-1].open(encoding="utf-8") as f:
+                self._segment_events = sum(1 for line in f if line.strip())
+
+    # WHY only the last segment? -- A crash mid-write can leave at most one
+    # partial line, at the end of the segment being appended to. An event
+    # counts as written once its newline is on disk; anything after the
+    # last newline is truncated so the next append starts on a clean line.
+    @staticmethod
+    def _drop_torn_tail(segment: Path) -> None:
+        raw = segment.read_bytes()
+        if raw and not raw.endswith(b"\n"):
+            with segment.open("r+b") as f:
+                f.truncate(raw.rfind(b"\n") + 1)
+
+    def _write(self, event: Event) -> None:
+        assert self._dir is not None
+        line = json.dumps(_event_to_dict(event))
+        if self._segment is None or self._segment_events >= self.segment_max_events:
+            self._roll_segment()
+        assert self._segment is not None
+        self._segment.write(line + "\n")
+        self._segment.flush()
+        self._segment_events += 1
+
+    def _roll_segment(self) -> None:
+        assert self._dir is not None
+        if self._segment is not None:
+            self._segment.close()
+        if self._segment_number == 0 or self._segment_events >= self.segment_max_events:
+            self._segment_number += 1
+            self._segment_events = 0
+        path = self._dir / f"segment-{self._segment_number:06d}.jsonl"
+        self._segment = path.open("a", encoding="utf-8")
+
+
+def _event_to_dict(event: Event) -> dict[str, Any]:
+    return {
+        "event_id": event.event_id,
+        "category": event.category.value,
+        "event_type": event.event_type,
+        "aggregate_id": event.aggregate_id,
+        "data": event.data,
+        "timestamp": event.timestamp,
+        "version": event.version,
+    }
+
+
+def _event_from_dict(raw: dict[str, Any]) -> Event:
+    return Event(
+        event_id=raw["event_id"],
+        category=EventCategory(raw["category"]),
+        event_type=raw["event_type"],
+        aggregate_id=raw["aggregate_id"],
+        data=raw["data"],
+        timestamp=raw["timestamp"],
+        version=raw.get("version", 1),
+    )
+
 
 # --- Projection builders -----------------------------------------------
 
@@ -193,8 +525,9 @@ class InventoryProjection:
 
 # --- Demo ---------------------------------------------------------------
 
-def run_demo() -> dict[str, Any]:
-    store = EventStore()
+def run_demo(store_dir: str | None = None,
+             dispatch: DispatchMode = DispatchMode.SYNC) -> dict[str, Any]:
+    store = EventStore(store_dir, dispatch=dispatch)
 
     orders = OrderCountProjection()
     users = UserActivityProjection()
@@ -224,6 +557,8 @@ def run_demo() -> dict[str, Any]:
         return {"quantity": qty}
 
     inventory_at_5 = store.get_state_at("widget-A", 5.0, inventory_reducer)
+    store.wait_for_subscribers()
+    store.close()
 
     return {
         "total_events": store.count,
@@ -239,12 +574,17 @@ def run_demo() -> dict[str, Any]:
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Event-driven pipeline lab")
     parser.add_argument("--demo", action="store_true", default=True)
+    parser.add_argument("--store-dir", default=None,
+                        help="persist events to segment files in this directory")
+    parser.add_argument("--dispatch", choices=[m.value for m in DispatchMode],
+                        default=DispatchMode.SYNC.value,
+                        help="deliver events to projections inline or on worker threads")
     return parser.parse_args(argv)
 
 
 def main(argv: list[str] | None = None) -> None:
-    parse_args(argv)
-    print(json.dumps(run_demo(), indent=2))
+    args = parse_args(argv)
+    print(json.dumps(run_demo(args.store_dir, DispatchMode(args.dispatch)), indent=2))
 
 
 if __name__ == "__main__":
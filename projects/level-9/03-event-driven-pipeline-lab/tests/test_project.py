@@ -1,13 +1,20 @@
 """Tests for Event-Driven Pipeline Lab.
 
-Covers: event store, projections, subscribers, temporal queries, and filtering.
+Covers: event store, projections, subscribers, temporal queries, filtering,
+indexes, snapshots, segment-file persistence, and async dispatch.
 """
 
 from __future__ import annotations
 
+import gc
+import random
+import threading
+from pathlib import Path
+
 import pytest
 
 from project import (
+    DispatchMode,
     EventCategory,
     EventStore,
     InventoryProjection,
@@ -23,6 +30,15 @@ def store() -> EventStore:
     return EventStore()
 
 
+def quantity_reducer(state, event):
+    qty = state.get("quantity", 0)
+    if event.event_type == "stock_added":
+        qty += event.data.get("quantity", 0)
+    elif event.event_type == "stock_removed":
+        qty -= event.data.get("quantity", 0)
+    return {"quantity": qty}
+
+
 # --- Event store --------------------------------------------------------
 
 class TestEventStore:
@@ -129,3 +145,218 @@ class TestTemporalQueries:
 
         state = store.get_state_at("w", 2.0, reducer)
         assert state["quantity"] == 80  # 50 + 30
+
+
+# --- Indexes and snapshots ----------------------------------------------
+
+class TestIndexes:
+    def test_matches_full_scan(self, store: EventStore) -> None:
+        rng = random.Random(3)
+        categories = list(EventCategory)
+        for _ in range(300):
+            store.append(rng.choice(categories), "e", f"a{rng.randint(1, 8)}", {})
+        events = store.all_events()
+        for aggregate in (None, "a1", "a5", "missing"):
+            for category in (None, EventCategory.ORDER):
+                for after_id in (0, 1, 150, 300):
+                    expected = [
+                        e for e in events
+                        if (not aggregate or e.aggregate_id == aggregate)
+                        and (not category or e.category == category)
+                        and e.event_id > after_id
+                    ]
+                    assert store.get_events(aggregate, category, after_id) == expected
+
+    def test_result_is_a_copy(self, store: EventStore) -> None:
+        store.append(EventCategory.USER, "a", "u1", {})
+        store.get_events().clear()
+        assert store.count == 1
+
+
+class TestSnapshots:
+    def test_replay_resumes_from_snapshot(self) -> None:
+        store = EventStore(snapshot_interval=10)
+        for i in range(100):
+            store.append(EventCategory.INVENTORY, "stock_added", "w", {"quantity": 1}, float(i + 1))
+            store.append(EventCategory.INVENTORY, "stock_added", "other", {"quantity": 1}, float(i + 1))
+
+        calls = 0
+
+        def counting(state, event):
+            nonlocal calls
+            calls += 1
+            return quantity_reducer(state, event)
+
+        assert store.get_state_at("w", 95.0, counting) == {"quantity": 95}
+        assert calls == 95  # only w's events, never "other"
+
+        calls = 0
+        assert store.get_state_at("w", 97.0, counting) == {"quantity": 97}
+        assert calls == 7  # resumed from the snapshot at 90
+
+    def test_out_of_order_timestamps_match_full_scan(self) -> None:
+        store = EventStore(snapshot_interval=2)
+        for ts in (1.0, 5.0, 2.0, 3.0, 9.0, 4.0):
+            store.append(EventCategory.INVENTORY, "stock_added", "w", {"quantity": int(ts)}, ts)
+        for t in (0.5, 2.0, 4.0, 6.0, 10.0):
+            expected = sum(int(e.timestamp) for e in store.all_events() if e.timestamp <= t)
+            assert store.get_state_at("w", t, quantity_reducer).get("quantity", 0) == expected
+
+    def test_throwaway_reducers_do_not_accumulate(self) -> None:
+        store = EventStore(snapshot_interval=2)
+        for i in range(10):
+            store.append(EventCategory.INVENTORY, "stock_added", "w", {"quantity": 1}, float(i + 1))
+        for _ in range(50):
+            state = store.get_state_at("w", 10.0, lambda s, e: quantity_reducer(s, e))
+            assert state == {"quantity": 10}
+        gc.collect()
+        assert len(store._snapshots) == 0
+
+    def test_read_without_snapshot_stores_nothing(self, store: EventStore) -> None:
+        store.append(EventCategory.USER, "a", "u1", {}, 1.0)
+        store.get_state_at("u1", 1.0, quantity_reducer)
+        store.get_state_at("missing", 1.0, quantity_reducer)
+        assert quantity_reducer not in store._snapshots
+
+    def test_snapshot_state_is_isolated(self) -> None:
+        store = EventStore(snapshot_interval=1)
+        store.append(EventCategory.USER, "a", "u1", {}, 1.0)
+
+        def mutating(state, event):
+            state.setdefault("seen", []).append(event.event_id)
+            return state
+
+        assert store.get_state_at("u1", 1.0, mutating) == {"seen": [1]}
+        assert store.get_state_at("u1", 1.0, mutating) == {"seen": [1]}
+
+
+# --- Persistence --------------------------------------------------------
+
+class TestPersistence:
+    def test_reload_from_segments(self, tmp_path: Path) -> None:
+        with EventStore(tmp_path, segment_max_events=3) as store:
+            for i in range(7):
+                store.append(EventCategory.ORDER, "created", f"o{i % 2}", {"n": i})
+
+        assert len(list(tmp_path.glob("segment-*.jsonl"))) == 3
+
+        with EventStore(tmp_path, segment_max_events=3) as reopened:
+            assert reopened.count == 7
+            assert [e.data["n"] for e in reopened.get_events(aggregate_id="o1")] == [1, 3, 5]
+            event = reopened.append(EventCategory.USER, "registered", "u1", {})
+            assert event.event_id == 8
+
+        assert len(list(tmp_path.glob("segment-*.jsonl"))) == 3
+        assert EventStore(tmp_path).count == 8
+
+    def test_torn_final_line_is_dropped(self, tmp_path: Path) -> None:
+        with EventStore(tmp_path) as store:
+            for i in range(3):
+                store.append(EventCategory.ORDER, "created", "o1", {"n": i})
+        segment = next(tmp_path.glob("segment-*.jsonl"))
+        with segment.open("a", encoding="utf-8") as f:
+            f.write('{"event_id": 4, "categ')  # crash mid-write
+
+        with EventStore(tmp_path) as reopened:
+            assert reopened.count == 3
+            assert reopened.append(EventCategory.USER, "a", "u1", {}).event_id == 4
+        assert [e.event_id for e in EventStore(tmp_path).all_events()] == [1, 2, 3, 4]
+
+    def test_rejects_bad_settings(self) -> None:
+        with pytest.raises(ValueError):
+            EventStore(snapshot_interval=0)
+
+
+# --- Dispatch -----------------------------------------------------------
+
+class TestSyncCheckpoints:
+    def test_checkpoint_tracks_last_event(self, store: EventStore) -> None:
+        sub = store.subscribe(lambda e: None, name="noop")
+        store.append(EventCategory.USER, "a", "u1", {})
+        store.append(EventCategory.USER, "b", "u1", {})
+        assert store.checkpoints() == {"noop": 2}
+        assert sub.checkpoint == 2
+
+    def test_subscribe_from_checkpoint_replays(self, store: EventStore) -> None:
+        for kind in ("a", "b", "c"):
+            store.append(EventCategory.USER, kind, "u1", {})
+        received: list[str] = []
+        store.subscribe(lambda e: received.append(e.event_type), from_id=1)
+        assert received == ["b", "c"]
+
+
+class TestAsyncDispatch:
+    def test_projections_catch_up(self) -> None:
+        store = EventStore(dispatch=DispatchMode.ASYNC, batch_size=7)
+        proj = OrderCountProjection()
+        store.subscribe(proj.handle, name="orders")
+        for i in range(50):
+            store.append(EventCategory.ORDER, "created", f"o{i}", {"status": "pending"})
+        assert store.wait_for_subscribers(timeout=5)
+        assert proj.projection.state["by_status"]["pending"] == 50
+        assert store.checkpoints() == {"orders": 50}
+        store.close()
+
+    def test_slow_subscriber_does_not_block_append(self) -> None:
+        store = EventStore(dispatch=DispatchMode.ASYNC)
+        release = threading.Event()
+        store.subscribe(lambda e: release.wait(), name="slow")
+        for _ in range(20):
+            store.append(EventCategory.USER, "a", "u1", {})
+        assert store.checkpoints()["slow"] < 20
+        release.set()
+        assert store.wait_for_subscribers(timeout=5)
+        store.close()
+
+    def test_max_lag_applies_backpressure(self) -> None:
+        store = EventStore(dispatch=DispatchMode.ASYNC, max_lag=3)
+        release = threading.Event()
+        store.subscribe(lambda e: release.wait(), name="slow")
+        producer = threading.Thread(
+            target=lambda: [store.append(EventCategory.USER, "a", "u1", {}) for _ in range(10)])
+        producer.start()
+        producer.join(timeout=0.2)
+        assert producer.is_alive()
+        assert store.count <= 4
+        release.set()
+        producer.join(timeout=5)
+        assert store.count == 10
+        store.close()
+
+    def test_concurrent_producers_get_unique_contiguous_ids(self) -> None:
+        store = EventStore(dispatch=DispatchMode.ASYNC, max_lag=2)
+        store.subscribe(lambda e: None, name="noop")
+        producers = [
+            threading.Thread(target=lambda: [
+                store.append(EventCategory.USER, "a", "u1", {}) for _ in range(200)])
+            for _ in range(4)
+        ]
+        for producer in producers:
+            producer.start()
+        for producer in producers:
+            producer.join(timeout=10)
+        assert [e.event_id for e in store.all_events()] == list(range(1, 801))
+        assert store.wait_for_subscribers(timeout=5)
+        store.close()
+
+    def test_failed_subscriber_resumes_from_checkpoint(self) -> None:
+        store = EventStore(dispatch=DispatchMode.ASYNC)
+        received: list[int] = []
+
+        def flaky(event):
+            if event.event_id == 4 and not received.count(-1):
+                received.append(-1)
+                raise RuntimeError("projection crashed")
+            received.append(event.event_id)
+
+        sub = store.subscribe(flaky, name="flaky")
+        for _ in range(6):
+            store.append(EventCategory.USER, "a", "u1", {})
+        assert store.wait_for_subscribers(timeout=5)
+        assert isinstance(sub.error, RuntimeError)
+        assert sub.checkpoint == 3
+
+        store.subscribe(flaky, name="flaky-retry", from_id=sub.checkpoint)
+        assert store.wait_for_subscribers(timeout=5)
+        assert [i for i in received if i > 0] == [1, 2, 3, 4, 5, 6]
+        store.close()
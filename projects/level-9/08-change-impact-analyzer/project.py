@@ -8,6 +8,7 @@ Design rationale:
 
 Concepts practised:
     - graph traversal (BFS for impact propagation)
+    - SCC condensation and bitset reachability for batch analysis
     - risk scoring with weighted factors
     - dataclasses for changes and impact results
     - dependency chain analysis
@@ -93,6 +94,192 @@ class ImpactResult:
         }
 
 
+# --- Reachability index -------------------------------------------------
+
+# WHY precompute? -- A change advisory board scores hundreds of changes
+# against the same graph. A BFS per change, followed by a lookup of every
+# affected service, repeats the same work many times. Collapsing each
+# strongly connected component (services in one cycle share a blast
+# radius) and walking the condensed DAG once in topological order gives
+# every service its transitive dependents as an int bitset, plus the
+# teams, SLOs and most critical tier behind that radius. Each change is
+# then a dictionary lookup.
+class ReachabilityIndex:
+    """Transitive-dependent bitsets and impact aggregates per service.
+
+    Bit i of a reach mask stands for the i-th service in sorted name
+    order, so decoding a mask yields names already sorted.
+    """
+
+    def __init__(self, services: dict[str, Service],
+                 dependents: dict[str, set[str]]) -> None:
+        self._services = services
+        self._dependents = dependents
+        self._names = sorted(set(services) | set(dependents)
+                             | {d for ds in dependents.values() for d in ds})
+        self._bit = {name: 1 << i for i, name in enumerate(self._names)}
+        self._reach: dict[str, int] = {}
+        self._teams: dict[str, frozenset[str]] = {}
+        self._slos: dict[str, frozenset[str]] = {}
+        self._min_tier: dict[str, int] = {}
+        self._depth: dict[str, int] = {}
+        self._build()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._bit
+
+    def _build(self) -> None:
+        """Tarjan's SCC algorithm, aggregating each component as it closes.
+
+        Tarjan emits a component only after every component reachable
+        from it, which is exactly the order the aggregation needs.
+        """
+        index: dict[str, int] = {}
+        low: dict[str, int] = {}
+        stack: list[str] = []
+        on_stack: set[str] = set()
+        counter = 0
+
+        for root in self._names:
+            if root in index:
+                continue
+            work = [(root, iter(sorted(self._dependents.get(root, ()))))]
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                node, children = work[-1]
+                advanced = False
+                for child in children:
+                    if child not in index:
+                        index[child] = low[child] = counter
+                        counter += 1
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(sorted(self._dependents.get(child, ())))))
+                        advanced = True
+                        break
+                    if child in on_stack:
+                        low[node] = min(low[node], index[child])
+                if advanced:
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    members: list[str] = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        members.append(member)
+                        if member == node:
+                            break
+                    self._close_component(members)
+
+    def _close_component(self, members: list[str]) -> None:
+        member_set = set(members)
+        cyclic = len(members) > 1 or members[0] in self._dependents.get(members[0], ())
+        reach = 0
+        teams: set[str] = set()
+        slos: set[str] = set()
+        min_tier = 3
+        for member in members:
+            if cyclic:
+                reach |= self._bit[member]
+            svc = self._services.get(member)
+            if svc:
+                teams.add(svc.team)
+                slos.update(svc.slos)
+                min_tier = min(min_tier, svc.tier)
+            for dep in self._dependents.get(member, ()):
+                if dep in member_set:
+                    continue
+                # dep's component closed earlier; its aggregates cover dep itself
+                reach |= self._bit[dep] | self._reach[dep]
+                teams |= self._teams[dep]
+                slos |= self._slos[dep]
+                min_tier = min(min_tier, self._min_tier[dep])
+        frozen_teams, frozen_slos = frozenset(teams), frozenset(slos)
+        for member in members:
+            self._reach[member] = reach
+            self._teams[member] = frozen_teams
+            self._slos[member] = frozen_slos
+            self._min_tier[member] = min_tier
+
+    def _mask(self, names: Any) -> int:
+        mask = 0
+        for name in names:
+            mask |= self._bit[name]
+        return mask
+
+    def names(self, mask: int) -> list[str]:
+        """Decode a mask into sorted service names."""
+        # bin() reversed puts bit i at position i; one C-level pass.
+        return [self._names[i] for i, bit in enumerate(bin(mask)[:1:-1]) if bit == "1"]
+
+    def mask(self, names: Any) -> int:
+        """Encode service names (all indexed) into a mask."""
+        return self._mask(names)
+
+    def reach(self, service: str) -> int:
+        """Mask of services transitively depending on `service`."""
+        return self._reach.get(service, 0)
+
+    def depth(self, service: str) -> int:
+        """BFS depth of `service`'s dependents, computed on first request.
+
+        WHY lazy? -- Depth cannot be read off the reach masks. Computing
+        it for every service up front costs O(depth x services) on deep
+        graphs, but a batch only ever asks about the changed services.
+        """
+        if service not in self._depth:
+            self._depth[service] = self._bfs_depth(service)
+        return self._depth[service]
+
+    def _bfs_depth(self, service: str) -> int:
+        seen: set[str] = set()
+        frontier = [service]
+        depth = 0
+        while True:
+            frontier = [d for n in frontier for d in self._dependents.get(n, ())
+                        if d not in seen and not seen.add(d)]
+            if not frontier:
+                return depth
+            depth += 1
+
+    def impact(self, service: str) -> tuple[frozenset[str], frozenset[str], int]:
+        """Teams, SLOs and minimum tier across the service and its dependents."""
+        if service not in self._bit:
+            return frozenset(), frozenset(), 3
+        return self._teams[service], self._slos[service], self._min_tier[service]
+
+    def add_edge(self, source: str, dep: str) -> bool:
+        """Record that `dep` now depends on `source`, updating in place.
+
+        Only services whose reach contains `source` (and `source` itself)
+        can change. Returns False if either endpoint is unknown, in which
+        case the caller must rebuild.
+        """
+        if source not in self._bit or dep not in self._bit:
+            return False
+        source_bit = self._bit[source]
+        added = self._bit[dep] | self._reach[dep]
+        teams, slos, tier = self._teams[dep], self._slos[dep], self._min_tier[dep]
+        for name in self._names:
+            if name != source and not self._reach[name] & source_bit:
+                continue
+            self._depth.pop(name, None)  # shorter paths are possible
+            if self._reach[name] | added == self._reach[name]:
+                continue
+            self._reach[name] |= added
+            self._teams[name] = self._teams[name] | teams
+            self._slos[name] = self._slos[name] | slos
+            self._min_tier[name] = min(self._min_tier[name], tier)
+        return True
+
+
 # --- Service graph ------------------------------------------------------
 
 class ServiceGraph:
@@ -102,16 +289,28 @@ class ServiceGraph:
         self._services: dict[str, Service] = {}
         self._dependencies: dict[str, set[str]] = {}  # service -> depends_on
         self._dependents: dict[str, set[str]] = {}     # service -> depended_on_by
+        self._index: ReachabilityIndex | None = None
 
     def add_service(self, service: Service) -> None:
         self._services[service.name] = service
         self._dependencies.setdefault(service.name, set())
         self._dependents.setdefault(service.name, set())
+        self._index = None  # new bit positions / team or tier changes
 
     def add_dependency(self, from_svc: str, to_svc: str) -> None:
         """from_svc depends on to_svc."""
+        if from_svc in self._dependents.get(to_svc, ()):
+            return
         self._dependencies.setdefault(from_svc, set()).add(to_svc)
         self._dependents.setdefault(to_svc, set()).add(from_svc)
+        if self._index is not None and not self._index.add_edge(to_svc, from_svc):
+            self._index = None
+
+    def reachability(self) -> ReachabilityIndex:
+        """Return the reachability index, building it if stale."""
+        if self._index is None:
+            self._index = ReachabilityIndex(self._services, self._dependents)
+        return self._index
 
     def get_service(self, name: str) -> Service | None:
         return self._services.get(name)
@@ -167,7 +366,37 @@ class ChangeImpactAnalyzer:
                 slos.update(svc.slos)
                 min_tier = min(min_tier, svc.tier)
 
-        risk_score = self._compute_risk(change, len(all_affected), max_depth, min_tier)
+        return self._build_result(
+            change, sorted(direct), sorted(transitive - direct),
+            len(all_affected), max_depth, teams, slos, min_tier,
+        )
+
+    def analyze_batch(self, changes: list[Change]) -> list[ImpactResult]:
+        """Analyze many changes against a precomputed reachability index.
+
+        Gives the same results as calling analyze() for each change, but
+        the graph is condensed once and each change becomes a lookup.
+        """
+        index = self._graph.reachability()
+        results: list[ImpactResult] = []
+        for change in changes:
+            service = change.service
+            direct_names = self._graph.direct_dependents(service)
+            direct = index.mask(direct_names)
+            transitive = index.reach(service)
+            self_bit = index.mask([service]) if service in index else 0
+            teams, slos, min_tier = index.impact(service)
+            results.append(self._build_result(
+                change, sorted(direct_names), index.names(transitive & ~direct),
+                (transitive | self_bit).bit_count() or 1, index.depth(service),
+                teams, slos, min_tier,
+            ))
+        return results
+
+    def _build_result(self, change: Change, direct: list[str], transitive: list[str],
+                      affected_count: int, max_depth: int, teams: Any,
+                      slos: Any, min_tier: int) -> ImpactResult:
+        risk_score = self._compute_risk(change, affected_count, max_depth, min_tier)
         risk_level = self._score_to_level(risk_score)
 
         recommendations = self._generate_recommendations(
@@ -176,8 +405,8 @@ class ChangeImpactAnalyzer:
 
         return ImpactResult(
             change_id=change.change_id,
-            directly_affected=sorted(direct),
-            transitively_affected=sorted(transitive - direct),
+            directly_affected=direct,
+            transitively_affected=transitive,
             affected_teams=sorted(teams),
             affected_slos=sorted(slos),
             risk_level=risk_level,
@@ -1,10 +1,13 @@
 """Tests for Change Impact Analyzer.
 
-Covers: service graph, impact traversal, risk scoring, and recommendations.
+Covers: service graph, impact traversal, risk scoring, recommendations,
+and batch analysis over the reachability index.
 """
 
 from __future__ import annotations
 
+import random
+
 import pytest
 
 from project import (
@@ -97,3 +100,68 @@ class TestSerialization:
         assert "risk_level" in d
         assert "affected_teams" in d
         assert "recommendations" in d
+
+
+# --- Batch analysis -----------------------------------------------------
+
+def _random_graph(seed: int, size: int = 40) -> ServiceGraph:
+    rng = random.Random(seed)
+    g = ServiceGraph()
+    for i in range(size):
+        g.add_service(Service(f"s{i}", f"team-{rng.randint(1, 6)}", tier=rng.randint(1, 3),
+                              slos=[f"slo-{i}"] if rng.random() < 0.3 else []))
+    for i in range(size):
+        for _ in range(rng.randint(0, 3)):
+            g.add_dependency(f"s{i}", f"s{rng.randrange(size)}")  # cycles included
+    return g
+
+
+class TestAnalyzeBatch:
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_single_analysis(self, seed: int) -> None:
+        g = _random_graph(seed)
+        g.add_dependency("unregistered", "s0")
+        analyzer = ChangeImpactAnalyzer(g)
+        changes = [Change(f"c{i}", svc, ChangeType.CODE, "x")
+                   for i, svc in enumerate([f"s{i}" for i in range(40)] + ["unregistered", "missing"])]
+        batch = [r.to_dict() for r in analyzer.analyze_batch(changes)]
+        assert batch == [analyzer.analyze(c).to_dict() for c in changes]
+
+    def test_cycle_members_share_blast_radius(self, graph: ServiceGraph) -> None:
+        graph.add_dependency("A", "D")  # A -> D -> B -> A
+        index = graph.reachability()
+        assert index.names(index.reach("A")) == ["A", "B", "C", "D"]
+        assert index.reach("B") == index.reach("D")
+        teams, _, min_tier = index.impact("D")
+        assert teams == {"team-1", "team-2", "team-3"} and min_tier == 1
+
+    def test_add_dependency_updates_index_in_place(self) -> None:
+        g = _random_graph(7)
+        analyzer = ChangeImpactAnalyzer(g)
+        changes = [Change(f"c{i}", f"s{i}", ChangeType.SCHEMA, "x") for i in range(40)]
+        analyzer.analyze_batch(changes)
+        index = g.reachability()
+        rng = random.Random(7)
+        for _ in range(15):
+            g.add_dependency(f"s{rng.randrange(40)}", f"s{rng.randrange(40)}")
+            assert g.reachability() is index
+            batch = [r.to_dict() for r in analyzer.analyze_batch(changes)]
+            assert batch == [analyzer.analyze(c).to_dict() for c in changes]
+
+    def test_depth_is_computed_only_for_queried_services(self) -> None:
+        g = ServiceGraph()
+        for i in range(50):
+            g.add_service(Service(f"s{i}", "team-1"))
+            if i:
+                g.add_dependency(f"s{i}", f"s{i - 1}")  # linear chain
+        index = g.reachability()
+        assert index.depth("s0") == g.transitive_dependents("s0")[1] == 49
+        assert index.depth("s40") == 9
+        assert sorted(index._depth) == ["s0", "s40"]
+
+    def test_add_service_rebuilds_index(self, graph: ServiceGraph) -> None:
+        index = graph.reachability()
+        graph.add_service(Service("E", "team-4", tier=3))
+        graph.add_dependency("E", "D")
+        assert graph.reachability() is not index
+        assert "E" in graph.reachability().names(graph.reachability().reach("A"))
@@ -12,17 +12,28 @@ Concepts practised:
     - statistical modeling (percentiles, confidence intervals)
     - strategy pattern for estimation methods
     - enum-based complexity classification
+    - vectorized sampling and common random numbers for scenario comparison
 """
 
 from __future__ import annotations
 
 import argparse
 import json
+import math
 import random
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property
 from typing import Any, Callable
 
+# NumPy is optional: with it, every phase x run sample is drawn in one
+# vectorized call; without it the pure-Python engine below is used.
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
 
 # --- Domain types -------------------------------------------------------
 
@@ -76,7 +87,18 @@ class RecoveryEstimate:
     """Complete recovery time estimate with confidence intervals."""
     incident_id: str
     phase_estimates: list[PhaseEstimate] = field(default_factory=list)
-    simulated_totals: list[float] = field(default_factory=list)
+    # One total per run: a list, or the NumPy engine's unsorted array.
+    totals: Any = field(default_factory=list, repr=False)
+
+    # WHY keep the raw array? -- At 100k runs, sorting and converting to a
+    # list costs far more than sampling. Percentiles are read straight off
+    # the array; the sorted list is only built if someone asks for it.
+    @cached_property
+    def simulated_totals(self) -> list[float]:
+        """Simulated totals in ascending order."""
+        if np is not None and isinstance(self.totals, np.ndarray):
+            return np.sort(self.totals).tolist()
+        return sorted(self.totals)
 
     @property
     def total_expected(self) -> float:
@@ -84,15 +106,23 @@ class RecoveryEstimate:
 
     @property
     def p50(self) -> float:
-        return _percentile(self.simulated_totals, 50)
+        return self._headline_percentiles[0]
 
     @property
     def p90(self) -> float:
-        return _percentile(self.simulated_totals, 90)
+        return self._headline_percentiles[1]
 
     @property
     def p99(self) -> float:
-        return _percentile(self.simulated_totals, 99)
+        return self._headline_percentiles[2]
+
+    @cached_property
+    def _headline_percentiles(self) -> tuple[float, float, float]:
+        # One np.percentile() call partitions the array once for all three.
+        if np is not None and isinstance(self.totals, np.ndarray) and self.totals.size:
+            p50, p90, p99 = np.percentile(self.totals, (50, 90, 99)).tolist()
+            return p50, p90, p99
+        return tuple(_percentile(self.totals, pct) for pct in (50, 90, 99))
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -128,9 +158,61 @@ def _percentile(data: list[float], pct: float) -> float:
     return sorted_data[f] + (k - f) * (sorted_data[c] - sorted_data[f])
 
 
-def _triangular_sample(low: float, mode: float, high: float, rng: random.Random) -> float:
-    """Sample from triangular distribution — models 3-point estimates."""
-    return rng.triangular(low, high, mode)
+# WHY inverse-CDF transforms of shared uniforms? -- Drawing the uniforms
+# once and mapping them through each phase's triangular inverse CDF lets
+# compare_scenarios() feed the *same* random numbers to both scenarios
+# (common random numbers). The difference between them then reflects the
+# profiles, not sampling noise, so far fewer runs give a stable answer.
+# The arithmetic mirrors random.triangular(), so seeded results match it.
+def _triangular_totals_python(phases: list[PhaseEstimate], uniforms: list[float],
+                              runs: int, stride: int) -> list[float]:
+    """Sum one triangular sample per phase for each run (pure Python)."""
+    params = []
+    for p in phases:
+        low, mode, high = p.min_minutes, p.expected_minutes, p.max_minutes
+        c = (mode - low) / (high - low) if high != low else None
+        params.append((low, high, c))
+
+    totals: list[float] = []
+    for run in range(runs):
+        base = run * stride
+        total = 0.0
+        for i, (low, high, c) in enumerate(params):
+            if c is None:
+                total += low
+                continue
+            u = uniforms[base + i]
+            if u > c:
+                total += high + (low - high) * math.sqrt((1.0 - u) * (1.0 - c))
+            else:
+                total += low + (high - low) * math.sqrt(u * c)
+        totals.append(total)
+    totals.sort()
+    return totals
+
+
+def _triangular_totals_numpy(phases: list[PhaseEstimate], uniforms: Any) -> Any:
+    """Vectorized version: `uniforms` is a (>= len(phases), runs) array.
+
+    Returns the per-run totals as an unsorted array.
+    """
+    # WHY one contiguous row per phase? -- Broadcasting a handful of phase
+    # parameters across (runs, phases) rows is several times slower than
+    # streaming through one long row per phase with scalar parameters.
+    totals = np.zeros(uniforms.shape[1])
+    for p, u in zip(phases, uniforms):
+        low, mode, high = float(p.min_minutes), float(p.expected_minutes), float(p.max_minutes)
+        width = high - low
+        if width == 0:
+            totals += low
+            continue
+        c = (mode - low) / width
+        upper = u > c
+        offset = np.where(upper, (1.0 - u) * (1.0 - c), u * c)
+        np.sqrt(offset, out=offset)
+        offset *= width
+        totals += np.where(upper, high - offset, low + offset)
+    return totals
 
 
 # --- Estimation engine --------------------------------------------------
@@ -204,18 +286,51 @@ def default_estimation_strategy(profile: IncidentProfile) -> list[PhaseEstimate]
     return estimates
 
 
+ENGINES = ("auto", "numpy", "python")
+# Vectorized sampling makes 100k runs cheap; the pure-Python fallback keeps
+# the original 1k so a default estimate() stays fast without NumPy.
+DEFAULT_SIMULATION_RUNS = {"numpy": 100_000, "python": 1000}
+
+
+def _sweep_job(job: tuple[EstimationStrategy, IncidentProfile, int, int, str]) -> RecoveryEstimate:
+    """Process-pool entry point for RecoveryTimeEstimator.sweep()."""
+    strategy, profile, runs, seed, engine = job
+    return RecoveryTimeEstimator(strategy, runs, seed, engine).estimate(profile)
+
+
 class RecoveryTimeEstimator:
-    """Estimates incident recovery time using phase-based modeling."""
+    """Estimates incident recovery time using phase-based modeling.
+
+    engine="auto" uses NumPy when it is installed and the pure-Python
+    engine otherwise; pass "numpy" or "python" to force one. With the same
+    seed the python engine reproduces random.triangular() draw for draw.
+    simulation_runs defaults to DEFAULT_SIMULATION_RUNS for the engine.
+    """
 
     def __init__(
         self,
         strategy: EstimationStrategy = default_estimation_strategy,
-        simulation_runs: int = 1000,
+        simulation_runs: int | None = None,
         seed: int | None = None,
+        engine: str = "auto",
     ) -> None:
+        if engine not in ENGINES:
+            raise ValueError(f"engine must be one of {ENGINES}, got {engine!r}")
+        if engine == "numpy" and np is None:
+            raise ImportError("engine='numpy' requires NumPy to be installed")
+        if engine == "auto":
+            engine = "numpy" if np is not None else "python"
         self._strategy = strategy
-        self._simulation_runs = simulation_runs
+        self._simulation_runs = (
+            DEFAULT_SIMULATION_RUNS[engine] if simulation_runs is None else simulation_runs
+        )
+        self._engine = engine
         self._rng = random.Random(seed)
+        self._np_rng = np.random.default_rng(seed) if engine == "numpy" else None
+
+    @property
+    def engine(self) -> str:
+        return self._engine
 
     def estimate(self, profile: IncidentProfile) -> RecoveryEstimate:
         """Generate a recovery estimate with Monte Carlo simulation."""
@@ -224,26 +339,56 @@ class RecoveryTimeEstimator:
         return RecoveryEstimate(
             incident_id=profile.incident_id,
             phase_estimates=phase_estimates,
-            simulated_totals=simulated,
+            totals=simulated,
         )
 
-    def _simulate(self, phases: list[PhaseEstimate]) -> list[float]:
+    def _simulate(self, phases: list[PhaseEstimate]) -> Any:
         """Run Monte Carlo simulation sampling from triangular distributions."""
-        totals: list[float] = []
-        for _ in range(self._simulation_runs):
-            total = sum(
-                _triangular_sample(p.min_minutes, p.expected_minutes, p.max_minutes, self._rng)
-                for p in phases
-            )
-            totals.append(total)
-        return totals
+        return self._totals(phases, self._draw_uniforms(len(phases)), len(phases))
+
+    def _draw_uniforms(self, width: int) -> Any:
+        """Draw runs x width uniforms in [0, 1): a phase-major array, or a flat run-major list."""
+        if self._np_rng is not None:
+            return self._np_rng.random((width, self._simulation_runs))
+        rand = self._rng.random
+        return [rand() for _ in range(self._simulation_runs * width)]
+
+    def _totals(self, phases: list[PhaseEstimate], uniforms: Any, width: int) -> Any:
+        if self._np_rng is not None:
+            return _triangular_totals_numpy(phases, uniforms)
+        return _triangular_totals_python(phases, uniforms, self._simulation_runs, width)
+
+    def sweep(self, profiles: list[IncidentProfile],
+              workers: int | None = None) -> list[RecoveryEstimate]:
+        """Estimate many scenarios, optionally across a process pool.
+
+        Every scenario is simulated from the same seed, so the estimates
+        share common random numbers and are directly comparable. With
+        workers > 1 the strategy must be picklable (a module-level function).
+        """
+        seed = self._rng.getrandbits(63)
+        jobs = [(self._strategy, p, self._simulation_runs, seed, self._engine) for p in profiles]
+        if workers and workers > 1 and len(jobs) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(_sweep_job, jobs))
+        return [_sweep_job(job) for job in jobs]
 
     def compare_scenarios(
         self, base: IncidentProfile, improved: IncidentProfile,
     ) -> dict[str, Any]:
-        """Compare two incident profiles to show improvement potential."""
-        base_est = self.estimate(base)
-        improved_est = self.estimate(improved)
+        """Compare two incident profiles to show improvement potential.
+
+        Both scenarios are simulated from the same random draws (common
+        random numbers), so the difference is not swamped by noise.
+        """
+        base_phases = self._strategy(base)
+        improved_phases = self._strategy(improved)
+        width = max(len(base_phases), len(improved_phases))
+        uniforms = self._draw_uniforms(width)
+        base_est = RecoveryEstimate(
+            base.incident_id, base_phases, self._totals(base_phases, uniforms, width))
+        improved_est = RecoveryEstimate(
+            improved.incident_id, improved_phases, self._totals(improved_phases, uniforms, width))
         return {
             "base_p50": round(base_est.p50, 1),
             "improved_p50": round(improved_est.p50, 1),
@@ -1,11 +1,14 @@
 """Tests for Recovery Time Estimator.
 
 Covers: phase estimation, severity multipliers, Monte Carlo simulation,
-scenario comparison, and incident profile attributes.
+scenario comparison, incident profile attributes, simulation engines,
+common random numbers, and scenario sweeps.
 """
 
 from __future__ import annotations
 
+import random
+
 import pytest
 
 from project import (
@@ -16,6 +19,7 @@ from project import (
     Severity,
     _percentile,
     default_estimation_strategy,
+    np,
 )
 
 
@@ -156,3 +160,78 @@ class TestSerialization:
         assert "p50_minutes" in d
         assert "p90_minutes" in d
         assert len(d["phases"]) == 5
+
+
+# --- Engines ------------------------------------------------------------
+
+class TestEngines:
+    def test_python_engine_matches_random_triangular(self, sev1_profile: IncidentProfile) -> None:
+        phases = default_estimation_strategy(sev1_profile)
+        rng = random.Random(7)
+        expected = sorted(
+            sum(rng.triangular(p.min_minutes, p.max_minutes, p.expected_minutes) for p in phases)
+            for _ in range(300)
+        )
+        est = RecoveryTimeEstimator(seed=7, simulation_runs=300, engine="python")
+        assert est.estimate(sev1_profile).simulated_totals == expected
+
+    def test_degenerate_phase_uses_its_only_value(self) -> None:
+        fixed = [PhaseEstimate(RecoveryPhase.FIX, 5.0, 5.0, 5.0)]
+        est = RecoveryTimeEstimator(lambda _: fixed, simulation_runs=10, seed=1, engine="python")
+        assert est.estimate(IncidentProfile("x", Severity.SEV4)).simulated_totals == [5.0] * 10
+
+    def test_unknown_engine_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            RecoveryTimeEstimator(engine="gpu")
+
+    @pytest.mark.skipif(np is not None, reason="NumPy is installed")
+    def test_numpy_engine_requires_numpy(self) -> None:
+        with pytest.raises(ImportError):
+            RecoveryTimeEstimator(engine="numpy")
+
+    def test_numpy_engine_agrees_with_python(self, sev1_profile: IncidentProfile) -> None:
+        pytest.importorskip("numpy")
+        fast = RecoveryTimeEstimator(seed=3, simulation_runs=50_000, engine="numpy")
+        slow = RecoveryTimeEstimator(seed=3, simulation_runs=50_000, engine="python")
+        a, b = fast.estimate(sev1_profile), slow.estimate(sev1_profile)
+        assert len(a.simulated_totals) == 50_000
+        assert a.p50 == pytest.approx(b.p50, rel=0.02)
+        assert a.p90 == pytest.approx(b.p90, rel=0.02)
+
+    def test_numpy_engine_accepts_int_minutes(self) -> None:
+        pytest.importorskip("numpy")
+        phases = [PhaseEstimate(RecoveryPhase.FIX, 5, 10, 20), PhaseEstimate(RecoveryPhase.DEPLOYMENT, 3, 3, 3)]
+        est = RecoveryTimeEstimator(lambda _: phases, simulation_runs=1000, seed=1, engine="numpy")
+        totals = est.estimate(IncidentProfile("x", Severity.SEV4)).simulated_totals
+        assert 8 <= totals[0] <= totals[-1] <= 23
+
+    def test_numpy_percentiles_match_sorted_list(self, sev1_profile: IncidentProfile) -> None:
+        pytest.importorskip("numpy")
+        est = RecoveryTimeEstimator(seed=2, simulation_runs=5000, engine="numpy")
+        result = est.estimate(sev1_profile)
+        p50, p99 = result.p50, result.p99
+        assert "simulated_totals" not in vars(result)  # sorted list not built yet
+        totals = result.simulated_totals
+        assert totals == sorted(totals)
+        assert p50 == pytest.approx(_percentile(totals, 50))
+        assert p99 == pytest.approx(_percentile(totals, 99))
+
+
+class TestCommonRandomNumbers:
+    def test_identical_scenarios_show_no_difference(self, estimator: RecoveryTimeEstimator) -> None:
+        p = IncidentProfile("a", Severity.SEV2, ["api"])
+        result = estimator.compare_scenarios(p, p)
+        assert result["base_p50"] == result["improved_p50"]
+        assert result["improvement_pct"] == 0
+
+    def test_sweep_shares_random_numbers(self, sev1_profile: IncidentProfile) -> None:
+        est = RecoveryTimeEstimator(seed=5, simulation_runs=100)
+        first, second = est.sweep([sev1_profile, sev1_profile])
+        assert first.simulated_totals == second.simulated_totals
+
+    def test_process_pool_sweep_matches_serial(self, sev1_profile: IncidentProfile,
+                                               sev3_profile: IncidentProfile) -> None:
+        profiles = [sev1_profile, sev3_profile]
+        serial = RecoveryTimeEstimator(seed=11, simulation_runs=100).sweep(profiles)
+        pooled = RecoveryTimeEstimator(seed=11, simulation_runs=100).sweep(profiles, workers=2)
+        assert [e.to_dict() for e in pooled] == [e.to_dict() for e in serial]
@@ -12,6 +12,8 @@ import re
 import sys
 from pathlib import Path
 
+from repo_files import read_text
+
 ROOT_DIR = Path(__file__).parent.parent
 ELITE_DIR = ROOT_DIR / "projects" / "elite-track"
 
@@ -61,7 +63,7 @@ def check() -> bool:
         print("missing elite track index: projects/elite-track/README.md")
         return False
 
-    index_text = elite_readme.read_text(encoding="utf-8", errors="replace")
+    index_text = read_text(elite_readme)
     index_lines = index_text.splitlines()
 
     non_blank = [line.strip() for line in index_lines if line.strip()]
@@ -90,7 +92,7 @@ def check() -> bool:
 
         # README checks
         if readme.exists():
-            content = readme.read_text(encoding="utf-8", errors="replace")
+            content = read_text(readme)
             lines = content.splitlines()
             non_blank_r = [line.strip() for line in lines if line.strip()]
             if len(non_blank_r) < 2 or non_blank_r[1] != "Home: [README](../../../README.md)":
@@ -117,7 +119,7 @@ def check() -> bool:
 
         # project.py checks
         if script.exists():
-            text = script.read_text(encoding="utf-8", errors="replace")
+            text = read_text(script)
             first = first_non_empty_line(text)
             if not first.startswith('"""'):
                 print(
@@ -136,7 +138,7 @@ def check() -> bool:
 
         # test_project.py checks
         if test_file.exists():
-            text = test_file.read_text(encoding="utf-8", errors="replace")
+            text = read_text(test_file)
             first = first_non_empty_line(text)
             if not first.startswith('"""'):
                 print(
@@ -11,6 +11,8 @@ import re
 import sys
 from pathlib import Path
 
+from repo_files import read_text
+
 ROOT_DIR = Path(__file__).parent.parent
 PROJECTS_DIR = ROOT_DIR / "projects"
 
@@ -24,7 +26,7 @@ def check() -> bool:
         print("missing projects index: projects/README.md")
         return False
 
-    index_text = projects_index.read_text(encoding="utf-8", errors="replace")
+    index_text = read_text(projects_index)
     index_lines = index_text.splitlines()
 
     # Home link on second non-blank line
@@ -48,7 +50,7 @@ def check() -> bool:
             fail = True
             continue
 
-        content = level_readme.read_text(encoding="utf-8", errors="replace")
+        content = read_text(level_readme)
         lines = content.splitlines()
 
         # Home link
@@ -4,40 +4,132 @@ Python replacement for check_markdown_links.sh
 Verifies that all relative markdown links (./path.md) in .md files resolve
 to existing files. Works on Windows without bash or ripgrep.
 
+Link targets are resolved against an in-memory set of every file in the
+repository (built once by repo_files.py) instead of calling exists() per
+link. Large trees can split the scan across processes with --jobs, and
+--changed only re-scans files edited since the last recorded run.
+
 Usage:
     python tools/check_markdown_links.py
+    python tools/check_markdown_links.py --jobs 4
+    python tools/check_markdown_links.py --changed
 """
 
+import argparse
+import json
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+from repo_files import all_files, files_with_suffix, read_text
+
 ROOT_DIR = Path(__file__).parent.parent
+STATE_FILE = ROOT_DIR / "data" / "link_check_state.json"
 
 LINK_PATTERN = re.compile(r"\]\(\./([^)]+\.md)\)")
 
 
-def check_markdown_links() -> bool:
-    missing = False
+def scan_file(md_file: Path) -> list[tuple[int, str, str]]:
+    """Return (line_num, target, resolved_path) for each relative link in a file."""
+    try:
+        content = read_text(md_file)
+    except Exception:
+        return []
 
-    for md_file in sorted(ROOT_DIR.rglob("*.md")):
-        # Skip PythonBootcamp directory
-        if "PythonBootcamp" in str(md_file):
-            continue
+    links = []
+    base = str(md_file.parent)
+    for line_num, line in enumerate(content.splitlines(), start=1):
+        for match in LINK_PATTERN.finditer(line):
+            target = match.group(1)
+            links.append((line_num, target, os.path.normpath(os.path.join(base, target))))
+    return links
+
+
+def scan_chunk(md_files: list[Path]) -> dict[str, list[tuple[int, str, str]]]:
+    """Worker entry point: scan a chunk of files and key results by path."""
+    return {str(md_file): scan_file(md_file) for md_file in md_files}
+
+
+def file_stamp(md_file: Path) -> list[int]:
+    """Return [size, mtime_ns] used to detect edits between runs."""
+    st = md_file.stat()
+    return [st.st_size, st.st_mtime_ns]
 
+
+def load_state() -> dict:
+    """Load per-file stamps and links recorded by the last run."""
+    if STATE_FILE.exists():
         try:
-            content = md_file.read_text(encoding="utf-8", errors="replace")
-        except Exception:
-            continue
-
-        for line_num, line in enumerate(content.splitlines(), start=1):
-            for match in LINK_PATTERN.finditer(line):
-                target = match.group(1)
-                resolved = md_file.parent / target
-                if not resolved.exists():
-                    rel_path = md_file.relative_to(ROOT_DIR)
-                    print(f"missing link target: {rel_path}:{line_num} -> ./{target}")
-                    missing = True
+            with open(STATE_FILE, encoding="utf-8") as f:
+                return json.load(f).get("files", {})
+        except (json.JSONDecodeError, OSError, AttributeError):
+            pass
+    return {}
+
+
+def save_state(files: dict) -> None:
+    """Record per-file stamps and links for the next --changed run."""
+    STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(STATE_FILE, "w", encoding="utf-8") as f:
+        json.dump({"files": files}, f)
+
+
+def check_markdown_links(jobs: int = 1, changed_only: bool = False) -> bool:
+    missing = False
+    existing = all_files()
+
+    md_files = [
+        md_file for md_file in files_with_suffix(".md")
+        # Skip PythonBootcamp directory
+        if "PythonBootcamp" not in str(md_file)
+    ]
+
+    # Reuse recorded links for files whose size and mtime are unchanged.
+    previous = load_state() if changed_only else {}
+    root = str(ROOT_DIR)
+    state = {}
+    links_by_file = {}
+    to_scan = []
+    for md_file in md_files:
+        key = md_file.relative_to(ROOT_DIR).as_posix()
+        stamp = file_stamp(md_file)
+        entry = previous.get(key)
+        if entry and entry["stamp"] == stamp:
+            links_by_file[str(md_file)] = [
+                (line_num, target, os.path.normpath(os.path.join(root, rel)))
+                for line_num, target, rel in entry["links"]
+            ]
+        else:
+            to_scan.append(md_file)
+        state[key] = {"stamp": stamp}
+
+    if jobs > 1 and len(to_scan) > jobs:
+        chunk_size = -(-len(to_scan) // jobs)
+        chunks = [to_scan[i:i + chunk_size] for i in range(0, len(to_scan), chunk_size)]
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            for result in pool.map(scan_chunk, chunks):
+                links_by_file.update(result)
+    else:
+        links_by_file.update(scan_chunk(to_scan))
+
+    for md_file in md_files:
+        links = links_by_file[str(md_file)]
+        rel_path = md_file.relative_to(ROOT_DIR)
+        for line_num, target, resolved in links:
+            # A set miss is confirmed on disk: on case-insensitive filesystems
+            # a link whose case differs from the file still resolves.
+            if resolved not in existing and not os.path.exists(resolved):
+                print(f"missing link target: {rel_path}:{line_num} -> ./{target}")
+                missing = True
+        # Store targets relative to the repo so the state file is portable.
+        state[rel_path.as_posix()]["links"] = [
+            [line_num, target, os.path.relpath(resolved, root)] for line_num, target, resolved in links
+        ]
+
+    if changed_only:
+        save_state(state)
 
     if missing:
         print("markdown link check failed")
@@ -48,7 +140,17 @@ def check_markdown_links() -> bool:
 
 
 def main() -> None:
-    success = check_markdown_links()
+    parser = argparse.ArgumentParser(description="Verify relative markdown links resolve.")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1,
+        help="scan files across N processes (default: 1)",
+    )
+    parser.add_argument(
+        "--changed", action="store_true",
+        help="only re-scan files changed since the last --changed run",
+    )
+    args, _ = parser.parse_known_args()
+    success = check_markdown_links(jobs=args.jobs, changed_only=args.changed)
     sys.exit(0 if success else 1)
 
 
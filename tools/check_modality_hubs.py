@@ -13,6 +13,8 @@ import re
 import sys
 from pathlib import Path
 
+from repo_files import files_with_suffix, read_text
+
 ROOT = Path(__file__).resolve().parent.parent
 
 HUB_START = "<!-- modality-hub-start -->"
@@ -24,7 +26,7 @@ LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
 
 def check_file(file_path: Path) -> list[str]:
     """Check all links in the modality hub block of a file."""
-    content = file_path.read_text(encoding="utf-8")
+    content = read_text(file_path)
     errors: list[str] = []
 
     start_idx = content.find(HUB_START)
@@ -65,14 +67,14 @@ def main() -> int:
     files_checked = 0
     hubs_found = 0
 
-    for md_file in sorted(ROOT.rglob("*.md")):
+    for md_file in files_with_suffix(".md"):
         # Skip hidden dirs, venv, node_modules
         rel_str = str(md_file.relative_to(ROOT))
         if any(skip in rel_str for skip in [".venv", "node_modules", "__pycache__", ".git"]):
             continue
 
         files_checked += 1
-        content = md_file.read_text(encoding="utf-8")
+        content = read_text(md_file)
         if HUB_START in content:
             hubs_found += 1
             errors = check_file(md_file)
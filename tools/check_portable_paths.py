@@ -12,6 +12,8 @@ import re
 import sys
 from pathlib import Path
 
+from repo_files import files_with_suffix, read_text
+
 ROOT_DIR = Path(__file__).parent.parent
 
 # Match /Users/ (macOS/Linux) or X:\Users\ (Windows)
@@ -21,13 +23,13 @@ PATH_PATTERN = re.compile(r"/Users/|[A-Za-z]:\\Users\\")
 def check_portable_paths() -> bool:
     found = False
 
-    for md_file in sorted(ROOT_DIR.rglob("*.md")):
+    for md_file in files_with_suffix(".md"):
         # Skip PythonBootcamp directory
         if "PythonBootcamp" in str(md_file):
             continue
 
         try:
-            content = md_file.read_text(encoding="utf-8", errors="replace")
+            content = read_text(md_file)
         except Exception:
             continue
 
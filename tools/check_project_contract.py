@@ -13,6 +13,8 @@ import re
 import sys
 from pathlib import Path
 
+from repo_files import read_text
+
 ROOT_DIR = Path(__file__).parent.parent
 PROJECTS_DIR = ROOT_DIR / "projects"
 
@@ -64,7 +66,7 @@ def check_project_readmes() -> bool:
                 continue
 
             count += 1
-            content = readme.read_text(encoding="utf-8", errors="replace")
+            content = read_text(readme)
             lines = content.splitlines()
 
             # Check home link on line 2
@@ -12,6 +12,8 @@ import re
 import sys
 from pathlib import Path
 
+from repo_files import read_text
+
 ROOT_DIR = Path(__file__).parent.parent
 
 
@@ -38,7 +40,7 @@ def check() -> bool:
     project_count = len(project_files)
 
     for pf in project_files:
-        text = pf.read_text(encoding="utf-8", errors="replace")
+        text = read_text(pf)
         rel = pf.relative_to(ROOT_DIR).as_posix()
 
         first = first_non_empty_line(text)
@@ -62,7 +64,7 @@ def check() -> bool:
     test_count = len(test_files)
 
     for tf in test_files:
-        text = tf.read_text(encoding="utf-8", errors="replace")
+        text = read_text(tf)
         rel = tf.relative_to(ROOT_DIR).as_posix()
 
         first = first_non_empty_line(text)
@@ -13,6 +13,8 @@ import re
 import sys
 from pathlib import Path
 
+from repo_files import files_with_suffix, read_text
+
 ROOT_DIR = Path(__file__).parent.parent
 
 ROOT_FILES = [
@@ -188,7 +190,7 @@ def check() -> bool:
             fail = True
             continue
 
-        content = path.read_text(encoding="utf-8", errors="replace")
+        content = read_text(path)
         lines = content.splitlines()
 
         # Home link check (skip README)
@@ -242,7 +244,7 @@ def check() -> bool:
             fail = True
             continue
 
-        content = path.read_text(encoding="utf-8", errors="replace")
+        content = read_text(path)
         lines = content.splitlines()
 
         home_line = get_second_non_blank_line(lines)
@@ -278,13 +280,13 @@ def check() -> bool:
                 fail = True
 
     # Stale reference check
-    for md_file in ROOT_DIR.rglob("*.md"):
+    for md_file in files_with_suffix(".md"):
         if "_archive" in str(md_file):
             continue
         if "PythonBootcamp" in str(md_file):
             continue
         try:
-            text = md_file.read_text(encoding="utf-8", errors="replace")
+            text = read_text(md_file)
         except Exception:
             continue
         if "00_README.md" in text:
@@ -0,0 +1,119 @@
+"""
+Compiled Flashcard Deck Cache
+
+Parses every practice/flashcards/*-cards.json deck once and stores the
+result in a single JSON file at data/flashcard_decks.json, together with
+precomputed card IDs and a level index. Both flashcard runners load the
+cache with one read instead of parsing dozens of JSON files at start-up.
+
+Each deck is recorded with its file size and mtime. When a deck changes,
+is added, or is removed, only that deck is re-parsed and the cache is
+rewritten.
+
+Usage:
+    python tools/deck_cache.py            # (re)build the cache and report
+    python tools/deck_cache.py --rebuild  # ignore the existing cache
+
+No external dependencies — uses only Python standard library.
+"""
+
+import contextlib
+import json
+import os
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parent.parent
+FLASHCARD_DIR = REPO_ROOT / "practice" / "flashcards"
+# JSON, not pickle: the cache sits in the working tree, and unpickling a
+# file someone dropped there would run arbitrary code.
+CACHE_FILE = REPO_ROOT / "data" / "flashcard_decks.json"
+
+# Bump when the cache layout changes so stale files are rebuilt.
+CACHE_VERSION = 2
+
+
+def _deck_level(stem: str) -> str | None:
+    """Return the level string for "level-<N>-cards" decks, else None."""
+    if stem.startswith("level-") and stem.endswith("-cards"):
+        return stem[len("level-"):-len("-cards")]
+    return None
+
+
+def _read_cache(cache_file: Path) -> dict | None:
+    try:
+        with open(cache_file, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cache, dict) or cache.get("version") != CACHE_VERSION:
+        return None
+    if not all(isinstance(cache.get(key), dict) for key in ("stamps", "decks", "card_ids", "levels")):
+        return None
+    return cache
+
+
+def _write_cache(cache_file: Path, cache: dict) -> None:
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp = cache_file.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(cache, f, separators=(",", ":"))
+    os.replace(tmp, cache_file)
+
+
+def load_compiled_decks(
+    flashcard_dir: Path = FLASHCARD_DIR,
+    cache_file: Path = CACHE_FILE,
+    rebuild: bool = False,
+) -> dict:
+    """Return the compiled decks, refreshing the cache if any deck changed.
+
+    Returns a dict with keys:
+        decks: {stem: deck_dict} in filename order (e.g. "level-0-cards")
+        card_ids: {stem: [card_id, ...]}
+        levels: {level_str: stem} for level-<N>-cards decks
+    Decks that fail to parse are skipped, as the runners always did.
+    """
+    stamps = {}
+    for path in sorted(flashcard_dir.glob("*-cards.json")):
+        st = path.stat()
+        stamps[path.stem] = [st.st_size, st.st_mtime_ns]  # list: JSON round-trips it
+
+    cache = None if rebuild else _read_cache(cache_file)
+    if cache is not None and cache["stamps"] == stamps:
+        return cache
+
+    old_stamps = cache["stamps"] if cache else {}
+    old_decks = cache["decks"] if cache else {}
+    decks = {}
+    for stem, stamp in stamps.items():
+        if old_stamps.get(stem) == stamp and stem in old_decks:
+            decks[stem] = old_decks[stem]
+            continue
+        try:
+            with open(flashcard_dir / f"{stem}.json", encoding="utf-8") as f:
+                decks[stem] = json.load(f)
+        except (json.JSONDecodeError, OSError, UnicodeDecodeError):
+            continue
+
+    cache = {
+        "version": CACHE_VERSION,
+        "stamps": stamps,
+        "decks": decks,
+        "card_ids": {stem: [card["id"] for card in deck.get("cards", [])] for stem, deck in decks.items()},
+        "levels": {_deck_level(stem): stem for stem in decks if _deck_level(stem) is not None},
+    }
+    # A read-only checkout still works, just without the speed-up.
+    with contextlib.suppress(OSError):
+        _write_cache(cache_file, cache)
+    return cache
+
+
+def main() -> None:
+    compiled = load_compiled_decks(rebuild="--rebuild" in sys.argv[1:])
+    total = sum(len(ids) for ids in compiled["card_ids"].values())
+    print(f"Compiled {len(compiled['decks'])} decks ({total} cards) into {CACHE_FILE.relative_to(REPO_ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,17 +10,32 @@ Usage:
     python tools/grade.py --level 0 --summary
     python tools/grade.py --modules
     python tools/grade.py --all
+    python tools/grade.py --all --jobs 4
+    python tools/grade.py --all --no-cache
+
+Projects are graded in parallel across a process pool (one worker per CPU
+by default). Results are cached in data/grade_cache.json, keyed on a hash of
+each project's Python files and tests, so unchanged projects are not re-run.
 
 No external dependencies beyond pytest (already in the project).
 """
 
+import hashlib
 import json
+import os
 import subprocess
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from xml.etree import ElementTree
 
 REPO_ROOT = Path(__file__).parent.parent
 CONFIG_FILE = Path(__file__).parent / "grading_config.json"
+CACHE_FILE = REPO_ROOT / "data" / "grade_cache.json"
+
+# Only settled outcomes are cached; timeouts and runner errors are retried.
+CACHEABLE_STATUSES = {"passed", "failed", "no_tests"}
 
 # ANSI colors for terminal output
 GREEN = "\033[92m"
@@ -86,29 +101,92 @@ def find_projects(path=None, level=None, modules_only=False, all_projects=False)
     return projects
 
 
+def read_junit_report(report_path):
+    """Read per-test outcomes from a pytest JUnit XML report.
+
+    Args:
+        report_path: Path to the XML file written by ``pytest --junitxml``.
+
+    Returns:
+        A list of dicts with {name, nodeid, status, message, duration}.
+        ``status`` is one of passed, failed, error, or skipped.
+    """
+    tests = []
+    root = ElementTree.parse(report_path).getroot()
+    for case in root.iter("testcase"):
+        classname = case.get("classname", "")
+        name = case.get("name", "unknown")
+        status, message = "passed", ""
+        for tag in ("failure", "error", "skipped"):
+            node = case.find(tag)
+            if node is not None:
+                status = {"failure": "failed"}.get(tag, tag)
+                message = node.get("message") or (node.text or "").strip()
+                break
+        tests.append({
+            "name": name,
+            "nodeid": f"{classname}::{name}" if classname else name,
+            "status": status,
+            "message": message.splitlines()[0] if message else "",
+            "duration": float(case.get("time") or 0.0),
+        })
+    return tests
+
+
+def run_pytest(project_dir, tb="short"):
+    """Run pytest on a project's tests and collect structured results.
+
+    pytest writes a JUnit XML report to a temporary file, which is read back
+    with ``read_junit_report()`` instead of scraping the console output.
+
+    Returns:
+        A tuple of (completed_process, tests). ``tests`` is empty when the
+        report could not be produced (e.g. pytest crashed before writing it).
+    """
+    test_dir = Path(project_dir) / "tests"
+    with tempfile.TemporaryDirectory() as tmp:
+        report = Path(tmp) / "report.xml"
+        result = subprocess.run(
+            [sys.executable, "-m", "pytest", "-q", f"--tb={tb}", f"--junitxml={report}", str(test_dir)],
+            capture_output=True,
+            text=True,
+            cwd=str(project_dir),
+            timeout=30,
+        )
+        try:
+            tests = read_junit_report(report)
+        except (OSError, ElementTree.ParseError):
+            tests = []
+    return result, tests
+
+
+def count_outcomes(tests):
+    """Count passed, failed, and errored tests (skips are not counted)."""
+    counts = {"passed": 0, "failed": 0, "error": 0}
+    for test in tests:
+        if test["status"] in counts:
+            counts[test["status"]] += 1
+    return counts
+
+
 def run_tests(project_dir):
     """Run pytest on a project and capture results."""
     test_dir = project_dir / "tests"
     if not test_dir.exists():
-        return {"status": "no_tests", "output": "", "passed": 0, "failed": 0, "errors": 0}
+        return {"status": "no_tests", "output": "", "passed": 0, "failed": 0, "errors": 0, "tests": []}
 
     test_files = list(test_dir.glob("test_*.py"))
     if not test_files:
-        return {"status": "no_tests", "output": "", "passed": 0, "failed": 0, "errors": 0}
+        return {"status": "no_tests", "output": "", "passed": 0, "failed": 0, "errors": 0, "tests": []}
 
     try:
-        result = subprocess.run(
-            [sys.executable, "-m", "pytest", "-v", "--tb=short", str(test_dir)],
-            capture_output=True,
-            text=True,
-            cwd=str(project_dir),
-            timeout=30,
-        )
+        result, tests = run_pytest(project_dir, tb="short")
 
         output = result.stdout + result.stderr
-        passed = output.count(" PASSED")
-        failed = output.count(" FAILED")
-        errors = output.count(" ERROR")
+        counts = count_outcomes(tests)
+        passed = counts["passed"]
+        failed = counts["failed"]
+        errors = counts["error"]
 
         if result.returncode == 0:
             status = "passed"
@@ -124,11 +202,127 @@ def run_tests(project_dir):
             "failed": failed,
             "errors": errors,
             "returncode": result.returncode,
+            "tests": tests,
         }
     except subprocess.TimeoutExpired:
-        return {"status": "timeout", "output": "Test timed out after 30 seconds", "passed": 0, "failed": 0, "errors": 0}
+        return {"status": "timeout", "output": "Test timed out after 30 seconds", "passed": 0, "failed": 0, "errors": 0, "tests": []}
     except FileNotFoundError:
-        return {"status": "error", "output": "pytest not found. Install with: pip install pytest", "passed": 0, "failed": 0, "errors": 0}
+        return {"status": "error", "output": "pytest not found. Install with: pip install pytest", "passed": 0, "failed": 0, "errors": 0, "tests": []}
+
+
+def project_fingerprint(project_dir):
+    """Hash a project's Python sources and test files into a cache key.
+
+    Covers every ``*.py`` file in the project plus everything under
+    ``tests/``, so editing code, tests, or fixtures invalidates the entry.
+    The interpreter path is mixed in because results depend on it.
+    """
+    project_dir = Path(project_dir)
+    files = set(project_dir.rglob("*.py"))
+    test_dir = project_dir / "tests"
+    if test_dir.exists():
+        files.update(p for p in test_dir.rglob("*") if p.is_file())
+
+    digest = hashlib.sha256(sys.executable.encode())
+    for file in sorted(files):
+        if "__pycache__" in file.parts or ".pytest_cache" in file.parts:
+            continue
+        digest.update(file.relative_to(project_dir).as_posix().encode())
+        digest.update(b"\0")
+        digest.update(file.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def load_cache():
+    """Load cached grading results from data/grade_cache.json."""
+    if CACHE_FILE.exists():
+        try:
+            with open(CACHE_FILE) as f:
+                return json.load(f)
+        except (json.JSONDecodeError, OSError):
+            pass
+    return {}
+
+
+def save_cache(cache):
+    """Write cached grading results to data/grade_cache.json."""
+    CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(CACHE_FILE, "w") as f:
+        json.dump(cache, f, indent=2)
+
+
+def _cache_key(project_dir):
+    """Return the repo-relative, forward-slash path used as a cache key."""
+    try:
+        return str(project_dir.resolve().relative_to(REPO_ROOT.resolve())).replace("\\", "/")
+    except ValueError:
+        return str(project_dir.resolve())
+
+
+def _grade_one(project_dir):
+    """Worker entry point: fingerprint and test a single project."""
+    return project_fingerprint(project_dir), run_tests(project_dir)
+
+
+def _cacheable(result):
+    """Strip a result down to what is worth keeping on disk.
+
+    The raw pytest output can run to many kilobytes per project and is
+    never shown for cached results; only the parsed counts are kept, plus
+    the failing tests that --verbose lists.
+    """
+    keep = ("status", "passed", "failed", "errors", "returncode")
+    entry = {key: result[key] for key in keep if key in result}
+    entry["tests"] = [t for t in result.get("tests", []) if t["status"] in ("failed", "error")]
+    return entry
+
+
+def grade_projects(projects, jobs=None, use_cache=True):
+    """Grade many projects in parallel, reusing cached results when possible.
+
+    Args:
+        projects: List of project directory paths.
+        jobs: Worker process count (defaults to the number of CPUs).
+        use_cache: Reuse results for projects whose files are unchanged.
+
+    Yields:
+        (project_dir, result) pairs in the same order as ``projects``.
+        Cached results carry ``"cached": True``.
+    """
+    cache = load_cache() if use_cache else {}
+    keys = {proj: _cache_key(proj) for proj in projects}
+
+    pending = []
+    hits = {}
+    for proj in projects:
+        entry = cache.get(keys[proj])
+        if entry and entry.get("hash") == project_fingerprint(proj):
+            hits[proj] = dict(entry["result"], cached=True)
+        else:
+            pending.append(proj)
+
+    jobs = max(1, jobs or os.cpu_count() or 1)
+    executor = None
+    if jobs > 1 and len(pending) > 1:
+        executor = ProcessPoolExecutor(max_workers=min(jobs, len(pending)))
+    try:
+        # map() yields in submission order, which matches the order of projects.
+        outcomes = executor.map(_grade_one, pending) if executor else map(_grade_one, pending)
+        for proj in projects:
+            if proj in hits:
+                yield proj, hits[proj]
+                continue
+            digest, result = next(outcomes)
+            if result["status"] in CACHEABLE_STATUSES:
+                cache[keys[proj]] = {"hash": digest, "result": _cacheable(result)}
+            yield proj, result
+    finally:
+        if executor:
+            executor.shutdown(cancel_futures=True)
+
+    if use_cache and pending:
+        save_cache(cache)
 
 
 def get_concept_hints(project_dir, config):
@@ -154,7 +348,8 @@ def print_project_result(project_dir, result, config, verbose=False):
 
     if result["status"] == "passed":
         pct = 100
-        print(f"  {GREEN}+{RESET} {parent}/{name} — {GREEN}{result['passed']}/{total} passed ({pct}%){RESET}")
+        cached = f" {CYAN}(cached){RESET}" if result.get("cached") else ""
+        print(f"  {GREEN}+{RESET} {parent}/{name} — {GREEN}{result['passed']}/{total} passed ({pct}%){RESET}{cached}")
     elif result["status"] == "timeout":
         print(f"  {RED}!{RESET} {parent}/{name} — {RED}timed out{RESET}")
     else:
@@ -163,10 +358,11 @@ def print_project_result(project_dir, result, config, verbose=False):
 
         if verbose and result["failed"] > 0:
             # Show failure details
-            lines = result["output"].split("\n")
-            for line in lines:
-                if "FAILED" in line or "AssertionError" in line or "Error" in line:
-                    print(f"      {RED}{line.strip()}{RESET}")
+            for test in result.get("tests", []):
+                if test["status"] in ("failed", "error"):
+                    print(f"      {RED}{test['status'].upper()} {test['nodeid']}{RESET}")
+                    if test["message"]:
+                        print(f"        {RED}{test['message']}{RESET}")
 
             # Show concept hints
             hints = get_concept_hints(project_dir, config)
@@ -212,7 +408,7 @@ def print_summary(results):
 def grade_with_detail(project_dir):
     """Run pytest and return detailed per-test results with partial credit.
 
-    Runs pytest with JSON output to capture individual test outcomes.
+    Reads pytest's JUnit XML report to capture individual test outcomes.
     Reports "X/Y tests passing" with test names and descriptions of
     what each failing test expected.
 
@@ -224,7 +420,7 @@ def grade_with_detail(project_dir):
             score: float percentage (0-100)
             passed: int count of passing tests
             total: int count of total tests
-            tests: list of dicts with {name, status, message}
+            tests: list of dicts with {name, nodeid, status, message, duration}
     """
     test_dir = Path(project_dir) / "tests"
     if not test_dir.exists():
@@ -235,48 +431,15 @@ def grade_with_detail(project_dir):
         return {"score": 0.0, "passed": 0, "total": 0, "tests": []}
 
     try:
-        result = subprocess.run(
-            [sys.executable, "-m", "pytest", "-v", "--tb=line", str(test_dir)],
-            capture_output=True,
-            text=True,
-            cwd=str(project_dir),
-            timeout=30,
-        )
+        _, results = run_pytest(project_dir, tb="line")
     except subprocess.TimeoutExpired:
         return {"score": 0.0, "passed": 0, "total": 0, "tests": [{"name": "ALL", "status": "timeout", "message": "Tests timed out after 30 seconds"}]}
     except FileNotFoundError:
         return {"score": 0.0, "passed": 0, "total": 0, "tests": [{"name": "ALL", "status": "error", "message": "pytest not found"}]}
 
-    output = result.stdout + result.stderr
-    tests = []
-    passed_count = 0
-    total_count = 0
-
-    for line in output.split("\n"):
-        if " PASSED" in line or " FAILED" in line or " ERROR" in line:
-            total_count += 1
-            # Extract test name: "tests/test_foo.py::test_bar PASSED"
-            parts = line.strip().split(" ")
-            test_path = parts[0] if parts else "unknown"
-            test_name = test_path.split("::")[-1] if "::" in test_path else test_path
-
-            if " PASSED" in line:
-                passed_count += 1
-                tests.append({"name": test_name, "status": "passed", "message": ""})
-            elif " FAILED" in line:
-                tests.append({"name": test_name, "status": "failed", "message": ""})
-            elif " ERROR" in line:
-                tests.append({"name": test_name, "status": "error", "message": ""})
-
-    # Extract failure details from tb=line output
-    for line in output.split("\n"):
-        line = line.strip()
-        if line.startswith("FAILED") or ("assert" in line.lower() and "Error" not in line):
-            # Match failure messages to tests
-            for test in tests:
-                if test["status"] == "failed" and not test["message"]:
-                    test["message"] = line
-                    break
+    tests = [test for test in results if test["status"] != "skipped"]
+    passed_count = sum(1 for test in tests if test["status"] == "passed")
+    total_count = len(tests)
 
     score = (passed_count / total_count * 100) if total_count > 0 else 0.0
 
@@ -284,7 +447,7 @@ def grade_with_detail(project_dir):
     print(f"\n  {BOLD}Detailed Grade: {passed_count}/{total_count} tests passing ({score:.0f}%){RESET}")
     for test in tests:
         if test["status"] == "passed":
-            print(f"    {GREEN}PASS{RESET} {test['name']}")
+            print(f"    {GREEN}PASS{RESET} {test['name']} {CYAN}({test['duration']:.2f}s){RESET}")
         elif test["status"] == "failed":
             print(f"    {RED}FAIL{RESET} {test['name']}")
             if test["message"]:
@@ -401,6 +564,14 @@ def main():
         "-v", "--verbose", action="store_true",
         help="show failure details and concept hints",
     )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=None,
+        help="number of projects to test in parallel (default: one per CPU)",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="re-run every project instead of reusing cached results",
+    )
     args = parser.parse_args()
 
     config = load_config()
@@ -427,8 +598,7 @@ def main():
     print(f"\n{BOLD}Grading {len(projects)} project(s)...{RESET}\n")
 
     results = {}
-    for proj in projects:
-        result = run_tests(proj)
+    for proj, result in grade_projects(projects, jobs=args.jobs, use_cache=not args.no_cache):
         results[str(proj)] = result
         if not args.summary:
             print_project_result(proj, result, config, verbose=args.verbose)
@@ -12,16 +12,25 @@ Usage:
     python tools/progress.py --history          # show progress over time
     python tools/progress.py --level 3          # filter to a specific level
     python tools/progress.py --export csv       # export progress as CSV
+    python tools/progress.py --rescan           # ignore the status index
+    python tools/progress.py --jobs 8           # check 8 projects at a time
+
+Project statuses are cached in data/progress_index.json. Each entry records
+the size, mtime, and content hash of the project's code, tests, and notes, so
+a scan only re-runs pytest for projects that actually changed. With --jobs,
+those re-checks run concurrently on a thread pool, each bounded by --timeout.
 
 No external dependencies — uses only Python standard library.
 """
 
 import csv
+import hashlib
 import io
 import json
 import subprocess
 import sys
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -29,6 +38,7 @@ REPO_ROOT = Path(__file__).parent.parent
 PROJECTS_DIR = REPO_ROOT / "projects"
 DATA_DIR = REPO_ROOT / "data"
 PROGRESS_JSON = DATA_DIR / "progress.json"
+STATUS_INDEX_JSON = DATA_DIR / "progress_index.json"
 
 GREEN = "\033[92m"
 RED = "\033[91m"
@@ -39,8 +49,15 @@ DIM = "\033[2m"
 RESET = "\033[0m"
 
 
-def check_project_status(project_dir):
-    """Check the completion status of a single project."""
+DEFAULT_TEST_TIMEOUT = 30
+
+
+def check_project_status(project_dir, timeout=DEFAULT_TEST_TIMEOUT):
+    """Check the completion status of a single project.
+
+    ``timeout`` bounds the pytest run in seconds. If it expires, the status
+    is returned with ``timed_out`` set so callers can avoid caching it.
+    """
     status = {
         "exists": project_dir.exists(),
         "has_code": False,
@@ -50,6 +67,7 @@ def check_project_status(project_dir):
         "test_total_count": 0,
         "has_notes": False,
         "has_alterations": False,
+        "timed_out": False,
     }
 
     if not status["exists"]:
@@ -76,7 +94,7 @@ def check_project_status(project_dir):
         try:
             result = subprocess.run(
                 [sys.executable, "-m", "pytest", str(test_dir), "-v", "--tb=no", "-q"],
-                capture_output=True, text=True, timeout=30,
+                capture_output=True, text=True, timeout=timeout,
                 cwd=str(project_dir),
             )
             # Parse pytest output for pass/fail counts
@@ -91,12 +109,209 @@ def check_project_status(project_dir):
                     status["test_pass_count"] = p
                     status["test_total_count"] = p + f
                     status["tests_pass"] = f == 0 and p > 0
-        except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        except subprocess.TimeoutExpired:
+            status["timed_out"] = True
+        except (FileNotFoundError, OSError):
             pass
 
     return status
 
 
+def tracked_files(project_dir):
+    """List the files whose changes can affect a project's status."""
+    files = [f for f in project_dir.rglob("*.py") if "__pycache__" not in f.parts]
+    test_dir = project_dir / "tests"
+    if test_dir.exists():
+        files.extend(f for f in test_dir.rglob("*") if f.is_file() and f.suffix != ".py"
+                     and "__pycache__" not in f.parts and ".pytest_cache" not in f.parts)
+    notes = project_dir / "notes.md"
+    if notes.exists():
+        files.append(notes)
+    return sorted(set(files))
+
+
+class ProjectStatusIndex:
+    """Persistent cache of check_project_status() results.
+
+    Entries are keyed by repo-relative project path. A cached status is
+    reused when the project's file stats (path, size, mtime) are unchanged.
+    If the stats differ but the content hash still matches (e.g. after a
+    fresh checkout touched every mtime), the status is reused and the stats
+    are refreshed. Otherwise the project is re-checked.
+
+    With ``refresh=True`` every lookup misses, so all projects are
+    re-checked and their entries rewritten. ``jobs`` sets how many projects
+    prefetch() checks concurrently, and ``timeout`` is each one's budget.
+    """
+
+    def __init__(self, path=STATUS_INDEX_JSON, refresh=False, jobs=1,
+                 timeout=DEFAULT_TEST_TIMEOUT):
+        self.path = path
+        self.refresh = refresh
+        self.jobs = max(1, jobs)
+        self.timeout = timeout
+        self.entries = {}
+        self.checked = {}
+        self.dirty = False
+        if path.exists():
+            try:
+                with open(path, encoding="utf-8") as f:
+                    self.entries = json.load(f).get("projects", {})
+            except (json.JSONDecodeError, OSError, AttributeError):
+                self.entries = {}
+
+    @staticmethod
+    def _key(project_dir):
+        return project_dir.relative_to(REPO_ROOT).as_posix()
+
+    @staticmethod
+    def _stats(project_dir, files):
+        stats = []
+        for f in files:
+            st = f.stat()
+            stats.append([f.relative_to(project_dir).as_posix(), st.st_size, st.st_mtime_ns])
+        return stats
+
+    @staticmethod
+    def _digest(project_dir, files):
+        digest = hashlib.sha256()
+        for f in files:
+            digest.update(f.relative_to(project_dir).as_posix().encode())
+            digest.update(b"\0")
+            digest.update(f.read_bytes())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def lookup(self, project_dir):
+        """Return the cached status for a project, or None if it changed."""
+        if self.refresh or not project_dir.exists():
+            return None
+        entry = self.entries.get(self._key(project_dir))
+        if entry is None:
+            return None
+
+        files = tracked_files(project_dir)
+        stats = self._stats(project_dir, files)
+        if entry.get("stats") == stats:
+            return entry["status"]
+        if entry.get("hash") == self._digest(project_dir, files):
+            entry["stats"] = stats
+            self.dirty = True
+            return entry["status"]
+        return None
+
+    def store(self, project_dir, status):
+        """Record a freshly computed status for a project."""
+        if not project_dir.exists() or status.get("timed_out"):
+            return
+        files = tracked_files(project_dir)
+        self.entries[self._key(project_dir)] = {
+            "stats": self._stats(project_dir, files),
+            "hash": self._digest(project_dir, files),
+            "status": status,
+        }
+        self.dirty = True
+
+    def status(self, project_dir):
+        """Return a project's status, re-checking it only if it changed."""
+        if project_dir in self.checked:
+            return self.checked[project_dir]
+        status = self.lookup(project_dir)
+        if status is None:
+            status = check_project_status(project_dir, timeout=self.timeout)
+            self.store(project_dir, status)
+        self.checked[project_dir] = status
+        return status
+
+    def prefetch(self, projects, on_result=None):
+        """Check every stale project up front, ``jobs`` at a time.
+
+        Results are kept in memory for this run (and in the index), so later
+        status() calls in any order are instant. ``on_result(done, total,
+        project_dir)`` is called as each check finishes, in completion order.
+        """
+        stale = []
+        for proj in projects:
+            if proj in self.checked:
+                continue
+            cached = self.lookup(proj)
+            if cached is None:
+                stale.append(proj)
+            else:
+                self.checked[proj] = cached
+        if not stale:
+            return
+
+        if self.jobs == 1:
+            for done, proj in enumerate(stale, start=1):
+                self.status(proj)
+                if on_result:
+                    on_result(done, len(stale), proj)
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self.jobs, len(stale))) as pool:
+            futures = {pool.submit(check_project_status, p, self.timeout): p for p in stale}
+            for done, future in enumerate(as_completed(futures), start=1):
+                proj = futures[future]
+                status = future.result()
+                self.store(proj, status)
+                self.checked[proj] = status
+                if on_result:
+                    on_result(done, len(stale), proj)
+
+    def save(self):
+        """Write the index to disk if any entry changed."""
+        if not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"projects": self.entries}, f, indent=2, sort_keys=True)
+        self.dirty = False
+
+
+_status_index = None
+
+
+def get_status_index():
+    """Return the process-wide status index, loading it on first use."""
+    global _status_index
+    if _status_index is None:
+        _status_index = ProjectStatusIndex()
+    return _status_index
+
+
+def project_status(project_dir):
+    """Return a project's status via the persistent index."""
+    return get_status_index().status(project_dir)
+
+
+def report_check_progress(done, total, project_dir):
+    """Print a single, self-overwriting progress line to stderr."""
+    name = f"{project_dir.parent.name}/{project_dir.name}"
+    sys.stderr.write(f"\r  {DIM}Checked {done}/{total}: {name[:50]:50s}{RESET}")
+    if done == total:
+        sys.stderr.write("\r" + " " * 72 + "\r")
+    sys.stderr.flush()
+
+
+def prefetch_statuses(level_dirs):
+    """Check every project under the given level/module dirs up front.
+
+    Stale projects are re-checked concurrently (see ``--jobs``) while a
+    progress line streams to stderr; the views then read from memory.
+    """
+    projects = [p for _, d in level_dirs for p in get_project_subdirs(d)]
+    on_result = report_check_progress if sys.stderr.isatty() else None
+    get_status_index().prefetch(projects, on_result=on_result)
+
+
+def filter_level_dirs(level_dirs, level_filter):
+    """Keep only the level dirs matching ``level_filter`` (None keeps all)."""
+    if level_filter is None:
+        return level_dirs
+    return [(n, d) for n, d in level_dirs if extract_level_number(d) == level_filter]
+
+
 def get_level_dirs():
     """Get all level directories in order."""
     levels = []
@@ -209,6 +424,7 @@ def build_scan_data(level_filter=None):
     }
 
     all_dirs = get_level_dirs() + get_module_dirs()
+    prefetch_statuses(filter_level_dirs(all_dirs, level_filter))
 
     for name, level_dir in all_dirs:
         level_num = extract_level_number(level_dir)
@@ -219,7 +435,7 @@ def build_scan_data(level_filter=None):
 
         projects = get_project_subdirs(level_dir)
         for proj in projects:
-            status = check_project_status(proj)
+            status = project_status(proj)
             scan["projects"].append({
                 "name": proj.name,
                 "level": name,
@@ -276,6 +492,11 @@ def show_overview(level_filter=None):
     total_with_code = 0
     total_with_notes = 0
 
+    if level_filter is None:
+        prefetch_statuses(get_level_dirs() + get_module_dirs())
+    else:
+        prefetch_statuses(filter_level_dirs(get_level_dirs(), level_filter))
+
     # Levels
     if level_filter is None:
         print(f"  {BOLD}Main Curriculum{RESET}\n")
@@ -285,7 +506,7 @@ def show_overview(level_filter=None):
             continue
 
         projects = get_project_subdirs(level_dir)
-        with_code = sum(1 for p in projects if check_project_status(p)["has_code"])
+        with_code = sum(1 for p in projects if project_status(p)["has_code"])
         total_projects += len(projects)
         total_with_code += with_code
         print_progress_bar(with_code, len(projects), label=name)
@@ -295,7 +516,7 @@ def show_overview(level_filter=None):
         print(f"\n  {BOLD}Expansion Modules{RESET}\n")
         for name, mod_dir in get_module_dirs():
             projects = get_project_subdirs(mod_dir)
-            with_code = sum(1 for p in projects if check_project_status(p)["has_code"])
+            with_code = sum(1 for p in projects if project_status(p)["has_code"])
             total_projects += len(projects)
             total_with_code += with_code
             print_progress_bar(with_code, len(projects), label=name)
@@ -350,11 +571,12 @@ def show_detail(level_name):
 
     name, level_dir = target
     projects = get_project_subdirs(level_dir)
+    prefetch_statuses([target])
 
     print(f"\n{BOLD}{name}{RESET} — {level_dir.relative_to(REPO_ROOT)}\n")
 
     for proj in projects:
-        status = check_project_status(proj)
+        status = project_status(proj)
         indicators = []
 
         if status["has_code"]:
@@ -439,10 +661,13 @@ def show_next():
     """Recommend what to work on next."""
     print(f"\n{BOLD}Recommended Next Steps{RESET}\n")
 
-    # Find the first level with incomplete projects
+    # Find the first level with incomplete projects. Each level is prefetched
+    # on its own (honouring --jobs/--timeout) so the scan still stops at the
+    # first level that has work left.
     for name, level_dir in get_level_dirs():
+        prefetch_statuses([(name, level_dir)])
         projects = get_project_subdirs(level_dir)
-        incomplete = [p for p in projects if not check_project_status(p)["has_code"]]
+        incomplete = [p for p in projects if not project_status(p)["has_code"]]
         if incomplete:
             print(f"  {CYAN}Continue:{RESET} {name}")
             print(f"  Next project: {incomplete[0].name}")
@@ -467,8 +692,9 @@ def show_next():
 
     # Check modules
     for name, mod_dir in get_module_dirs():
+        prefetch_statuses([(name, mod_dir)])
         projects = get_project_subdirs(mod_dir)
-        incomplete = [p for p in projects if not check_project_status(p)["has_code"]]
+        incomplete = [p for p in projects if not project_status(p)["has_code"]]
         if incomplete:
             print(f"  {CYAN}Try a module:{RESET} {name}")
             print(f"  Next project: {incomplete[0].name}")
@@ -592,8 +818,30 @@ def main():
         choices=["csv"],
         help="export progress data (supported: csv)",
     )
+    parser.add_argument(
+        "--rescan", action="store_true",
+        help="ignore cached statuses in data/progress_index.json and re-check every project",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1, metavar="N",
+        help="check up to N projects concurrently (default: 1)",
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=DEFAULT_TEST_TIMEOUT, metavar="SECONDS",
+        help=f"per-project pytest time budget (default: {DEFAULT_TEST_TIMEOUT})",
+    )
     args = parser.parse_args()
 
+    global _status_index
+    _status_index = ProjectStatusIndex(refresh=args.rescan, jobs=args.jobs, timeout=args.timeout)
+    try:
+        run_command(args)
+    finally:
+        _status_index.save()
+
+
+def run_command(args):
+    """Dispatch to the view selected on the command line."""
     if args.history:
         show_history()
         return
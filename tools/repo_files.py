@@ -0,0 +1,79 @@
+"""
+Shared repository file index for the check_*.py validators.
+
+Walks the repository once, groups files by suffix, and caches each file's
+text the first time it is read. Every checker that imports this module in
+the same process (as run_all_checks.py does) shares one directory walk and
+one read per file instead of repeating its own rglob() and read_text().
+
+Usage (inside a checker):
+    from repo_files import files_with_suffix, read_text
+
+    for md_file in files_with_suffix(".md"):
+        content = read_text(md_file)
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent
+
+# Directories that never contain curriculum content.
+SKIP_DIRS = {".git", "__pycache__", ".pytest_cache", ".mypy_cache", ".ruff_cache", ".venv", "venv", "node_modules"}
+
+
+@cache
+def _index() -> dict[str, tuple[Path, ...]]:
+    """Walk the tree once and map each file suffix to its sorted paths."""
+    by_suffix: dict[str, list[Path]] = {}
+    for dirpath, dirnames, filenames in os.walk(ROOT_DIR):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+        base = Path(dirpath)
+        for name in filenames:
+            suffix = os.path.splitext(name)[1]
+            by_suffix.setdefault(suffix, []).append(base / name)
+    return {suffix: tuple(sorted(paths)) for suffix, paths in by_suffix.items()}
+
+
+def files_with_suffix(suffix: str) -> tuple[Path, ...]:
+    """Return every repository file ending in ``suffix`` (e.g. ".md"), sorted."""
+    return _index().get(suffix, ())
+
+
+@cache
+def all_files() -> frozenset[str]:
+    """Return every indexed file as a normalized absolute path string.
+
+    Membership tests against this set replace per-link ``Path.exists()``
+    calls; build link targets with ``os.path.normpath`` to match. The test
+    is case-sensitive, so callers should confirm a miss with exists() on
+    case-insensitive filesystems (macOS, Windows).
+    """
+    return frozenset(os.path.normpath(p) for paths in _index().values() for p in paths)
+
+
+@cache
+def read_text(path: Path) -> str:
+    """Read a file once as UTF-8 (undecodable bytes replaced) and cache it."""
+    return path.read_text(encoding="utf-8", errors="replace")
+
+
+def preload(suffixes: tuple[str, ...] = (".md", ".py"), workers: int = 8) -> int:
+    """Read every file with the given suffixes into the cache in parallel.
+
+    Returns the number of files loaded. Unreadable files are skipped; the
+    checkers report them individually if they matter.
+    """
+    paths = [p for suffix in suffixes for p in files_with_suffix(suffix)]
+
+    def load(path: Path) -> bool:
+        try:
+            read_text(path)
+        except OSError:
+            return False
+        return True
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return sum(pool.map(load, paths))
@@ -4,6 +4,10 @@ Python CI check runner — runs all curriculum contract checks.
 Python replacement for run_all_curriculum_checks.sh. Works on Windows
 without bash or ripgrep.
 
+All checks run in one process and share the file index in repo_files.py:
+the tree is walked once and every markdown/Python file is read once (in
+parallel) up front, then each check works from the cached content.
+
 Usage:
     python tools/run_all_checks.py
     python tools/run_all_checks.py --verbose
@@ -14,6 +18,8 @@ import sys
 import time
 from pathlib import Path
 
+from repo_files import preload
+
 TOOLS_DIR = Path(__file__).parent
 
 CHECKS = [
@@ -64,6 +70,11 @@ def main() -> None:
 
     print(f"\nRunning {total} curriculum checks...\n")
 
+    start = time.time()
+    loaded = preload()
+    if verbose:
+        print(f"Indexed and read {loaded} files ({time.time() - start:.1f}s)\n")
+
     for i, (name, script_name) in enumerate(CHECKS, 1):
         script_path = TOOLS_DIR / script_name
         if not script_path.exists():
@@ -4,7 +4,9 @@ Spaced Repetition Flashcard Engine — SM-2 Algorithm
 Implements the SuperMemo SM-2 algorithm for optimal review scheduling.
 Uses a 0-5 quality rating scale for more precise interval calculations
 than the simpler Leitner box system. Includes ANSI-colored output.
-Stores progress in data/flashcard_progress.json.
+Stores progress in data/flashcard_progress.json, together with a due-date
+index (card IDs sorted by next review time) so due lookups are binary
+searches instead of full scans.
 
 WHEN TO USE THIS:
     Prefer this runner for precise, research-backed review scheduling.
@@ -28,12 +30,15 @@ Usage:
 No external dependencies — uses only Python standard library.
 """
 
+import bisect
 import json
 import random
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from deck_cache import load_compiled_decks
+
 REPO_ROOT = Path(__file__).parent.parent
 FLASHCARD_DIR = REPO_ROOT / "practice" / "flashcards"
 DATA_DIR = REPO_ROOT / "data"
@@ -110,13 +115,78 @@ def sm2_update(card_state: dict, quality: int) -> dict:
     }
 
 
+# --- Due-Date Index ---
+#
+# state["due_index"] is a list of [next_review, card_id] pairs kept sorted.
+# ISO-8601 timestamps from datetime.isoformat() sort correctly as strings,
+# so "everything due by now" is the prefix before bisect(now). Cards with
+# no next_review use "" and therefore always sort first (always due).
+
+def build_due_index(state: dict) -> list[list[str]]:
+    """Build the sorted due-date index from every card's state."""
+    return sorted(
+        [card_state.get("next_review") or "", card_id]
+        for card_id, card_state in state.get("cards", {}).items()
+    )
+
+
+def ensure_due_index(state: dict) -> list[list[str]]:
+    """Return state's due index, rebuilding it if missing or out of sync."""
+    index = state.get("due_index")
+    if index is None or len(index) != len(state.get("cards", {})):
+        index = build_due_index(state)
+        state["due_index"] = index
+    return index
+
+
+def _due_position(index: list[list[str]], now: datetime | None = None) -> int:
+    """Return how many index entries are due at ``now``."""
+    now_str = (now or datetime.now()).isoformat()
+    # "\uffff" sorts after any card ID, so ties on the timestamp count as due.
+    return bisect.bisect_right(index, [now_str, "\uffff"])
+
+
+def due_card_ids(state: dict, now: datetime | None = None) -> list[str]:
+    """Return IDs of all reviewed cards that are due, soonest first."""
+    index = ensure_due_index(state)
+    return [card_id for _, card_id in index[:_due_position(index, now)]]
+
+
+def next_due_time(state: dict, now: datetime | None = None) -> datetime | None:
+    """Return when the next not-yet-due card becomes due, in O(log n)."""
+    index = ensure_due_index(state)
+    pos = _due_position(index, now)
+    if pos < len(index):
+        return datetime.fromisoformat(index[pos][0])
+    return None
+
+
+def schedule_card(state: dict, card_id: str, quality: int) -> dict:
+    """Apply sm2_update() to a card and move it within the due index."""
+    index = ensure_due_index(state)
+    old_state = state["cards"].get(card_id)
+    if old_state is not None:
+        entry = [old_state.get("next_review") or "", card_id]
+        pos = bisect.bisect_left(index, entry)
+        if pos < len(index) and index[pos] == entry:
+            del index[pos]
+
+    new_state = sm2_update(old_state or {}, quality)
+    state["cards"][card_id] = new_state
+    bisect.insort(index, [new_state["next_review"], card_id])
+    return new_state
+
+
 # --- State Management ---
 
 def load_progress() -> dict:
     if PROGRESS_FILE.exists():
         with open(PROGRESS_FILE) as f:
-            return json.load(f)
-    return {"cards": {}, "sessions": 0, "last_session": None}
+            state = json.load(f)
+    else:
+        state = {"cards": {}, "sessions": 0, "last_session": None}
+    ensure_due_index(state)
+    return state
 
 
 def save_progress(state: dict) -> None:
@@ -128,18 +198,14 @@ def save_progress(state: dict) -> None:
 # --- Card Loading ---
 
 def load_all_decks(level_filter: str | None = None) -> list[dict]:
+    """Load decks from the compiled deck cache (see deck_cache.py)."""
+    compiled = load_compiled_decks(FLASHCARD_DIR)
     decks = []
-    for path in sorted(FLASHCARD_DIR.glob("*-cards.json")):
-        if level_filter is not None:
-            # Filter by level or module name
-            stem = path.stem.replace("-cards", "")
-            if level_filter not in stem:
-                continue
-        try:
-            with open(path, encoding="utf-8") as f:
-                decks.append(json.load(f))
-        except (json.JSONDecodeError, OSError, UnicodeDecodeError):
+    for stem, deck in compiled["decks"].items():
+        # Filter by level or module name
+        if level_filter is not None and level_filter not in stem.replace("-cards", ""):
             continue
+        decks.append(deck)
     return decks
 
 
@@ -158,26 +224,20 @@ def get_all_cards(decks: list[dict]) -> list[tuple[dict, str]]:
 def get_due_cards(
     all_cards: list[tuple[dict, str]], state: dict
 ) -> tuple[list[tuple[dict, str]], list[tuple[dict, str]]]:
-    """Split cards into due-for-review and new (never seen)."""
-    now = datetime.now()
-    due = []
-    new = []
+    """Split cards into due-for-review and new (never seen).
 
+    Due cards come from a bisect on the due index, most overdue first, so
+    the review queue keeps the oldest cards when it is capped.
+    """
+    by_id: dict[str, list[tuple[dict, str]]] = {}
+    new = []
     for card, deck_name in all_cards:
-        card_id = card["id"]
-        card_state = state["cards"].get(card_id)
-
-        if card_state is None:
-            new.append((card, deck_name))
+        if card["id"] in state["cards"]:
+            by_id.setdefault(card["id"], []).append((card, deck_name))
         else:
-            next_review_str = card_state.get("next_review")
-            if next_review_str:
-                next_review = datetime.fromisoformat(next_review_str)
-                if now >= next_review:
-                    due.append((card, deck_name))
-            else:
-                due.append((card, deck_name))
+            new.append((card, deck_name))
 
+    due = [entry for card_id in due_card_ids(state) for entry in by_id.get(card_id, ())]
     return due, new
 
 
@@ -359,13 +419,7 @@ def run_review(level_filter: str | None = None, mode: str = "review") -> None:
             print(f"You have {len(new)} new cards available.")
             # Show next due time
             now = datetime.now()
-            next_due = None
-            for cs in state.get("cards", {}).values():
-                nr = cs.get("next_review")
-                if nr:
-                    dt = datetime.fromisoformat(nr)
-                    if dt > now and (next_due is None or dt < next_due):
-                        next_due = dt
+            next_due = next_due_time(state, now)
             if next_due:
                 diff = next_due - now
                 hours = diff.total_seconds() / 3600
@@ -404,10 +458,8 @@ def run_review(level_filter: str | None = None, mode: str = "review") -> None:
         else:
             print(f"  {RED}Needs review.{RESET} Rating: {quality}")
 
-        # Update SM-2 state
-        card_id = card["id"]
-        card_state = state["cards"].get(card_id, {})
-        state["cards"][card_id] = sm2_update(card_state, quality)
+        # Update SM-2 state and the due-date index
+        schedule_card(state, card["id"], quality)
 
     # Save session
     state["sessions"] = state.get("sessions", 0) + 1
@@ -428,8 +480,7 @@ def run_review(level_filter: str | None = None, mode: str = "review") -> None:
 def show_due_count(level_filter: str | None = None) -> None:
     state = load_progress()
     decks = load_all_decks(level_filter)
-    all_cards = get_all_cards(decks)
-    due, new = get_due_cards(all_cards, state)
+    due, new = get_due_cards(get_all_cards(decks), state)
     print(f"Due for review: {len(due)}")
     print(f"New cards: {len(new)}")
     print(f"Total available: {len(due) + len(new)}")